@@ -1,9 +1,10 @@
 import logging
 import os
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from itertools import batched, chain
 from pathlib import Path
-import base64
-import re
 import sys
+import threading
 
 import requests
 from logger import (
@@ -14,21 +15,87 @@ from logger import (
 from dotenv import load_dotenv
 from selenium import webdriver
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from modules.common.helper_function__temp_browser_profile_dir__path import (
-    helper_function__temp_browser_profile_dir__path,
+from selenium.webdriver.remote.webdriver import WebDriver
+from modules.carteira.ler_carteira import ler_cdas_carteira
+from modules.cra.cra_api_cache import CraApiCache
+from modules.cra.cra_api_client import CraApiClient, DtoCraConsultaTitulo
+from modules.cra.cra_api_client_async import CraApiClientAsync
+from modules.cra.cra_extrair_dados_titulo_protestado import (
+    cra_extrair_dados_titulo_protestado,
+    cra_extrair_ultima_ocorrencia,
 )
 from modules.cra.cra_verificar_se_existe_aba_autorizacao import cra_verificar_se_existe_aba_autorizacao
+from modules.cra.cra_verificar_se_existe_aba_autorizacao_http import (
+    cra_verificar_se_existe_aba_autorizacao_http,
+)
+from modules.cra.exception import (
+    ExceptionCraApiEndpointNaoEncontrado,
+    ExceptionCraApiFalhaAutenticacao,
+    ExceptionCraHttpSessaoNaoAutenticada,
+)
+from modules.common.analisar_html import DtoFormularioHtml
+from modules.common.DtoWebElementWrapperWithBetterRepr import (
+    ElementDiagnosticsMode,
+    configure_element_diagnostics,
+)
+from modules.gae.exception import ExceptionGaeHttpSessaoNaoAutenticada
 from modules.gae.gae_verificar_cda_liquidada_por_renavam import (
     gae_verificar_cda_liquidada_por_renavam,
 )
+from modules.gae.gae_verificar_cda_liquidada_por_renavam_http import (
+    gae_obter_formulario_debito_http,
+    gae_verificar_cda_liquidada_por_renavam_http,
+)
 from modules.webdriver.close_webdriver import close_webdriver
+from modules.webdriver.exportar_sessao_http import exportar_sessao_http
+from modules.webdriver.deadline import Deadline, cap_timeout
+from modules.webdriver.locator import log_locator_timings
+from modules.webdriver.step_sequence import (
+    StepSequenceMode,
+    configure_step_sequence_mode,
+)
+from modules.webdriver.wait_condition import WaitStrategy, configure_wait_strategy
+from modules.webdriver.webelement_action.input_mode import (
+    InputMode,
+    configure_input_mode,
+)
 
 from modules.gae.log_in import log_in as gae_log_in
 from modules.cra.log_in import log_in as cra_log_in
+from modules.webdriver.webdriver_config.firefox_profile_store import (
+    configure_profile_store,
+    log_profile_store_stats,
+    new_profile_dir,
+    recover_orphan_profiles,
+    release_profile,
+)
+from modules.webdriver.webdriver_config.firefox_profile_template import (
+    clone_firefox_profile,
+    ensure_firefox_profile_template,
+)
 from modules.webdriver.webdriver_config.set_default_firefox_options import (
+    FirefoxOptionsPreset,
+    PageLoadStrategy,
+    firefox_preferences,
     set_default_firefox_options,
 )
 from modules.common.save_screenshot import save_screenshot
+from modules.pipeline.executar_async_em_segundo_plano import (
+    executar_async_em_segundo_plano,
+)
+from modules.pipeline.pool_de_navegadores_aquecidos import (
+    PoolDeNavegadoresAquecidos,
+)
+from modules.pipeline.executar_em_pool_de_navegadores import (
+    executar_em_pool_de_navegadores,
+)
+from modules.pipeline.executar_em_segundo_plano import executar_em_segundo_plano
+from modules.varredura.estado_varredura import (
+    VEREDITO_AUTORIZADO,
+    VEREDITO_LIQUIDADO,
+    VEREDITO_NAO_LIQUIDADO,
+    EstadoVarredura,
+)
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -40,6 +107,13 @@ GAE_USERNAME = os.environ["GAE_USERNAME"]
 GAE_PASSWORD = os.environ["GAE_PASSWORD"]
 SEFAZ_SSO_LOGIN_PAGE_URL = os.environ["SEFAZ_SSO_LOGIN_PAGE_URL"]
 GAE_DEBITO_CONTA_CORRENTE_URL = os.environ["GAE_DEBITO_CONTA_CORRENTE_URL"]
+GAE_WEB_DRIVER_POOL_SIZE = int(os.environ.get("GAE_WEB_DRIVER_POOL_SIZE", "1"))
+GAE_WEB_DRIVER_WARM_POOL_SIZE = int(os.environ.get("GAE_WEB_DRIVER_WARM_POOL_SIZE", "0"))
+GAE_MODO_HTTP: bool = os.environ.get("GAE_MODO_HTTP", "false").lower() == "true"
+GAE_ITEM_BUDGET_SECONDS = int(os.environ.get("GAE_ITEM_BUDGET_SECONDS", "0"))
+GAE_REAPROVEITAR_FORMULARIO: bool = (
+    os.environ.get("GAE_REAPROVEITAR_FORMULARIO", "false").lower() == "true"
+)
 
 CRA_TIMEOUT_AUTH = int(os.environ["CRA_TIMEOUT_AUTH"])
 CRA_TIMEOUT_DEFAULT = int(os.environ["CRA_TIMEOUT_DEFAULT"])
@@ -47,19 +121,112 @@ CRA_USERNAME = os.environ["CRA_USERNAME"]
 CRA_PASSWORD = os.environ["CRA_PASSWORD"]
 CRA_LOGIN_PAGE_URL = os.environ["CRA_LOGIN_PAGE_URL"]
 
+CRA_WEB_DRIVER_POOL_SIZE = int(os.environ.get("CRA_WEB_DRIVER_POOL_SIZE", "1"))
+CRA_WEB_DRIVER_WARM_POOL_SIZE = int(os.environ.get("CRA_WEB_DRIVER_WARM_POOL_SIZE", "0"))
+CRA_CONSULTA_TITULO_URL = os.environ.get("CRA_CONSULTA_TITULO_URL", "")
+CRA_ITEM_BUDGET_SECONDS = int(os.environ.get("CRA_ITEM_BUDGET_SECONDS", "0"))
+CRA_REAPROVEITAR_TELA_CONSULTA: bool = (
+    os.environ.get("CRA_REAPROVEITAR_TELA_CONSULTA", "false").lower() == "true"
+)
+
 CRA_API_BASE_URL = os.environ["CRA_API_BASE_URL"]
 CRA_API_TITULO_ENDPOINT = os.environ["CRA_API_TITULO_ENDPOINT"]
+CRA_API_MAX_WORKERS = int(os.environ.get("CRA_API_MAX_WORKERS", "8"))
+CRA_API_ASYNC: bool = os.environ.get("CRA_API_ASYNC", "false").lower() == "true"
+CRA_API_MAX_IN_FLIGHT = int(os.environ.get("CRA_API_MAX_IN_FLIGHT", "100"))
+CRA_API_CACHE_PATH = os.environ.get("CRA_API_CACHE_PATH", "")
+CRA_API_CACHE_TTL_SECONDS = int(os.environ.get("CRA_API_CACHE_TTL_SECONDS", "86400"))
+
+CARTEIRA_PATH = os.environ.get("CARTEIRA_PATH", "")
+CARTEIRA_TAMANHO_LOTE = int(os.environ.get("CARTEIRA_TAMANHO_LOTE", "500"))
+
+PIPELINE_TAMANHO_FILA = int(os.environ.get("PIPELINE_TAMANHO_FILA", "100"))
+
+VARREDURA_ESTADO_PATH = os.environ.get("VARREDURA_ESTADO_PATH", "")
+VARREDURA_VEREDITO_TTL_SECONDS = int(
+    os.environ.get("VARREDURA_VEREDITO_TTL_SECONDS", "604800")
+)
 
 WEB_DRIVER_HEADLESS: bool = os.environ["WEB_DRIVER_HEADLESS"].lower() == "true"
+WEB_DRIVER_WAIT_STRATEGY = WaitStrategy(
+    os.environ.get("WEB_DRIVER_WAIT_STRATEGY", WaitStrategy.POLLING.value)
+)
+WEB_DRIVER_STEP_SEQUENCE_MODE = StepSequenceMode(
+    os.environ.get("WEB_DRIVER_STEP_SEQUENCE_MODE", StepSequenceMode.PER_STEP.value)
+)
+WEB_DRIVER_ELEMENT_DIAGNOSTICS = ElementDiagnosticsMode(
+    os.environ.get("WEB_DRIVER_ELEMENT_DIAGNOSTICS", ElementDiagnosticsMode.FULL.value)
+)
+WEB_DRIVER_ELEMENT_DIAGNOSTICS_MAX_LENGTH = int(
+    os.environ.get("WEB_DRIVER_ELEMENT_DIAGNOSTICS_MAX_LENGTH", "2000")
+)
+WEB_DRIVER_PROFILE_TEMPLATE_DIR = os.environ.get("WEB_DRIVER_PROFILE_TEMPLATE_DIR", "")
+WEB_DRIVER_PROFILE_BASE_DIR = os.environ.get("WEB_DRIVER_PROFILE_BASE_DIR", "")
+WEB_DRIVER_PROFILE_QUOTA_MB = int(os.environ.get("WEB_DRIVER_PROFILE_QUOTA_MB", "0"))
+WEB_DRIVER_OPTIONS_PRESET = FirefoxOptionsPreset(
+    os.environ.get("WEB_DRIVER_OPTIONS_PRESET", FirefoxOptionsPreset.DEFAULT.value)
+)
+WEB_DRIVER_BLOCKED_HOSTS = [
+    host for host in os.environ.get("WEB_DRIVER_BLOCKED_HOSTS", "").split(",") if host.strip()
+]
+WEB_DRIVER_PAGE_LOAD_STRATEGY = (
+    PageLoadStrategy(os.environ["WEB_DRIVER_PAGE_LOAD_STRATEGY"])
+    if os.environ.get("WEB_DRIVER_PAGE_LOAD_STRATEGY")
+    else None
+)
+WEB_DRIVER_WINDOW_SIZE = tuple(
+    int(dimensao)
+    for dimensao in os.environ.get("WEB_DRIVER_WINDOW_SIZE", "1920x1080").lower().split("x")
+)
+WEB_DRIVER_WARM_POOL_LOGIN: bool = (
+    os.environ.get("WEB_DRIVER_WARM_POOL_LOGIN", "true").lower() == "true"
+)
+WEB_DRIVER_WARM_POOL_MAX_IDLE_SECONDS = int(
+    os.environ.get("WEB_DRIVER_WARM_POOL_MAX_IDLE_SECONDS", "900")
+)
+WEB_DRIVER_INPUT_MODE = InputMode(
+    os.environ.get("WEB_DRIVER_INPUT_MODE", InputMode.KEYBOARD.value)
+)
+WEB_DRIVER_INPUT_VERIFY: bool = (
+    os.environ.get("WEB_DRIVER_INPUT_VERIFY", "false").lower() == "true"
+)
 
 OUTPUT_DIR = os.environ["OUTPUT_DIR"]
 output_dir = Path(os.path.join(OUTPUT_DIR, Path(__file__).stem))
 output_dir.mkdir(parents=True, exist_ok=True)
 output_dir__str = output_dir.as_posix()
 
+configure_wait_strategy(WEB_DRIVER_WAIT_STRATEGY)
+configure_step_sequence_mode(WEB_DRIVER_STEP_SEQUENCE_MODE)
+configure_element_diagnostics(
+    WEB_DRIVER_ELEMENT_DIAGNOSTICS, WEB_DRIVER_ELEMENT_DIAGNOSTICS_MAX_LENGTH
+)
+configure_input_mode(WEB_DRIVER_INPUT_MODE, WEB_DRIVER_INPUT_VERIFY)
+configure_profile_store(
+    base_dir=WEB_DRIVER_PROFILE_BASE_DIR or None,
+    quota_bytes=WEB_DRIVER_PROFILE_QUOTA_MB * 1024 * 1024,
+)
+
 FLUXO_CRA = "FLUXO CRA"
 FLUXO_GAE = "FLUXO GAE"
 
+estado_varredura: EstadoVarredura | None = None
+if VARREDURA_ESTADO_PATH:
+    estado_varredura = EstadoVarredura(
+        caminho=VARREDURA_ESTADO_PATH,
+        veredito_ttl_segundos=VARREDURA_VEREDITO_TTL_SECONDS,
+    )
+
+_sessoes_http_cra: dict[str, requests.Session] = {}
+# Navegadores em que a consulta HTTP falhou por formato de resposta: repetir
+# só dobraria o custo de cada CDA, então seguem apenas pelo navegador.
+_consulta_http_desativada_cra: set[str] = set()
+_sessoes_http_gae: dict[str, tuple[requests.Session, DtoFormularioHtml]] = {}
+_consulta_http_desativada_gae: set[str] = set()
+
+_pool_aquecido_cra: PoolDeNavegadoresAquecidos | None = None
+_pool_aquecido_gae: PoolDeNavegadoresAquecidos | None = None
+
 cdas = [
     "090835/25",
     "050641/22",
@@ -71,249 +238,504 @@ cdas = [
 ]
 
 
-def consulta_cra_descricao_ocorrencia_titulo():
+async def _consultar_titulos_cra_async(
+    cdas: Iterable[str], cra_api_cache: CraApiCache | None
+) -> AsyncIterator[DtoCraConsultaTitulo]:
+    async with CraApiClientAsync(
+        base_url=CRA_API_BASE_URL,
+        titulo_endpoint=CRA_API_TITULO_ENDPOINT,
+        username=CRA_USERNAME,
+        password=CRA_PASSWORD,
+        max_in_flight=CRA_API_MAX_IN_FLIGHT,
+        cache=cra_api_cache,
+    ) as cra_api_client:
+        async for consulta in cra_api_client.consultar_titulos(cdas):
+            yield consulta
+
+
+def _consultar_titulos_cra(cdas: Iterable[str]) -> Iterator[DtoCraConsultaTitulo]:
+    cra_api_cache = None
+    if CRA_API_CACHE_PATH:
+        cra_api_cache = CraApiCache(
+            caminho=CRA_API_CACHE_PATH,
+            ttl_segundos=CRA_API_CACHE_TTL_SECONDS,
+        )
+
+    try:
+        if CRA_API_ASYNC:
+            # Cada consulta segue para o pipeline assim que a resposta chega; a
+            # janela de `consultar_titulos` já limita o que fica em memória.
+            yield from executar_async_em_segundo_plano(
+                _consultar_titulos_cra_async(cdas, cra_api_cache),
+                tamanho_fila=PIPELINE_TAMANHO_FILA,
+                nome="cra-api-async",
+            )
+            return
+
+        with CraApiClient(
+            base_url=CRA_API_BASE_URL,
+            titulo_endpoint=CRA_API_TITULO_ENDPOINT,
+            username=CRA_USERNAME,
+            password=CRA_PASSWORD,
+            max_workers=CRA_API_MAX_WORKERS,
+            cache=cra_api_cache,
+        ) as cra_api_client:
+            for lote in batched(cdas, CARTEIRA_TAMANHO_LOTE):
+                yield from cra_api_client.consultar_titulos(lote)
+    finally:
+        if cra_api_cache is not None:
+            logger.info(f"Cache da API do CRA: {cra_api_cache.estatisticas}")
+            cra_api_cache.close()
+
+
+def _cdas_a_consultar() -> Iterable[str]:
+    if CARTEIRA_PATH:
+        return ler_cdas_carteira(CARTEIRA_PATH)
+    return cdas
+
+
+def consulta_cra_descricao_ocorrencia_titulo() -> Iterator[dict]:
     with log_context(color=Color.BLUE, prefix__list=[FLUXO_CRA]):
-        credenciais = f"{CRA_USERNAME}:{CRA_PASSWORD}"
-        credenciais_b64 = base64.b64encode(credenciais.encode("utf-8")).decode("utf-8")
-
-        headers = {
-            "Authorization": f"Basic {credenciais_b64}",
-            "Accept": "application/json",
-        }
-
-        url_completa = f"{CRA_API_BASE_URL}{CRA_API_TITULO_ENDPOINT}"
-
         cdas_protestadas_ou_protestadas_por_edital = []
 
-        for cda in cdas:
-            parametros = {"numeroTitulo": cda}
+        try:
+            for consulta in _consultar_titulos_cra(_cdas_a_consultar()):
+                if consulta.erro is not None:
+                    logger.error(
+                        f"Erro ao consultar título {consulta.cda}: {consulta.erro}"
+                    )
+                    continue
+
+                dados_titulo = cra_extrair_dados_titulo_protestado(
+                    consulta.response_json
+                )
+                if dados_titulo is not None:
+                    # O estado é chaveado pela CDA da carteira, que pode vir da
+                    # API em outro formato no `numeroTitulo`.
+                    dados_titulo['cda_consultada'] = consulta.cda
+
+                if estado_varredura is not None:
+                    estado_varredura.registrar_ocorrencia(
+                        consulta.cda,
+                        cra_extrair_ultima_ocorrencia(consulta.response_json),
+                    )
+                    if dados_titulo is not None and not (
+                        estado_varredura.precisa_reprocessar(consulta.cda)
+                    ):
+                        logger.debug(
+                            f"CDA {consulta.cda} sem alteração desde o último veredito. Ignorando."
+                        )
+                        continue
+
+                if dados_titulo is not None:
+                    cdas_protestadas_ou_protestadas_por_edital.append(dados_titulo)
+                    yield dados_titulo
 
-            logger.debug(f"Consultando título: {cda}...")
+        except ExceptionCraApiFalhaAutenticacao:
+            logger.debug("Falha na autenticação. Verifique usuário e senha da API.")
+            sys.exit("Encerrando por falha de autenticação.")
 
-            try:
-                response = requests.get(url_completa, headers=headers, params=parametros)
+        except ExceptionCraApiEndpointNaoEncontrado as e:
+            logger.debug(f"Endpoint não encontrado (404). URL: {e.url}")
+            sys.exit("Encerrando por falha de endpoint.")
 
-                response_json = response.json()
+        logger.debug(f"CDAs protestadas ou protestadas por edital: {cdas_protestadas_ou_protestadas_por_edital}")
 
-                if response.status_code == 200:
+def _criar_perfil_navegador() -> tuple[str, bool]:
+    if WEB_DRIVER_PROFILE_TEMPLATE_DIR:
+        ensure_firefox_profile_template(
+            template_dir=WEB_DRIVER_PROFILE_TEMPLATE_DIR,
+            headless=WEB_DRIVER_HEADLESS,
+            preferences=firefox_preferences(
+                WEB_DRIVER_OPTIONS_PRESET, WEB_DRIVER_BLOCKED_HOSTS
+            ),
+        )
+        perfil = clone_firefox_profile(template_dir=WEB_DRIVER_PROFILE_TEMPLATE_DIR)
+        return perfil, True
+
+    return new_profile_dir(), False
+
+
+def _iniciar_firefox() -> WebDriver:
+    temp_browser_profile_output_dir, preferencias_no_perfil = _criar_perfil_navegador()
+    try:
+        firefox_options = set_default_firefox_options(
+            headless=WEB_DRIVER_HEADLESS,
+            firefox_options=FirefoxOptions(),
+            browser_profile_output_dir=temp_browser_profile_output_dir,
+            preferences_in_profile=preferencias_no_perfil,
+            preset=WEB_DRIVER_OPTIONS_PRESET,
+            blocked_hosts=WEB_DRIVER_BLOCKED_HOSTS,
+            page_load_strategy=WEB_DRIVER_PAGE_LOAD_STRATEGY,
+            window_size=WEB_DRIVER_WINDOW_SIZE,
+        )
+        web_driver = webdriver.Firefox(options=firefox_options)
+    except Exception:
+        release_profile(temp_browser_profile_output_dir)
+        raise
+
+    # Lido por `close_webdriver` para apagar o perfil depois do `quit`.
+    web_driver._profile_dir = temp_browser_profile_output_dir
+    return web_driver
+
+
+def _autenticar_navegador_cra(web_driver: WebDriver) -> WebDriver:
+    try:
+        cra_log_in(
+            timeout=CRA_TIMEOUT_AUTH,
+            web_driver=web_driver,
+            login_url=CRA_LOGIN_PAGE_URL,
+            username=CRA_USERNAME,
+            password=CRA_PASSWORD,
+        )
+    except Exception as e:
+        with log_context(color=Color.YELLOW, prefix__list=[FLUXO_CRA]):
+            logger.exception(f"{e.__class__.__name__}: {e}")
+            save_screenshot(
+                web_driver=web_driver,
+                file_name=f"{threading.current_thread().name}_CRA_ERROR.png",
+                output_dir=output_dir__str,
+            )
+        close_webdriver(web_driver=web_driver)
+        raise
 
-                    titulos = response_json.get('_embedded', {}).get('titulo', [])
+    return web_driver
 
-                    if titulos:
-                        titulo_atual = titulos[0]
 
-                        lista_retornos = titulo_atual.get('retornos', [])
+def _iniciar_navegador_cra() -> WebDriver:
+    return _autenticar_navegador_cra(_iniciar_firefox())
 
-                        if lista_retornos:
-                            ultimo_retorno = lista_retornos[-1]
 
-                            descricao = ultimo_retorno.get('ocorrencia', {}).get('descricao')
+def _retirar_navegador_cra() -> WebDriver:
+    if _pool_aquecido_cra is None:
+        return _iniciar_navegador_cra()
+    web_driver = _pool_aquecido_cra.retirar()
+    if WEB_DRIVER_WARM_POOL_LOGIN:
+        return web_driver
+    return _autenticar_navegador_cra(web_driver)
 
-                            logger.debug(f"Última Ocorrência: {descricao}")
 
-                            if descricao in ["Protestado", "Protesto por edital"]:
-                                numero_titulo = titulo_atual.get('numeroTitulo')
-                                nosso_numero = titulo_atual.get('nossoNumero', '')
+def _novo_orcamento(budget_seconds: int) -> Deadline | None:
+    # 0 desliga o orçamento: cada passo espera o seu timeout inteiro.
+    return Deadline(budget_seconds) if budget_seconds > 0 else None
 
-                                renavam = "NAO_ENCONTRADO"
 
-                                match = re.search(r'RENA(\d+)', nosso_numero)
-                                if match:
-                                    renavam = match.group(1)
-                                else:
-                                    renavam = "".join(filter(str.isdigit, nosso_numero))
+def _verificar_aba_autorizacao_cra(web_driver: WebDriver, cda_numero: str) -> bool:
+    deadline = _novo_orcamento(CRA_ITEM_BUDGET_SECONDS)
 
-                                dados_titulo = {
-                                    'numero_titulo': numero_titulo,
-                                    'nosso_numero': renavam,
-                                }
+    if CRA_CONSULTA_TITULO_URL and web_driver.session_id not in _consulta_http_desativada_cra:
+        session = _sessoes_http_cra.get(web_driver.session_id)
+        if session is None:
+            session = exportar_sessao_http(web_driver)
+            _sessoes_http_cra[web_driver.session_id] = session
 
-                                cdas_protestadas_ou_protestadas_por_edital.append(dados_titulo)
-                        else:
-                            logger.debug("Lista de retornos vazia.")
+        try:
+            return cra_verificar_se_existe_aba_autorizacao_http(
+                session=session,
+                consulta_titulo_url=CRA_CONSULTA_TITULO_URL,
+                cda=cda_numero,
+                timeout=cap_timeout(CRA_TIMEOUT_DEFAULT, deadline),
+            )
+        except ExceptionCraHttpSessaoNaoAutenticada as e:
+            logger.warning(
+                f"Consulta HTTP da CDA {cda_numero} sem autenticação, usando o navegador: {e}"
+            )
+            # Os cookies podem ter sido renovados no navegador; exporta de novo na próxima CDA.
+            _sessoes_http_cra.pop(web_driver.session_id, None)
+            session.close()
+        except Exception as e:
+            logger.warning(
+                f"Consulta HTTP da CDA {cda_numero} falhou, usando só o navegador "
+                f"nesta sessão: {e.__class__.__name__}: {e}"
+            )
+            _sessoes_http_cra.pop(web_driver.session_id, None)
+            _consulta_http_desativada_cra.add(web_driver.session_id)
+            session.close()
+
+    return cra_verificar_se_existe_aba_autorizacao(
+        web_driver=web_driver,
+        cda=cda_numero,
+        timeout=CRA_TIMEOUT_DEFAULT,
+        reaproveitar_tela_consulta=CRA_REAPROVEITAR_TELA_CONSULTA,
+        deadline=deadline,
+    )
+
+
+def _verificar_cda_no_cra(
+    web_driver: WebDriver, cda: dict, nome_do_navegador: str
+) -> dict | None:
+    cda_numero = cda['numero_titulo']
+    cda_consultada = cda.get('cda_consultada', cda_numero)
+    with log_context(prefix__list=[FLUXO_CRA, nome_do_navegador, cda_numero]):
+        logger.debug(f"Iniciando verificação da CDA: {cda_numero}")
+        try:
+            aba_autorizacao = _verificar_aba_autorizacao_cra(web_driver, cda_numero)
 
-                    else:
-                        logger.debug("Nenhum título encontrado")
+            if aba_autorizacao and estado_varredura is not None:
+                estado_varredura.registrar_veredito(
+                    cda_consultada, VEREDITO_AUTORIZADO
+                )
 
-                elif response.status_code == 401:
-                    logger.debug("Falha na autenticação. Verifique usuário e senha da API.")
-                    sys.exit("Encerrando por falha de autenticação.")
+            if not aba_autorizacao:
+                logger.info(
+                    f"A CDA {cda_numero} ainda não está com autorização."
+                )
+                renavam = cda['nosso_numero']
 
-                elif response.status_code == 404:
-                    logger.debug(f"Endpoint não encontrado (404). URL: {url_completa}")
-                    sys.exit("Encerrando por falha de endpoint.")
+                dados_titulo = {
+                        'cda_numero': cda_numero,
+                        'renavam': renavam,
+                        'cda_consultada': cda_consultada,
+                }
 
-                else:
-                    logger.debug(f"Erro HTTP inesperado: {response.status_code}. Detalhes: {response.text}")
-                    raise Exception(f"Erro HTTP inesperado: {response.status_code}")
+                return dados_titulo
 
-            except Exception:
-                logger.error(f"Erro ao consultar título {cda}: {response}")
+        except Exception as e:
+            with log_context(color=Color.YELLOW, prefix__list=[FLUXO_CRA, nome_do_navegador]):
+                logger.error(f"FALHOU: 'CDA = {cda_numero}'")
+                logger.exception(f"{e.__class__.__name__}: {e}")
+                save_screenshot(
+                    web_driver=web_driver,
+                    file_name=f"{nome_do_navegador}_{cda_numero.replace('/', '-')}_CDA_CRA_ERROR.png",
+                    output_dir=output_dir__str,
+                )
 
-        logger.debug(f"CDAs protestadas ou protestadas por edital: {cdas_protestadas_ou_protestadas_por_edital}")
+    return None
 
-        verificar_se_existe_aba_autorizacao_cra(cdas_protestadas_ou_protestadas_por_edital)
 
-def verificar_se_existe_aba_autorizacao_cra(cdas_protestadas_ou_protestadas_por_edital: list):
+def verificar_se_existe_aba_autorizacao_cra(
+    cdas_protestadas_ou_protestadas_por_edital: Iterable[dict],
+) -> Iterator[dict]:
     with log_context(color=Color.BLUE, prefix__list=[FLUXO_CRA]):
-        web_driver = None
+        renavams_nao_autorizados = []
+        for dados_titulo in executar_em_pool_de_navegadores(
+            cdas_protestadas_ou_protestadas_por_edital,
+            quantidade_de_navegadores=CRA_WEB_DRIVER_POOL_SIZE,
+            iniciar_navegador=_retirar_navegador_cra,
+            processar_item=_verificar_cda_no_cra,
+            nome="cra-navegador",
+        ):
+            renavams_nao_autorizados.append(dados_titulo)
+            yield dados_titulo
+
+        logger.info(f"Renavams ainda não autorizados: {renavams_nao_autorizados}")
+
+def _autenticar_navegador_gae(web_driver: WebDriver) -> WebDriver:
+    try:
+        gae_log_in(
+            timeout=GAE_TIMEOUT_AUTH,
+            web_driver=web_driver,
+            login_url=SEFAZ_SSO_LOGIN_PAGE_URL,
+            username=GAE_USERNAME,
+            password=GAE_PASSWORD,
+        )
+    except Exception:
+        close_webdriver(web_driver=web_driver)
+        raise
+
+    return web_driver
+
+
+def _iniciar_navegador_gae() -> WebDriver:
+    return _autenticar_navegador_gae(_iniciar_firefox())
+
+
+def _retirar_navegador_gae() -> WebDriver:
+    if _pool_aquecido_gae is None:
+        return _iniciar_navegador_gae()
+    web_driver = _pool_aquecido_gae.retirar()
+    if WEB_DRIVER_WARM_POOL_LOGIN:
+        return web_driver
+    return _autenticar_navegador_gae(web_driver)
+
+
+def _verificar_situacao_debito_gae(web_driver: WebDriver, renavam_numero: str) -> str | None:
+    deadline = _novo_orcamento(GAE_ITEM_BUDGET_SECONDS)
+
+    if GAE_MODO_HTTP and web_driver.session_id not in _consulta_http_desativada_gae:
+        sessao_http = _sessoes_http_gae.get(web_driver.session_id)
         try:
-            temp_browser_profile_output_dir = (
-                helper_function__temp_browser_profile_dir__path()
+            if sessao_http is None:
+                session = exportar_sessao_http(web_driver)
+                formulario = gae_obter_formulario_debito_http(
+                    session=session,
+                    debito_conta_corrente_url=GAE_DEBITO_CONTA_CORRENTE_URL,
+                    timeout=GAE_TIMEOUT_DEFAULT,
+                )
+                sessao_http = (session, formulario)
+                _sessoes_http_gae[web_driver.session_id] = sessao_http
+
+            session, formulario = sessao_http
+            return gae_verificar_cda_liquidada_por_renavam_http(
+                session=session,
+                formulario=formulario,
+                renavam=renavam_numero,
+                timeout=cap_timeout(GAE_TIMEOUT_DEFAULT, deadline),
             )
-            firefox_options = set_default_firefox_options(
-                headless=WEB_DRIVER_HEADLESS,
-                firefox_options=FirefoxOptions(),
-                browser_profile_output_dir=temp_browser_profile_output_dir,
+        except ExceptionGaeHttpSessaoNaoAutenticada as e:
+            logger.warning(
+                f"Consulta HTTP do Renavam {renavam_numero} sem autenticação, usando o navegador: {e}"
             )
-            web_driver = webdriver.Firefox(options=firefox_options)
-
-            cra_log_in(
-                timeout=CRA_TIMEOUT_AUTH,
-                web_driver=web_driver,
-                login_url=CRA_LOGIN_PAGE_URL,
-                username=CRA_USERNAME,
-                password=CRA_PASSWORD,
+            # Os cookies podem ter sido renovados no navegador; exporta de novo no próximo Renavam.
+            sessao_http = _sessoes_http_gae.pop(web_driver.session_id, None)
+            if sessao_http is not None:
+                sessao_http[0].close()
+        except Exception as e:
+            logger.warning(
+                f"Consulta HTTP do Renavam {renavam_numero} falhou, usando só o navegador "
+                f"nesta sessão: {e.__class__.__name__}: {e}"
             )
+            sessao_http = _sessoes_http_gae.pop(web_driver.session_id, None)
+            if sessao_http is not None:
+                sessao_http[0].close()
+            _consulta_http_desativada_gae.add(web_driver.session_id)
+
+    return gae_verificar_cda_liquidada_por_renavam(
+        web_driver=web_driver,
+        renavam=renavam_numero,
+        timeout=GAE_TIMEOUT_DEFAULT,
+        debito_conta_corrente_url=GAE_DEBITO_CONTA_CORRENTE_URL,
+        reaproveitar_formulario=GAE_REAPROVEITAR_FORMULARIO,
+        deadline=deadline,
+    )
+
+
+def _verificar_renavam_no_gae(
+    web_driver: WebDriver,
+    indice_e_renavam: tuple[int, dict],
+    nome_do_navegador: str,
+) -> tuple[int, dict] | None:
+    indice, renavam = indice_e_renavam
+    renavam_numero = renavam['renavam']
+    with log_context(prefix__list=[FLUXO_GAE, nome_do_navegador, renavam_numero]):
+        logger.debug(f"Iniciando verificação do Renavam: {renavam_numero}")
+        try:
+            situacao_debito = _verificar_situacao_debito_gae(web_driver, renavam_numero)
 
-            renavams_nao_autorizados = []
-            for cda in cdas_protestadas_ou_protestadas_por_edital:
-                cda_numero = cda['numero_titulo']
-                with log_context(prefix__list=[FLUXO_CRA, cda_numero]):
-                    logger.debug(f"Iniciando verificação da CDA: {cda_numero}")
-                    try:
-                        aba_autorizacao = cra_verificar_se_existe_aba_autorizacao(
-                            web_driver=web_driver,
-                            cda=cda_numero,
-                            timeout=CRA_TIMEOUT_DEFAULT,
-                        )
+            cda = renavam['cda_numero']
 
-                        if not aba_autorizacao:
-                            logger.info(
-                                f"A CDA {cda_numero} ainda não está com autorização."
-                            )
-                            renavam = cda['nosso_numero']
-
-                            dados_titulo = {
-                                    'cda_numero': cda_numero,
-                                    'renavam': renavam,
-                            }
-
-                            renavams_nao_autorizados.append(dados_titulo)
-
-                    except Exception as e:
-                        with log_context(color=Color.YELLOW, prefix__list=[FLUXO_GAE]):
-                            logger.error(f"FALHOU: 'CDA = {cda_numero}'")
-                            logger.exception(f"{e.__class__.__name__}: {e}")
-                            save_screenshot(
-                                web_driver=web_driver,
-                                file_name=f"CDA_CRA_ERROR.png",
-                                output_dir=output_dir__str,
-                            )
-                    except KeyboardInterrupt:
-                        logger.info(
-                            "KeyboardInterrupt: Execução interrompida pelo usuário"
-                        )
-                        web_driver = None
-                        raise
+            if situacao_debito is not None and estado_varredura is not None:
+                estado_varredura.registrar_veredito(
+                    renavam.get('cda_consultada', cda),
+                    VEREDITO_LIQUIDADO
+                    if situacao_debito == "LIQUIDADO"
+                    else VEREDITO_NAO_LIQUIDADO,
+                )
 
-            logger.info(f"Renavams ainda não autorizados: {renavams_nao_autorizados}")
+            if situacao_debito == "LIQUIDADO":
+                logger.info(
+                    f"O Renavam {renavam_numero} está com débito liquidado."
+                )
+
+                dados_titulo = {
+                    'cda_numero': cda,
+                    'renavam': renavam_numero,
+                }
+
+                return indice, dados_titulo
 
         except Exception as e:
-            with log_context(color=Color.YELLOW, prefix__list=[FLUXO_CRA]):
+            with log_context(color=Color.YELLOW, prefix__list=[FLUXO_GAE, nome_do_navegador]):
+                logger.error(f"FALHOU: 'renavam = {renavam_numero}'")
                 logger.exception(f"{e.__class__.__name__}: {e}")
                 save_screenshot(
                     web_driver=web_driver,
-                    file_name="CRA_ERROR.png",
+                    file_name=f"{nome_do_navegador}_{renavam_numero}_RENAVAM_GAE_ERROR.png",
                     output_dir=output_dir__str,
                 )
-                raise
-        except KeyboardInterrupt:
-            logger.info("KeyboardInterrupt: Execução interrompida pelo usuário")
-            web_driver = None
-            raise
-        finally:
-            close_webdriver(web_driver=web_driver)
-
-    if renavams_nao_autorizados:
-        fluxo_gae(renavams_nao_autorizados)
-    else:
-        logger.info("Nenhum renavam pendente para o GAE.")
-
-def fluxo_gae(renavams_nao_autorizados: list):
-    with log_context(color=Color.GREEN, prefix__list=[FLUXO_GAE]):
-        web_driver = None
-        try:
-            temp_browser_profile_output_dir = (
-                helper_function__temp_browser_profile_dir__path()
-            )
-            firefox_options = set_default_firefox_options(
-                headless=WEB_DRIVER_HEADLESS,
-                firefox_options=FirefoxOptions(),
-                browser_profile_output_dir=temp_browser_profile_output_dir,
-            )
-            web_driver = webdriver.Firefox(options=firefox_options)
-
-            gae_log_in(
-                timeout=GAE_TIMEOUT_AUTH,
-                web_driver=web_driver,
-                login_url=SEFAZ_SSO_LOGIN_PAGE_URL,
-                username=GAE_USERNAME,
-                password=GAE_PASSWORD,
-            )
 
-            logger.debug(f"Iniciando processamento de {len(renavams_nao_autorizados)} Renavams.")
+    return None
 
-            renavams_liquidados = []
-            for renavam in renavams_nao_autorizados:
-                renavam_numero = renavam['renavam']
-                with log_context(prefix__list=[FLUXO_GAE, renavam_numero]):
-                    logger.debug(f"Iniciando verificação do Renavam: {renavam_numero}")
-                    try:
-                        web_driver.get(GAE_DEBITO_CONTA_CORRENTE_URL)
 
-                        situacao_debito = gae_verificar_cda_liquidada_por_renavam(
-                            web_driver=web_driver,
-                            renavam=renavam_numero,
-                            timeout=GAE_TIMEOUT_DEFAULT,
-                        )
-
-                        if situacao_debito == "LIQUIDADO":
-                            logger.info(
-                                f"O Renavam {renavam_numero} está com débito liquidado."
-                            )
-
-                            cda = renavam['cda_numero']
-
-                            dados_titulo = {
-                                'cda_numero': cda,
-                                'renavam': renavam_numero,
-                            }
-
-                            renavams_liquidados.append(dados_titulo)
-
-                    except Exception as e:
-                        with log_context(color=Color.YELLOW, prefix__list=[FLUXO_GAE]):
-                            logger.error(f"FALHOU: 'renavam = {renavam_numero}'")
-                            logger.exception(f"{e.__class__.__name__}: {e}")
-                            save_screenshot(
-                                web_driver=web_driver,
-                                file_name=f"{renavam_numero}_RENAVAM_GAE_ERROR.png",
-                                output_dir=output_dir__str,
-                            )
-                    except KeyboardInterrupt:
-                        logger.info(
-                            "KeyboardInterrupt: Execução interrompida pelo usuário"
-                        )
-                        web_driver = None
-                        raise
-
-            logger.info(f"Renavams com débito liquidado: {renavams_liquidados}")
+def fluxo_gae(renavams_nao_autorizados: Iterable[dict]) -> Iterator[dict]:
+    with log_context(color=Color.GREEN, prefix__list=[FLUXO_GAE]):
+        renavams_nao_autorizados = iter(renavams_nao_autorizados)
+        primeiro_renavam = next(renavams_nao_autorizados, None)
+        if primeiro_renavam is None:
+            logger.info("Nenhum renavam pendente para o GAE.")
+            return
+
+        logger.debug("Iniciando processamento dos Renavams.")
+
+        renavams_liquidados = []
+        for indice, dados_titulo in executar_em_pool_de_navegadores(
+            enumerate(chain([primeiro_renavam], renavams_nao_autorizados)),
+            quantidade_de_navegadores=GAE_WEB_DRIVER_POOL_SIZE,
+            iniciar_navegador=_retirar_navegador_gae,
+            processar_item=_verificar_renavam_no_gae,
+            nome="gae-navegador",
+        ):
+            renavams_liquidados.append((indice, dados_titulo))
+            yield dados_titulo
+
+        # Mesma ordem da execução serial, independente de qual navegador terminou antes.
+        renavams_liquidados = [
+            dados_titulo for _, dados_titulo in sorted(renavams_liquidados, key=lambda r: r[0])
+        ]
+        logger.info(f"Renavams com débito liquidado: {renavams_liquidados}")
+
+
+def _criar_pool_aquecido(
+    iniciar_navegador: Callable[[], WebDriver],
+    quantidade: int,
+    quantidade_de_navegadores: int,
+    nome: str,
+) -> PoolDeNavegadoresAquecidos | None:
+    if quantidade <= 0:
+        return None
+    # Cada navegador da etapa retira um único navegador do pool; aquecer além
+    # disso só ocuparia memória.
+    return PoolDeNavegadoresAquecidos(
+        iniciar_navegador=iniciar_navegador,
+        quantidade=min(quantidade, quantidade_de_navegadores),
+        nome=nome,
+        limite_de_navegadores=quantidade_de_navegadores,
+        ociosidade_maxima_segundos=WEB_DRIVER_WARM_POOL_MAX_IDLE_SECONDS,
+    )
+
+
+def main():
+    global _pool_aquecido_cra, _pool_aquecido_gae
+
+    # Perfis de execuções interrompidas (crash, kill) ficariam para sempre.
+    recover_orphan_profiles()
+
+    # Os dois pools aquecem desde já: o do GAE fica pronto enquanto o CRA roda.
+    _pool_aquecido_cra = _criar_pool_aquecido(
+        _iniciar_navegador_cra if WEB_DRIVER_WARM_POOL_LOGIN else _iniciar_firefox,
+        quantidade=CRA_WEB_DRIVER_WARM_POOL_SIZE,
+        quantidade_de_navegadores=CRA_WEB_DRIVER_POOL_SIZE,
+        nome="cra-navegador",
+    )
+    _pool_aquecido_gae = _criar_pool_aquecido(
+        _iniciar_navegador_gae if WEB_DRIVER_WARM_POOL_LOGIN else _iniciar_firefox,
+        quantidade=GAE_WEB_DRIVER_WARM_POOL_SIZE,
+        quantidade_de_navegadores=GAE_WEB_DRIVER_POOL_SIZE,
+        nome="gae-navegador",
+    )
+
+    cdas_protestadas_ou_protestadas_por_edital = executar_em_segundo_plano(
+        consulta_cra_descricao_ocorrencia_titulo(),
+        tamanho_fila=PIPELINE_TAMANHO_FILA,
+        nome="cra-api",
+    )
+    renavams_nao_autorizados = executar_em_segundo_plano(
+        verificar_se_existe_aba_autorizacao_cra(
+            cdas_protestadas_ou_protestadas_por_edital
+        ),
+        tamanho_fila=PIPELINE_TAMANHO_FILA,
+        nome="cra-navegador",
+    )
+    try:
+        for _ in fluxo_gae(renavams_nao_autorizados):
+            pass
+    finally:
+        for pool_aquecido in (_pool_aquecido_cra, _pool_aquecido_gae):
+            if pool_aquecido is not None:
+                pool_aquecido.encerrar()
+        log_locator_timings()
+        log_profile_store_stats()
 
-        except Exception:
-            raise
-        finally:
-            close_webdriver(web_driver=web_driver)
 
 if __name__ == "__main__":
-    consulta_cra_descricao_ocorrencia_titulo()
+    main()
@@ -0,0 +1,150 @@
+import csv
+import json
+import logging
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+logger = logging.getLogger(__name__)
+
+CAMPO_CDA_PADRAO = "SEU NUMERO"
+
+TAMANHO_BLOCO_LEITURA = 64 * 1024
+
+_json_decoder = json.JSONDecoder()
+_re_espacos = re.compile(r"\s+")
+
+
+def normalizar_cda(valor: Any) -> str | None:
+    if valor is None:
+        return None
+    cda = _re_espacos.sub("", str(valor)).upper()
+    return cda or None
+
+
+def _iterar_registros_csv(arquivo: TextIO) -> Iterator[dict]:
+    amostra = arquivo.read(TAMANHO_BLOCO_LEITURA)
+    arquivo.seek(0)
+    try:
+        dialeto = csv.Sniffer().sniff(amostra, delimiters=",;\t|")
+    except csv.Error:
+        dialeto = csv.excel
+    yield from csv.DictReader(arquivo, dialect=dialeto)
+
+
+def _iterar_registros_jsonl(arquivo: TextIO) -> Iterator[Any]:
+    for numero_linha, linha in enumerate(arquivo, start=1):
+        linha = linha.strip()
+        if not linha:
+            continue
+        try:
+            yield json.loads(linha)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Linha {numero_linha} inválida: {e}") from e
+
+
+def _iterar_registros_json_array(arquivo: TextIO) -> Iterator[Any]:
+    """
+    Decodifica um array JSON elemento a elemento, lendo o arquivo em blocos:
+    só o elemento corrente (e o bloco lido) fica em memória.
+    """
+    buffer = ""
+    posicao = 0
+    fim_do_arquivo = False
+
+    def ler_bloco() -> bool:
+        nonlocal buffer, posicao, fim_do_arquivo
+        bloco = arquivo.read(TAMANHO_BLOCO_LEITURA)
+        if not bloco:
+            fim_do_arquivo = True
+            return False
+        buffer = buffer[posicao:] + bloco
+        posicao = 0
+        return True
+
+    def proximo_caractere_relevante(ignorar: str) -> str | None:
+        nonlocal posicao
+        while True:
+            while posicao < len(buffer) and buffer[posicao] in ignorar:
+                posicao += 1
+            if posicao < len(buffer):
+                return buffer[posicao]
+            if not ler_bloco():
+                return None
+
+    if proximo_caractere_relevante(" \t\r\n") != "[":
+        raise ValueError("O arquivo JSON deve conter um array de títulos.")
+    posicao += 1
+
+    while True:
+        caractere = proximo_caractere_relevante(" \t\r\n,")
+        if caractere is None:
+            raise ValueError("Array JSON não foi fechado.")
+        if caractere == "]":
+            return
+
+        while True:
+            try:
+                registro, fim = _json_decoder.raw_decode(buffer, posicao)
+            except json.JSONDecodeError:
+                if fim_do_arquivo or not ler_bloco():
+                    raise
+                continue
+            # Um número no fim do bloco pode ter sido cortado ("12" de "123").
+            if fim == len(buffer) and not fim_do_arquivo and ler_bloco():
+                continue
+            break
+
+        posicao = fim
+        yield registro
+
+
+def ler_registros_carteira(caminho: str) -> Iterator[Any]:
+    extensao = Path(caminho).suffix.lower()
+
+    with open(caminho, "r", encoding="utf-8-sig", newline="") as arquivo:
+        if extensao == ".csv":
+            yield from _iterar_registros_csv(arquivo)
+        elif extensao in (".jsonl", ".ndjson"):
+            yield from _iterar_registros_jsonl(arquivo)
+        elif extensao == ".json":
+            yield from _iterar_registros_json_array(arquivo)
+        else:
+            raise ValueError(f"Formato de carteira não suportado: {caminho}")
+
+
+def ler_cdas_carteira(
+    caminho: str,
+    campo_cda: str = CAMPO_CDA_PADRAO,
+) -> Iterator[str]:
+    """
+    Lê a carteira em fluxo e devolve cada CDA normalizada uma única vez, na
+    ordem da primeira ocorrência. Registros podem ser objetos (com `campo_cda`)
+    ou o próprio número da CDA.
+    """
+    vistas: set[str] = set()
+    total_registros = 0
+    total_duplicadas = 0
+
+    for total_registros, registro in enumerate(
+        ler_registros_carteira(caminho), start=1
+    ):
+        valor = registro.get(campo_cda) if isinstance(registro, dict) else registro
+        cda = normalizar_cda(valor)
+
+        if cda is None:
+            logger.debug(f"Registro {total_registros} sem '{campo_cda}', pulando...")
+            continue
+
+        if cda in vistas:
+            total_duplicadas += 1
+            continue
+
+        vistas.add(cda)
+        yield cda
+
+    logger.info(
+        f"Carteira {caminho}: {total_registros} registros, "
+        f"{len(vistas)} CDAs distintas, {total_duplicadas} duplicadas."
+    )
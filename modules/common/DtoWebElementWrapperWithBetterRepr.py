@@ -1,18 +1,71 @@
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
 
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.remote.webelement import WebElement
 
+logger = logging.getLogger(__name__)
+
+
+class ElementDiagnosticsMode(Enum):
+    FULL = "full"
+    FAST = "fast"
+
+
+_element_diagnostics_mode = ElementDiagnosticsMode.FULL
+_outer_html_max_length = 2000
+
+
+def configure_element_diagnostics(
+    mode: ElementDiagnosticsMode, outer_html_max_length: int = 2000
+) -> None:
+    """
+    `FAST` nunca busca o outerHTML; `FULL` busca só quando o registro de log
+    é de fato emitido, truncado em `outer_html_max_length` (0 = sem limite).
+    """
+    global _element_diagnostics_mode, _outer_html_max_length
+    if outer_html_max_length < 0:
+        raise ValueError("outer_html_max_length must be zero or positive")
+    _element_diagnostics_mode = mode
+    _outer_html_max_length = outer_html_max_length
+    logger.debug(
+        f"Element diagnostics: {mode.value} (outerHTML max length: {outer_html_max_length})"
+    )
+
 
 @dataclass
 class DtoWebElementWrapperWithBetterRepr:
     webelement: WebElement
-    outer_html: str
+    _outer_html: str | None = field(default=None, repr=False)
 
     def __init__(self, webelement: WebElement):
         self.webelement = webelement
-        self.outer_html = webelement.get_attribute("outerHTML")
+        self._outer_html = None
+
+    @property
+    def outer_html(self) -> str:
+        # Um round trip ao geckodriver; feito uma vez por wrapper e só quando
+        # alguém formata o wrapper (logging com `%s` só formata se emitir).
+        if self._outer_html is None:
+            try:
+                outer_html = self.webelement.get_attribute("outerHTML") or ""
+            except WebDriverException as e:
+                outer_html = f"<outerHTML unavailable: {e.__class__.__name__}>"
+
+            if _outer_html_max_length and len(outer_html) > _outer_html_max_length:
+                outer_html = (
+                    f"{outer_html[:_outer_html_max_length]}"
+                    f"... [{len(outer_html) - _outer_html_max_length} chars truncated]"
+                )
+            self._outer_html = outer_html
+
+        return self._outer_html
 
     def __repr__(self) -> str:
+        if _element_diagnostics_mode is ElementDiagnosticsMode.FAST:
+            return f"WebElementWithBetterRepr(webelement={self.webelement!r})"
+
         return (
             f"WebElementWithBetterRepr("
             f"outer_html={self.outer_html!r}, "
@@ -0,0 +1,217 @@
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+
+
+class _ColetorDeElementos(HTMLParser):
+    def __init__(self, tags: set[str]):
+        super().__init__(convert_charrefs=True)
+        self.tags = tags
+        self.elementos: list[dict[str, str]] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in self.tags:
+            elemento = {nome: valor or "" for nome, valor in attrs}
+            elemento["__tag__"] = tag
+            self.elementos.append(elemento)
+
+
+def encontrar_elementos(html: str, tags: set[str]) -> list[dict[str, str]]:
+    """
+    Devolve os atributos de cada elemento de `tags` (a tag fica em `__tag__`),
+    na ordem do documento. Usa só `html.parser`, sem montar uma árvore.
+    """
+    coletor = _ColetorDeElementos(tags)
+    coletor.feed(html)
+    coletor.close()
+    return coletor.elementos
+
+
+@dataclass
+class DtoFormularioHtml:
+    action: str
+    method: str
+    campos: dict[str, str] = field(default_factory=dict)
+    opcoes: dict[str, dict[str, str]] = field(default_factory=dict)
+    ids: dict[str, str] = field(default_factory=dict)
+    botoes: dict[str, tuple[str, str]] = field(default_factory=dict)
+
+
+class _ColetorDeFormularios(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.formularios: list[DtoFormularioHtml] = []
+        self._formulario: DtoFormularioHtml | None = None
+        self._select: str | None = None
+        self._opcao: dict[str, str] | None = None
+        self._texto_opcao: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        atributos = {nome: valor or "" for nome, valor in attrs}
+
+        if tag == "form":
+            self._formulario = DtoFormularioHtml(
+                action=atributos.get("action", ""),
+                method=(atributos.get("method") or "get").lower(),
+            )
+            self.formularios.append(self._formulario)
+            return
+
+        if self._formulario is None:
+            return
+
+        nome = atributos.get("name")
+        if nome and atributos.get("id"):
+            self._formulario.ids[atributos["id"]] = nome
+
+        if tag == "input" and nome:
+            tipo = atributos.get("type", "text").lower()
+            if tipo in ("checkbox", "radio") and "checked" not in atributos:
+                return
+            if tipo in ("submit", "image"):
+                chave = atributos.get("id") or nome
+                self._formulario.botoes[chave] = (nome, atributos.get("value", ""))
+                return
+            if tipo in ("button", "reset", "file"):
+                return
+            self._formulario.campos[nome] = atributos.get("value", "")
+        elif tag == "textarea" and nome:
+            self._formulario.campos.setdefault(nome, "")
+        elif tag == "select" and nome:
+            self._select = nome
+            self._formulario.opcoes[nome] = {}
+        elif tag == "option" and self._select is not None:
+            self._opcao = atributos
+            self._texto_opcao = []
+
+    def handle_data(self, data: str) -> None:
+        if self._opcao is not None:
+            self._texto_opcao.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "option" or (tag == "select" and self._opcao is not None):
+            self._fechar_opcao()
+        if tag == "select":
+            self._select = None
+        elif tag == "form":
+            self._formulario = None
+
+    def _fechar_opcao(self) -> None:
+        if self._opcao is None or self._select is None or self._formulario is None:
+            return
+        texto = " ".join("".join(self._texto_opcao).split())
+        valor = self._opcao.get("value", texto)
+        self._formulario.opcoes[self._select][texto] = valor
+        if "selected" in self._opcao or self._select not in self._formulario.campos:
+            self._formulario.campos[self._select] = valor
+        self._opcao = None
+
+
+def extrair_formularios(html: str) -> list[DtoFormularioHtml]:
+    """
+    Devolve cada `<form>` com os valores que o navegador enviaria por padrão
+    (`campos`) e, por `<select>`, o mapa texto da opção -> value (`opcoes`).
+    """
+    coletor = _ColetorDeFormularios()
+    coletor.feed(html)
+    coletor.close()
+    return coletor.formularios
+
+
+@dataclass
+class DtoTabelaHtml:
+    cabecalho: list[str]
+    linhas: list[list[str]]
+
+
+class _ColetorDeTabela(HTMLParser):
+    def __init__(self, id_tabela: str):
+        super().__init__(convert_charrefs=True)
+        self.id_tabela = id_tabela
+        self.tabela: DtoTabelaHtml | None = None
+        self._profundidade = 0
+        self._secao: str | None = None
+        self._cabecalho_lido = False
+        self._linha: list[str] | None = None
+        self._linha_so_th = False
+        self._celula: list[str] | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "table":
+            if self._profundidade:
+                self._profundidade += 1
+            elif self.tabela is None and dict(attrs).get("id") == self.id_tabela:
+                self.tabela = DtoTabelaHtml(cabecalho=[], linhas=[])
+                self._profundidade = 1
+            return
+
+        # Tabelas aninhadas contam como conteúdo da célula externa.
+        if self._profundidade != 1:
+            return
+
+        if tag in ("thead", "tbody", "tfoot"):
+            self._secao = tag
+        elif tag == "tr" and self._secao != "tfoot":
+            self._linha = []
+            self._linha_so_th = True
+        elif tag in ("td", "th") and self._linha is not None:
+            self._celula = []
+            if tag == "td":
+                self._linha_so_th = False
+        elif tag == "br" and self._celula is not None:
+            self._celula.append(" ")
+
+    def handle_data(self, data: str) -> None:
+        if self._celula is not None:
+            self._celula.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "table" and self._profundidade:
+            self._profundidade -= 1
+            return
+
+        if self._profundidade != 1 or self.tabela is None:
+            return
+
+        if tag in ("td", "th") and self._celula is not None and self._linha is not None:
+            self._linha.append(" ".join("".join(self._celula).split()))
+            self._celula = None
+        elif tag == "tr" and self._linha is not None:
+            self._fechar_linha(self._linha)
+            self._linha = None
+        elif tag in ("thead", "tbody", "tfoot"):
+            self._secao = None
+
+    def _fechar_linha(self, linha: list[str]) -> None:
+        if self._secao == "thead":
+            # Só a primeira linha de cabeçalho; as demais (títulos
+            # agrupados, filtros) não são os nomes das colunas.
+            if not self._cabecalho_lido:
+                self.tabela.cabecalho = linha
+                self._cabecalho_lido = True
+            return
+
+        # Fora de `<thead>` o navegador põe a linha num `<tbody>` implícito;
+        # ela só é o cabeçalho se vier antes dos dados e tiver apenas `<th>`.
+        if (
+            not self._cabecalho_lido
+            and not self.tabela.linhas
+            and linha
+            and self._linha_so_th
+        ):
+            self.tabela.cabecalho = linha
+            self._cabecalho_lido = True
+        else:
+            self.tabela.linhas.append(linha)
+
+
+def extrair_tabela(html: str, id_tabela: str) -> DtoTabelaHtml | None:
+    """
+    Texto das células de `<table id=id_tabela>`: o cabeçalho é a primeira
+    linha do `<thead>` (ou, sem ele, uma primeira linha só de `<th>`); as
+    demais linhas, com ou sem `<tbody>`, viram `linhas`, e o `<tfoot>` é
+    ignorado. None se a tabela não existir.
+    """
+    coletor = _ColetorDeTabela(id_tabela)
+    coletor.feed(html)
+    coletor.close()
+    return coletor.tabela
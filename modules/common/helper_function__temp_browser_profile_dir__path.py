@@ -6,10 +6,12 @@ import uuid
 
 def helper_function__temp_browser_profile_dir__path(
     create_temp_dir: bool = True,
+    base_dir: str | None = None,
+    prefix: str = "firefox-profile-",
 ) -> str:
     temp_browser_profile_dir__path = os.path.join(
-        tempfile.gettempdir(),
-        f"firefox-profile-{uuid.uuid4()}",
+        base_dir or tempfile.gettempdir(),
+        f"{prefix}{uuid.uuid4()}",
     )
     if create_temp_dir is True:
         Path(temp_browser_profile_dir__path).mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,146 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DtoCraApiCacheEntrada:
+    numero_titulo: str
+    response_json: dict
+    etag: str | None
+    last_modified: str | None
+    armazenado_em: float
+    fresca: bool
+
+    def cabecalhos_revalidacao(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class DtoCraApiCacheEstatisticas:
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    revalidados: int = 0
+
+
+class CraApiCache:
+    """
+    Cache em SQLite das respostas de `/titulo`, indexado por `numeroTitulo`.
+
+    Entradas mais novas que `ttl_segundos` são servidas sem rede. Entradas
+    expiradas continuam guardadas para que a próxima consulta seja condicional
+    (`If-None-Match`/`If-Modified-Since`); um 304 apenas renova a entrada.
+    """
+
+    def __init__(self, caminho: str, ttl_segundos: float):
+        if ttl_segundos < 0:
+            raise ValueError("ttl_segundos must be zero or positive")
+
+        Path(caminho).parent.mkdir(parents=True, exist_ok=True)
+
+        self.caminho = caminho
+        self.ttl_segundos = ttl_segundos
+        self.estatisticas = DtoCraApiCacheEstatisticas()
+
+        self._lock = threading.Lock()
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cra_titulo (
+                numero_titulo TEXT PRIMARY KEY,
+                response_json TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                armazenado_em REAL NOT NULL
+            )
+            """
+        )
+        self._conexao.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conexao.close()
+
+    def obter(self, numero_titulo: str) -> DtoCraApiCacheEntrada | None:
+        with self._lock:
+            linha = self._conexao.execute(
+                """
+                SELECT response_json, etag, last_modified, armazenado_em
+                FROM cra_titulo
+                WHERE numero_titulo = ?
+                """,
+                (numero_titulo,),
+            ).fetchone()
+
+            if linha is None:
+                self.estatisticas.misses += 1
+                return None
+
+            response_json, etag, last_modified, armazenado_em = linha
+            fresca = time.time() - armazenado_em < self.ttl_segundos
+            if fresca:
+                self.estatisticas.hits += 1
+            else:
+                self.estatisticas.stale += 1
+
+        return DtoCraApiCacheEntrada(
+            numero_titulo=numero_titulo,
+            response_json=json.loads(response_json),
+            etag=etag,
+            last_modified=last_modified,
+            armazenado_em=armazenado_em,
+            fresca=fresca,
+        )
+
+    def armazenar(
+        self,
+        numero_titulo: str,
+        response_json: dict,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        with self._lock:
+            self._conexao.execute(
+                """
+                INSERT INTO cra_titulo (
+                    numero_titulo, response_json, etag, last_modified, armazenado_em
+                )
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (numero_titulo) DO UPDATE SET
+                    response_json = excluded.response_json,
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    armazenado_em = excluded.armazenado_em
+                """,
+                (
+                    numero_titulo,
+                    json.dumps(response_json, ensure_ascii=False),
+                    etag,
+                    last_modified,
+                    time.time(),
+                ),
+            )
+            self._conexao.commit()
+
+    def renovar(self, numero_titulo: str) -> None:
+        with self._lock:
+            self._conexao.execute(
+                "UPDATE cra_titulo SET armazenado_em = ? WHERE numero_titulo = ?",
+                (time.time(), numero_titulo),
+            )
+            self._conexao.commit()
+            self.estatisticas.revalidados += 1
@@ -0,0 +1,164 @@
+import base64
+import contextvars
+import logging
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from modules.cra.cra_api_cache import CraApiCache
+from modules.cra.exception import (
+    ExceptionCraApiEndpointNaoEncontrado,
+    ExceptionCraApiFalhaAutenticacao,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def montar_headers_cra_api(username: str, password: str) -> dict[str, str]:
+    credenciais = f"{username}:{password}"
+    credenciais_b64 = base64.b64encode(credenciais.encode("utf-8")).decode("utf-8")
+    return {
+        "Authorization": f"Basic {credenciais_b64}",
+        "Accept": "application/json",
+    }
+
+
+@dataclass
+class DtoCraConsultaTitulo:
+    cda: str
+    response_json: dict | None
+    erro: Exception | None = None
+
+
+class CraApiClient:
+    """
+    Cliente da API do CRA com uma única `requests.Session` (conexões keep-alive
+    reaproveitadas entre as consultas) e um pool de threads limitado.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        titulo_endpoint: str,
+        username: str,
+        password: str,
+        max_workers: int = 8,
+        timeout: float | None = None,
+        cache: CraApiCache | None = None,
+    ):
+        if not isinstance(max_workers, int) or max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer")
+
+        self.url_titulo = f"{base_url}{titulo_endpoint}"
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache = cache
+
+        self.session = requests.Session()
+        self.session.headers.update(montar_headers_cra_api(username, password))
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "CraApiClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def consultar_titulo(self, cda: str) -> dict:
+        entrada_cache = None
+        headers = {}
+        if self.cache is not None:
+            entrada_cache = self.cache.obter(cda)
+            if entrada_cache is not None:
+                if entrada_cache.fresca:
+                    logger.debug(f"Título {cda} servido pelo cache.")
+                    return entrada_cache.response_json
+                headers = entrada_cache.cabecalhos_revalidacao()
+
+        logger.debug(f"Consultando título: {cda}...")
+
+        response = self.session.get(
+            self.url_titulo,
+            params={"numeroTitulo": cda},
+            headers=headers,
+            timeout=self.timeout,
+        )
+
+        if response.status_code == 304 and entrada_cache is not None:
+            logger.debug(f"Título {cda} revalidado (304).")
+            self.cache.renovar(cda)
+            return entrada_cache.response_json
+
+        if response.status_code == 200:
+            response_json = response.json()
+            if self.cache is not None:
+                self.cache.armazenar(
+                    cda,
+                    response_json,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+            return response_json
+
+        if response.status_code == 401:
+            raise ExceptionCraApiFalhaAutenticacao()
+
+        if response.status_code == 404:
+            raise ExceptionCraApiEndpointNaoEncontrado(self.url_titulo)
+
+        logger.debug(
+            f"Erro HTTP inesperado: {response.status_code}. Detalhes: {response.text}"
+        )
+        raise Exception(f"Erro HTTP inesperado: {response.status_code}")
+
+    def _consultar_titulo_sem_propagar_erro(self, cda: str) -> DtoCraConsultaTitulo:
+        try:
+            return DtoCraConsultaTitulo(
+                cda=cda, response_json=self.consultar_titulo(cda)
+            )
+        except (ExceptionCraApiFalhaAutenticacao, ExceptionCraApiEndpointNaoEncontrado):
+            raise
+        except Exception as e:
+            return DtoCraConsultaTitulo(cda=cda, response_json=None, erro=e)
+
+    def consultar_titulos(self, cdas: Iterable[str]) -> Iterator[DtoCraConsultaTitulo]:
+        """
+        Consulta os títulos em paralelo e devolve os resultados na mesma ordem
+        de `cdas`. No máximo `2 * max_workers` consultas ficam pendentes, então
+        `cdas` pode ser um gerador de tamanho arbitrário.
+
+        Falhas de autenticação (401) e de endpoint (404) interrompem a varredura;
+        os demais erros são devolvidos em `DtoCraConsultaTitulo.erro`.
+        """
+        janela = 2 * self.max_workers
+        pendentes: deque[Future[DtoCraConsultaTitulo]] = deque()
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="cra-api",
+        )
+        try:
+            for cda in cdas:
+                contexto = contextvars.copy_context()
+                pendentes.append(
+                    executor.submit(
+                        contexto.run, self._consultar_titulo_sem_propagar_erro, cda
+                    )
+                )
+                if len(pendentes) >= janela:
+                    yield pendentes.popleft().result()
+
+            while pendentes:
+                yield pendentes.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,190 @@
+import asyncio
+import logging
+import os
+import ssl
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+
+import httpx
+
+from modules.cra.cra_api_cache import CraApiCache
+from modules.cra.cra_api_client import DtoCraConsultaTitulo, montar_headers_cra_api
+from modules.cra.exception import (
+    ExceptionCraApiEndpointNaoEncontrado,
+    ExceptionCraApiFalhaAutenticacao,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _verificacao_tls() -> ssl.SSLContext | bool:
+    # Mesmas variáveis que o `requests` do cliente síncrono respeita; sem elas,
+    # o httpx usa o certifi ou SSL_CERT_FILE/SSL_CERT_DIR.
+    ca_bundle = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE")
+    if not ca_bundle:
+        return True
+    if os.path.isdir(ca_bundle):
+        return ssl.create_default_context(capath=ca_bundle)
+    return ssl.create_default_context(cafile=ca_bundle)
+
+
+class CraApiClientAsync:
+    """
+    Variante assíncrona do `CraApiClient`: um único event loop mantém até
+    `max_in_flight` consultas em andamento sobre as conexões keep-alive de um
+    `httpx.AsyncClient`, sem uma thread por requisição. Como o cliente
+    síncrono, respeita HTTP(S)_PROXY/NO_PROXY, REQUESTS_CA_BUNDLE e segue
+    redirecionamentos.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        titulo_endpoint: str,
+        username: str,
+        password: str,
+        max_in_flight: int = 100,
+        timeout: float | None = None,
+        cache: CraApiCache | None = None,
+    ):
+        if not isinstance(max_in_flight, int) or max_in_flight <= 0:
+            raise ValueError("max_in_flight must be a positive integer")
+
+        self.url_titulo = f"{base_url}{titulo_endpoint}"
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.cache = cache
+
+        self._client = httpx.AsyncClient(
+            headers=montar_headers_cra_api(username, password),
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_connections=max_in_flight,
+                max_keepalive_connections=max_in_flight,
+            ),
+            verify=_verificacao_tls(),
+            follow_redirects=True,
+            trust_env=True,
+        )
+
+        # Limita as consultas em andamento antes do pool do httpx, para que a
+        # espera por uma conexão livre não conte no timeout da requisição.
+        self._semaforo = asyncio.Semaphore(max_in_flight)
+
+    async def __aenter__(self) -> "CraApiClientAsync":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _requisitar(
+        self, parametros: dict[str, str], headers_extras: dict[str, str]
+    ) -> httpx.Response:
+        async with self._semaforo:
+            return await self._client.get(
+                self.url_titulo, params=parametros, headers=headers_extras
+            )
+
+    async def consultar_titulo(
+        self, cda: str, documento_devedor: str | None = None
+    ) -> dict:
+        entrada_cache = None
+        headers = {}
+        if self.cache is not None and documento_devedor is None:
+            entrada_cache = self.cache.obter(cda)
+            if entrada_cache is not None:
+                if entrada_cache.fresca:
+                    logger.debug(f"Título {cda} servido pelo cache.")
+                    return entrada_cache.response_json
+                headers = entrada_cache.cabecalhos_revalidacao()
+
+        logger.debug(f"Consultando título: {cda}...")
+
+        parametros = {"numeroTitulo": cda}
+        if documento_devedor is not None:
+            parametros["documentoDevedor"] = documento_devedor
+
+        response = await self._requisitar(parametros, headers)
+
+        if response.status_code == 304 and entrada_cache is not None:
+            logger.debug(f"Título {cda} revalidado (304).")
+            self.cache.renovar(cda)
+            return entrada_cache.response_json
+
+        if response.status_code == 200:
+            response_json = response.json()
+            if self.cache is not None and documento_devedor is None:
+                self.cache.armazenar(
+                    cda,
+                    response_json,
+                    etag=response.headers.get("etag"),
+                    last_modified=response.headers.get("last-modified"),
+                )
+            return response_json
+
+        if response.status_code == 401:
+            raise ExceptionCraApiFalhaAutenticacao()
+
+        if response.status_code == 404:
+            raise ExceptionCraApiEndpointNaoEncontrado(self.url_titulo)
+
+        logger.debug(
+            f"Erro HTTP inesperado: {response.status_code}. Detalhes: {response.text}"
+        )
+        raise Exception(f"Erro HTTP inesperado: {response.status_code}")
+
+    async def _consultar_titulo_sem_propagar_erro(
+        self, cda: str
+    ) -> DtoCraConsultaTitulo:
+        try:
+            response_json = await self.consultar_titulo(cda)
+            return DtoCraConsultaTitulo(cda=cda, response_json=response_json)
+        except (ExceptionCraApiFalhaAutenticacao, ExceptionCraApiEndpointNaoEncontrado):
+            raise
+        except Exception as e:
+            return DtoCraConsultaTitulo(cda=cda, response_json=None, erro=e)
+
+    async def consultar_titulos(
+        self, cdas: Iterable[str] | AsyncIterable[str]
+    ) -> AsyncIterator[DtoCraConsultaTitulo]:
+        """
+        Devolve as consultas à medida que as respostas chegam (ordem de
+        conclusão, não de entrada). Falhas de autenticação (401) e de endpoint
+        (404) interrompem a varredura; os demais erros são devolvidos em
+        `DtoCraConsultaTitulo.erro`.
+        """
+        janela = 2 * self.max_in_flight
+        pendentes: set[asyncio.Task[DtoCraConsultaTitulo]] = set()
+
+        async def _iterar_cdas() -> AsyncIterator[str]:
+            if isinstance(cdas, AsyncIterable):
+                async for cda in cdas:
+                    yield cda
+            else:
+                for cda in cdas:
+                    yield cda
+
+        try:
+            async for cda in _iterar_cdas():
+                pendentes.add(
+                    asyncio.create_task(self._consultar_titulo_sem_propagar_erro(cda))
+                )
+                if len(pendentes) >= janela:
+                    concluidas, pendentes = await asyncio.wait(
+                        pendentes, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for tarefa in concluidas:
+                        yield tarefa.result()
+
+            while pendentes:
+                concluidas, pendentes = await asyncio.wait(
+                    pendentes, return_when=asyncio.FIRST_COMPLETED
+                )
+                for tarefa in concluidas:
+                    yield tarefa.result()
+        finally:
+            for tarefa in pendentes:
+                tarefa.cancel()
+            await asyncio.gather(*pendentes, return_exceptions=True)
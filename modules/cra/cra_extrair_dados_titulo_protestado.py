@@ -0,0 +1,57 @@
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+DESCRICOES_PROTESTO = ["Protestado", "Protesto por edital"]
+
+
+def cra_extrair_ultima_ocorrencia(response_json: dict) -> dict | None:
+    titulos = response_json.get("_embedded", {}).get("titulo", [])
+    if not titulos:
+        return None
+
+    lista_retornos = titulos[0].get("retornos", [])
+    if not lista_retornos:
+        return None
+
+    return lista_retornos[-1].get("ocorrencia", {})
+
+
+def cra_extrair_dados_titulo_protestado(response_json: dict) -> dict | None:
+    titulos = response_json.get("_embedded", {}).get("titulo", [])
+
+    if not titulos:
+        logger.debug("Nenhum título encontrado")
+        return None
+
+    titulo_atual = titulos[0]
+
+    lista_retornos = titulo_atual.get("retornos", [])
+
+    if not lista_retornos:
+        logger.debug("Lista de retornos vazia.")
+        return None
+
+    ultimo_retorno = lista_retornos[-1]
+
+    descricao = ultimo_retorno.get("ocorrencia", {}).get("descricao")
+
+    logger.debug(f"Última Ocorrência: {descricao}")
+
+    if descricao not in DESCRICOES_PROTESTO:
+        return None
+
+    numero_titulo = titulo_atual.get("numeroTitulo")
+    nosso_numero = titulo_atual.get("nossoNumero", "")
+
+    match = re.search(r"RENA(\d+)", nosso_numero)
+    if match:
+        renavam = match.group(1)
+    else:
+        renavam = "".join(filter(str.isdigit, nosso_numero))
+
+    return {
+        "numero_titulo": numero_titulo,
+        "nosso_numero": renavam,
+    }
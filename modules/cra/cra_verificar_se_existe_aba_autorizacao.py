@@ -1,145 +1,255 @@
 import logging
-from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
 
+from modules.cra.xpath import (
+    locator_cra_aba_autorizacao,
+    locator_cra_buscar_titulo_button,
+    locator_cra_fechar_detalhes_button,
+    locator_cra_menu_consulta,
+    locator_cra_menu_consultar_titulo,
+    locator_cra_numero_titulo_input,
+    locator_cra_ver_detalhes_titulo_button,
+)
+from modules.webdriver.deadline import Deadline
+from modules.webdriver.exception import ExceptionStepFailed
+from modules.webdriver.mutation_observer_condition import (
+    JS_FIND_ELEMENT_FUNCTIONS,
+    to_script_locator,
+)
 from modules.webdriver.run_in_webdriver import (
     AlternateCondition,
     run_in_webdriver,
 )
-from modules.webdriver.webelement_action.click_action import click_action
-from modules.webdriver.webelement_action.type_action import type_action
+from modules.webdriver.step_sequence import (
+    ClickStep,
+    TypeStep,
+    run_step_sequence,
+)
 
 logger = logging.getLogger(__name__)
 
+ABA_PRESENTE = "presente"
 
-def cra_verificar_se_existe_aba_autorizacao(
-    web_driver: WebDriver,
-    cda: str,
-    timeout: int,
-) -> str | None:
-    try:
-        xpath = "//ul//li//a//span[normalize-space(.)='Consulta']"
-        nome_do_elemento = "Menu Consulta"
+# O modal de detalhe está pronto quando o botão "fechar" e a lista de abas
+# do próprio modal estão visíveis; a partir daí a falta da aba Autorização já
+# é o resultado, sem esperar o timeout. Sem um modal em volta do botão, a
+# página não está no formato esperado e a decisão fica para o timeout.
+JS_ABA_AUTORIZACAO_DECIDIDA = (
+    JS_FIND_ELEMENT_FUNCTIONS
+    + """
+const [abaBy, abaValue, fecharBy, fecharValue] = arguments;
+if (findElement(abaBy, abaValue, "visible")) return "presente";
 
-        run_in_webdriver(
-            web_driver=web_driver,
-            condition__list=[
-                AlternateCondition(
-                    timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
-                    webdriver_action=lambda el: click_action(web_element=el),
-                ),
-            ],
-        )
+const fechar = findElement(fecharBy, fecharValue, "visible");
+if (!fechar) return null;
 
-        xpath = "//li[@id='ul_8_li_1']//a[normalize-space(.)='Consultar título']"
-        nome_do_elemento = "Consultar título"
+const modal = fechar.closest(".modal, [role='dialog']");
+if (!modal) return null;
 
-        run_in_webdriver(
-            web_driver=web_driver,
-            condition__list=[
-                AlternateCondition(
-                    timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
-                    webdriver_action=lambda el: click_action(web_element=el),
-                ),
-            ],
+const abas = Array.from(modal.querySelectorAll("ul li a[href^='#']")).filter(
+    (aba) => aba.getAttribute("href").length > 1 && isVisible(aba)
+);
+if (!abas.length) return null;
+
+return "ausente";
+"""
+)
+
+
+def _aba_autorizacao_decidida(web_driver: WebDriver) -> str | bool:
+    return web_driver.execute_script(
+        JS_ABA_AUTORIZACAO_DECIDIDA,
+        *to_script_locator(locator_cra_aba_autorizacao.locator),
+        *to_script_locator(locator_cra_fechar_detalhes_button.locator),
+    ) or False
+
+
+def _passos_navegacao() -> list:
+    return [
+        ClickStep(
+            locator=locator_cra_menu_consulta,
+            nome_do_elemento="Menu Consulta",
+        ),
+        ClickStep(
+            locator=locator_cra_menu_consultar_titulo,
+            nome_do_elemento="Consultar título",
+        ),
+    ]
+
+
+def _passos_pesquisa(cda: str) -> list:
+    return [
+        TypeStep(
+            locator=locator_cra_numero_titulo_input,
+            nome_do_elemento="Campo de Número do Título",
+            input_value=cda,
+        ),
+        ClickStep(
+            locator=locator_cra_buscar_titulo_button,
+            nome_do_elemento="Botão de Pesquisar",
+        ),
+    ]
+
+
+def _tela_consulta_carregada(web_driver: WebDriver) -> bool:
+    web_driver.switch_to.default_content()
+    try:
+        return any(
+            campo.is_displayed()
+            for campo in web_driver.find_elements(*locator_cra_numero_titulo_input.locator)
         )
+    except WebDriverException:
+        return False
 
-        xpath = "//thead//tr//th//input[@id='numeroTitulo']"
-        nome_do_elemento = "Campo de Número do Título"
 
-        run_in_webdriver(
+def _link_ver_atual(web_driver: WebDriver) -> WebElement | None:
+    links = web_driver.find_elements(*locator_cra_ver_detalhes_titulo_button.locator)
+    return links[0] if links else None
+
+
+def _pesquisar_na_tela_atual(
+    web_driver: WebDriver, cda: str, timeout: int, deadline: Deadline | None
+) -> bool:
+    """
+    Pesquisa sem passar pelo menu. False se a tela não estiver no estado
+    esperado e for preciso navegar de novo.
+    """
+    if not _tela_consulta_carregada(web_driver):
+        return False
+
+    # O link "Ver" da CDA anterior continua na página até a nova pesquisa
+    # substituir a tabela; sem esperar por isso, o passo seguinte o clicaria.
+    link_ver_anterior = _link_ver_atual(web_driver)
+
+    try:
+        run_step_sequence(
             web_driver=web_driver,
-            condition__list=[
-                AlternateCondition(
-                    timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
-                    webdriver_action=lambda web_element: type_action(
-                        web_element=web_element,
-                        input_value=cda,
+            step__list=_passos_pesquisa(cda),
+            timeout=timeout,
+            deadline=deadline,
+        )
+        if link_ver_anterior is not None:
+            run_in_webdriver(
+                web_driver=web_driver,
+                condition__list=[
+                    AlternateCondition(
+                        timeout=timeout,
+                        condition=EC.staleness_of(link_ver_anterior),
                     ),
-                ),
-            ],
+                ],
+                deadline=deadline,
+            )
+    except (TimeoutException, ExceptionStepFailed) as e:
+        logger.warning(
+            f"Tela 'Consultar título' fora do estado esperado, navegando pelo menu: {e}"
         )
+        return False
 
-        xpath = "//thead//tr//th//button[@type='submit' and @data-original-title='Buscar']"
-        nome_do_elemento = "Botão de Pesquisar"
+    logger.debug("Pesquisa feita na tela 'Consultar título' já carregada.")
+    return True
 
-        run_in_webdriver(
+
+def _verificar_aba_no_detalhe(
+    web_driver: WebDriver, timeout: int, deadline: Deadline | None
+) -> bool:
+    try:
+        output = run_in_webdriver(
             web_driver=web_driver,
             condition__list=[
                 AlternateCondition(
                     timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
-                    webdriver_action=lambda el: click_action(web_element=el),
+                    condition=_aba_autorizacao_decidida,
                 ),
             ],
+            deadline=deadline,
+        )
+        return output.web_element == ABA_PRESENTE
+    except TimeoutException:
+        # Modal fora do formato esperado: mantém a leitura antiga, em que não
+        # ver a aba até o timeout significa que ela não existe.
+        logger.warning(
+            f"Detalhe do título sem lista de abas visível; Aba Autorização "
+            f"considerada ausente. Locator: {locator_cra_aba_autorizacao.xpath}"
         )
+        return False
 
-        xpath = "//tbody//tr//td//a[@data-original-title='Ver']"
-        nome_do_elemento = "Botão de Ver Detalhes do Título"
 
-        run_in_webdriver(
+def _fechar_detalhes(web_driver: WebDriver, timeout: int) -> None:
+    try:
+        run_step_sequence(
             web_driver=web_driver,
-            condition__list=[
-                AlternateCondition(
-                    timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
-                    webdriver_action=lambda el: click_action(web_element=el),
+            step__list=[
+                ClickStep(
+                    locator=locator_cra_fechar_detalhes_button,
+                    nome_do_elemento="Botão de Fechar Detalhes do Título",
                 ),
             ],
+            timeout=timeout,
+        )
+        return
+    except Exception as e:
+        logger.warning(
+            f"Não foi possível fechar a janela de detalhes, recarregando a página: {e}"
         )
 
-        xpath = "//ul//li//a[@href='#autorizacao']"
-        nome_do_elemento = "Aba Autorização"
-        encontrou_aba = False
-
-        try:
-            run_in_webdriver(
-                web_driver=web_driver,
-                condition__list=[
-                    AlternateCondition(
-                        timeout=timeout,
-                        condition=EC.visibility_of_element_located((By.XPATH, xpath)),
-                        webdriver_action=lambda el: el,
-                    )
-                ],
-            )
-
-            logger.debug(f"{nome_do_elemento} encontrada.")
-            encontrou_aba = True
-
-        except (TimeoutException, Exception):
-            logger.debug(f"{nome_do_elemento} não encontrada.")
-            encontrou_aba = False
-
-        try:
-            xpath = "//button[@id='fechar']"
-            nome_do_elemento = "Botão de Fechar Detalhes do Título"
-
-            run_in_webdriver(
-                web_driver=web_driver,
-                condition__list=[
-                    AlternateCondition(
-                        timeout=timeout,
-                        condition=EC.element_to_be_clickable((By.XPATH, xpath)),
-                        webdriver_action=lambda el: click_action(web_element=el),
-                    ),
-                ],
-            )
-        except Exception as e:
-            logger.warning(f"Não foi possível fechar a janela de detalhes: {e}")
+    try:
+        web_driver.refresh()
+    except WebDriverException as e:
+        logger.warning(f"Falha ao recarregar a página após o detalhe do título: {e}")
 
-        return encontrou_aba
 
+def cra_verificar_se_existe_aba_autorizacao(
+    web_driver: WebDriver,
+    cda: str,
+    timeout: int,
+    reaproveitar_tela_consulta: bool = False,
+    deadline: Deadline | None = None,
+) -> str | None:
+    """
+    Com `reaproveitar_tela_consulta`, se a tela "Consultar título" já estiver
+    aberta (CDA anterior na mesma sessão) a pesquisa é refeita nela, sem os
+    dois carregamentos do menu; o menu só é usado quando a tela não está no
+    estado esperado. Com `deadline`, todos os passos dividem o orçamento do
+    item em vez de cada um esperar `timeout` inteiro.
+    """
+    nome_do_elemento = "Aba Autorização"
+
+    if not (
+        reaproveitar_tela_consulta
+        and _pesquisar_na_tela_atual(web_driver, cda, timeout, deadline)
+    ):
+        run_step_sequence(
+            web_driver=web_driver,
+            step__list=_passos_navegacao() + _passos_pesquisa(cda),
+            timeout=timeout,
+            deadline=deadline,
+        )
 
-    except TimeoutException as e:
-        msg = f"O elemento '{nome_do_elemento}' não foi encontrado ou não ficou clicável. XPath: {xpath}"
-        raise TimeoutException(msg) from e
+    run_step_sequence(
+        web_driver=web_driver,
+        step__list=[
+            ClickStep(
+                locator=locator_cra_ver_detalhes_titulo_button,
+                nome_do_elemento="Botão de Ver Detalhes do Título",
+            ),
+        ],
+        timeout=timeout,
+        deadline=deadline,
+    )
 
-    except Exception as e:
-        msg = f"ERRO DESCONHECIDO em '{nome_do_elemento}': {e}"
-        raise Exception(msg) from e
+    try:
+        encontrou_aba = _verificar_aba_no_detalhe(web_driver, timeout, deadline)
+    finally:
+        # Fora do orçamento do item: com o modal aberto, o menu fica bloqueado
+        # e todas as CDAs seguintes deste navegador falhariam.
+        _fechar_detalhes(web_driver, timeout)
+
+    if encontrou_aba:
+        logger.debug(f"{nome_do_elemento} encontrada.")
+    else:
+        logger.debug(f"{nome_do_elemento} não encontrada.")
+
+    return encontrou_aba
@@ -0,0 +1,96 @@
+import logging
+from urllib.parse import urljoin
+
+import requests
+
+from modules.common.analisar_html import encontrar_elementos
+from modules.cra.exception import (
+    ExceptionCraHttpRespostaInesperada,
+    ExceptionCraHttpSessaoNaoAutenticada,
+)
+
+logger = logging.getLogger(__name__)
+
+STATUS_SESSAO_NAO_AUTENTICADA = (401, 403)
+
+
+def _validar_resposta(response: requests.Response) -> None:
+    if response.status_code in STATUS_SESSAO_NAO_AUTENTICADA:
+        raise ExceptionCraHttpSessaoNaoAutenticada(
+            f"Sessão HTTP não autenticada: HTTP {response.status_code}."
+        )
+    response.raise_for_status()
+
+
+def cra_verificar_se_existe_aba_autorizacao_http(
+    session: requests.Session,
+    consulta_titulo_url: str,
+    cda: str,
+    timeout: int,
+) -> bool:
+    """
+    Mesmo resultado de `cra_verificar_se_existe_aba_autorizacao`, mas buscando
+    o HTML da pesquisa e do detalhe do título diretamente, com os cookies da
+    sessão do navegador. Qualquer resposta fora do formato esperado levanta
+    `ExceptionCraHttpRespostaInesperada`, para que o chamador use o navegador;
+    cookies recusados levantam a subclasse `ExceptionCraHttpSessaoNaoAutenticada`.
+    """
+    response = session.get(
+        consulta_titulo_url,
+        params={"numeroTitulo": cda},
+        timeout=timeout,
+    )
+    _validar_resposta(response)
+
+    elementos = encontrar_elementos(response.text, {"a", "input"})
+
+    if any(
+        elemento["__tag__"] == "input" and elemento.get("id") == "login"
+        for elemento in elementos
+    ):
+        raise ExceptionCraHttpSessaoNaoAutenticada(
+            "Sessão HTTP não autenticada: página de login retornada."
+        )
+
+    links_ver = [
+        elemento
+        for elemento in elementos
+        if elemento["__tag__"] == "a" and elemento.get("data-original-title") == "Ver"
+    ]
+    if len(links_ver) != 1:
+        raise ExceptionCraHttpRespostaInesperada(
+            f"Esperado 1 link 'Ver' na pesquisa da CDA {cda}, encontrados {len(links_ver)}."
+        )
+
+    href = links_ver[0].get("href", "").strip()
+    if not href or href.startswith("#") or href.lower().startswith("javascript:"):
+        raise ExceptionCraHttpRespostaInesperada(
+            f"Link 'Ver' da CDA {cda} não aponta para uma URL: {href!r}"
+        )
+
+    response = session.get(urljoin(response.url, href), timeout=timeout)
+    _validar_resposta(response)
+
+    elementos = encontrar_elementos(response.text, {"a", "button"})
+
+    # O botão de fechar confirma que o HTML do detalhe veio completo; sem ele,
+    # a ausência da aba não é um resultado confiável.
+    if not any(
+        elemento["__tag__"] == "button" and elemento.get("id") == "fechar"
+        for elemento in elementos
+    ):
+        raise ExceptionCraHttpRespostaInesperada(
+            f"Detalhe da CDA {cda} sem o botão 'fechar'."
+        )
+
+    encontrou_aba = any(
+        elemento["__tag__"] == "a" and elemento.get("href") == "#autorizacao"
+        for elemento in elementos
+    )
+
+    if encontrou_aba:
+        logger.debug("Aba Autorização encontrada (HTTP).")
+    else:
+        logger.debug("Aba Autorização não encontrada (HTTP).")
+
+    return encontrou_aba
@@ -0,0 +1,19 @@
+class ExceptionCraApiFalhaAutenticacao(Exception):
+    def __init__(self):
+        super().__init__()
+
+
+class ExceptionCraApiEndpointNaoEncontrado(Exception):
+    def __init__(self, url: str):
+        super().__init__(url)
+        self.url = url
+
+
+class ExceptionCraHttpRespostaInesperada(Exception):
+    def __init__(self, mensagem: str):
+        super().__init__(mensagem)
+
+
+class ExceptionCraHttpSessaoNaoAutenticada(ExceptionCraHttpRespostaInesperada):
+    def __init__(self, mensagem: str):
+        super().__init__(mensagem)
@@ -1,15 +1,22 @@
 import logging
 
-from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support import expected_conditions as EC
 
 from modules.webdriver.run_in_webdriver import (
     AlternateCondition,
     run_in_webdriver,
 )
+from modules.webdriver.wait_condition import (
+    element_to_be_clickable,
+    presence_of_element_located,
+)
 
-from modules.cra.xpath import xpath_cra_logout_button
+from modules.cra.xpath import (
+    locator_cra_confirmar_button,
+    locator_cra_login_input,
+    locator_cra_logout_button,
+    locator_cra_senha_input,
+)
 
 from modules.webdriver.webelement_action.click_action import click_action
 from modules.webdriver.webelement_action.type_action import type_action
@@ -36,17 +43,12 @@ def log_in(
     web_driver.get(login_url)
 
     if skip_login_form is False:
-        xpath = """
-        //input[
-            @id='login'
-        ]
-        """
         run_in_webdriver(
             web_driver=web_driver,
             condition__list=[
                 AlternateCondition(
                     timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
+                    condition=element_to_be_clickable(locator_cra_login_input, timeout),
                     webdriver_action=lambda web_element: type_action(
                         web_element=web_element,
                         input_value=username,
@@ -55,17 +57,12 @@ def log_in(
             ],
         )
 
-        xpath = """
-        //input[
-            @id='senha'
-        ]
-        """
         run_in_webdriver(
             web_driver=web_driver,
             condition__list=[
                 AlternateCondition(
                     timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
+                    condition=element_to_be_clickable(locator_cra_senha_input, timeout),
                     webdriver_action=lambda web_element: type_action(
                         web_element=web_element,
                         input_value=password,
@@ -74,17 +71,14 @@ def log_in(
             ],
         )
 
-        xpath = """
-        //button[
-            @id='confirmar'
-        ]
-        """
         run_in_webdriver(
             web_driver=web_driver,
             condition__list=[
                 AlternateCondition(
                     timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
+                    condition=element_to_be_clickable(
+                        locator_cra_confirmar_button, timeout
+                    ),
                     webdriver_action=lambda web_element: click_action(
                         web_element=web_element
                     ),
@@ -99,8 +93,8 @@ def log_in(
         condition__list=[
             AlternateCondition(
                 timeout=timeout,
-                condition=EC.presence_of_element_located(
-                    (By.XPATH, xpath_cra_logout_button)
+                condition=presence_of_element_located(
+                    locator_cra_logout_button, timeout
                 ),
             ),
         ],
@@ -1,3 +1,98 @@
+from modules.webdriver.locator import register_locator
+
 xpath_cra_logout_button = """
 //a[normalize-space(.)='Sair']
-"""
\ No newline at end of file
+"""
+
+xpath_cra_login_input = """
+//input[
+    @id='login'
+]
+"""
+
+xpath_cra_senha_input = """
+//input[
+    @id='senha'
+]
+"""
+
+xpath_cra_confirmar_button = """
+//button[
+    @id='confirmar'
+]
+"""
+
+xpath_cra_menu_consulta = """
+//ul//li//a//span[
+    normalize-space(.)='Consulta'
+]
+"""
+
+xpath_cra_menu_consultar_titulo = """
+//li[
+    @id='ul_8_li_1'
+]//a[
+    normalize-space(.)='Consultar título'
+]
+"""
+
+xpath_cra_numero_titulo_input = """
+//thead//tr//th//input[
+    @id='numeroTitulo'
+]
+"""
+
+xpath_cra_buscar_titulo_button = """
+//thead//tr//th//button[
+    @type='submit'
+    and @data-original-title='Buscar'
+]
+"""
+
+xpath_cra_ver_detalhes_titulo_button = """
+//tbody//tr//td//a[
+    @data-original-title='Ver'
+]
+"""
+
+xpath_cra_aba_autorizacao = """
+//ul//li//a[
+    @href='#autorizacao'
+]
+"""
+
+xpath_cra_fechar_detalhes_button = """
+//button[
+    @id='fechar'
+]
+"""
+
+locator_cra_logout_button = register_locator(
+    "cra_logout_button", xpath_cra_logout_button
+)
+locator_cra_login_input = register_locator("cra_login_input", xpath_cra_login_input)
+locator_cra_senha_input = register_locator("cra_senha_input", xpath_cra_senha_input)
+locator_cra_confirmar_button = register_locator(
+    "cra_confirmar_button", xpath_cra_confirmar_button
+)
+locator_cra_menu_consulta = register_locator(
+    "cra_menu_consulta", xpath_cra_menu_consulta
+)
+locator_cra_menu_consultar_titulo = register_locator(
+    "cra_menu_consultar_titulo", xpath_cra_menu_consultar_titulo
+)
+locator_cra_numero_titulo_input = register_locator(
+    "cra_numero_titulo_input", xpath_cra_numero_titulo_input
+)
+locator_cra_buscar_titulo_button = register_locator(
+    "cra_buscar_titulo_button", xpath_cra_buscar_titulo_button
+)
+locator_cra_ver_detalhes_titulo_button = register_locator(
+    "cra_ver_detalhes_titulo_button", xpath_cra_ver_detalhes_titulo_button
+)
+locator_cra_aba_autorizacao = register_locator(
+    "cra_aba_autorizacao", xpath_cra_aba_autorizacao
+)
+locator_cra_fechar_detalhes_button = register_locator(
+    "cra_fechar_detalhes_button", xpath_cra_fechar_detalhes_button
+)
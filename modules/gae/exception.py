@@ -1,3 +1,18 @@
 class ExceptionLogInAvisoSenhaExpirada(Exception):
     def __init__(self):
         super().__init__()
+
+
+class ExceptionGaeHttpRespostaInesperada(Exception):
+    def __init__(self, mensagem: str):
+        super().__init__(mensagem)
+
+
+class ExceptionGaeHttpSessaoNaoAutenticada(ExceptionGaeHttpRespostaInesperada):
+    def __init__(self, mensagem: str):
+        super().__init__(mensagem)
+
+
+class ExceptionGaeTabelaDebitosInesperada(Exception):
+    def __init__(self, mensagem: str):
+        super().__init__(mensagem)
@@ -0,0 +1,48 @@
+import logging
+
+from modules.common.analisar_html import DtoTabelaHtml
+from modules.gae.exception import ExceptionGaeTabelaDebitosInesperada
+
+logger = logging.getLogger(__name__)
+
+CABECALHO_SITUACAO = "Situação"
+
+# Posição da coluna na grade atual do GAE, usada se o cabeçalho mudar de texto.
+COLUNA_SITUACAO_PADRAO = 11
+
+SITUACAO_LIQUIDADO = "LIQUIDADO"
+
+
+def gae_avaliar_situacao_debitos(tabela: DtoTabelaHtml, renavam: str) -> str | None:
+    """
+    Situação consolidada dos débitos do Renavam: LIQUIDADO só se todas as
+    linhas estiverem liquidadas; senão, a primeira situação diferente.
+    None se a pesquisa não trouxe nenhum débito.
+    """
+    if CABECALHO_SITUACAO in tabela.cabecalho:
+        coluna = tabela.cabecalho.index(CABECALHO_SITUACAO)
+    else:
+        coluna = COLUNA_SITUACAO_PADRAO
+
+    if not tabela.linhas:
+        logger.debug(f"Renavam: {renavam} - A tabela não possui débitos.")
+        return None
+
+    situacoes = []
+    for linha in tabela.linhas:
+        if len(linha) <= coluna:
+            raise ExceptionGaeTabelaDebitosInesperada(
+                f"Linha do Renavam {renavam} com {len(linha)} colunas: {linha}"
+            )
+        situacoes.append(linha[coluna].strip())
+
+    if len(situacoes) > 1:
+        logger.debug(
+            f"Renavam: {renavam} - {len(situacoes)} débitos, situações: {situacoes}"
+        )
+
+    for situacao in situacoes:
+        if situacao != SITUACAO_LIQUIDADO:
+            return situacao
+
+    return SITUACAO_LIQUIDADO
@@ -1,133 +1,174 @@
 import logging
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
 
+from modules.gae.exception import ExceptionGaeTabelaDebitosInesperada
+from modules.gae.gae_avaliar_situacao_debitos import gae_avaliar_situacao_debitos
+from modules.gae.gae_verificar_cda_liquidada_por_renavam_http import OPCOES_FIXAS
+from modules.gae.xpath import (
+    locator_gae_debito__ano_inicial_2010,
+    locator_gae_debito__doc_origem_divida_ativa,
+    locator_gae_debito__link_situacao,
+    locator_gae_debito__renavam_input,
+    locator_gae_debito__search_button,
+    locator_gae_debito__tipo_contribuinte_renavam,
+)
+from modules.webdriver.deadline import Deadline
+from modules.webdriver.exception import ExceptionStepFailed
+from modules.webdriver.extract_table import extract_table
 from modules.webdriver.run_in_webdriver import (
     AlternateCondition,
     run_in_webdriver,
 )
-from modules.webdriver.webelement_action.click_action import click_action
-from modules.webdriver.webelement_action.type_action import type_action
+from modules.webdriver.step_sequence import (
+    ClickStep,
+    SelectOptionStep,
+    TypeStep,
+    WaitForStep,
+    run_step_sequence,
+)
 
 logger = logging.getLogger(__name__)
 
+ID_TABELA_DEBITOS = "item"
+
+# Confere, numa única chamada, se cada select ainda tem a opção fixa escolhida.
+JS_OPCOES_FIXAS_MANTIDAS = """
+const esperado = arguments[0];
+for (const [nome, texto] of Object.entries(esperado)) {
+    const select = document.querySelector(`select[name="${nome}"]`);
+    const opcao = select && select.selectedOptions[0];
+    if (!opcao || opcao.text.trim() !== texto) return false;
+}
+return !!document.getElementById("codContribuinteFormatada");
+"""
+
+
+def _passos_opcoes_fixas() -> list:
+    return [
+        SelectOptionStep(
+            locator=locator_gae_debito__tipo_contribuinte_renavam,
+            nome_do_elemento="Opção de Tipo de Contribuinte",
+        ),
+        SelectOptionStep(
+            locator=locator_gae_debito__doc_origem_divida_ativa,
+            nome_do_elemento="Opção do Tipo do Documento de Origem",
+        ),
+        SelectOptionStep(
+            locator=locator_gae_debito__ano_inicial_2010,
+            nome_do_elemento="Ano Inicial",
+        ),
+    ]
+
+
+def _passos_pesquisa(renavam: str) -> list:
+    return [
+        TypeStep(
+            locator=locator_gae_debito__renavam_input,
+            nome_do_elemento="Campo de Renavam",
+            input_value=renavam,
+        ),
+        ClickStep(
+            locator=locator_gae_debito__search_button,
+            nome_do_elemento="Botão de Pesquisar",
+        ),
+    ]
+
+
+def _passo_resultado() -> WaitForStep:
+    return WaitForStep(
+        locator=locator_gae_debito__link_situacao,
+        nome_do_elemento="Link de Situação da Débito",
+    )
+
+
+def _pesquisar_no_formulario_atual(
+    web_driver: WebDriver, renavam: str, timeout: int, deadline: Deadline | None
+) -> bool:
+    """
+    Redigita só o Renavam e reenvia. False se o formulário não estiver na
+    página ou alguma opção fixa tiver mudado, para que a página seja recarregada.
+    """
+    web_driver.switch_to.default_content()
+    if not web_driver.execute_script(JS_OPCOES_FIXAS_MANTIDAS, OPCOES_FIXAS):
+        return False
+
+    # A tabela do Renavam anterior fica na página até o resultado novo chegar.
+    tabela_anterior = web_driver.find_elements(By.ID, ID_TABELA_DEBITOS)
 
-def gae_verificar_cda_liquidada_por_renavam(
-    web_driver: WebDriver,
-    renavam: str,
-    timeout: int,
-) -> str | None:
     try:
-        xpath = "//select[@name='tpContribuinte']//option[text()='RENAVAM']"
-        nome_do_elemento = "Opção de Tipo de Contribuinte"
-
-        run_in_webdriver(
+        run_step_sequence(
             web_driver=web_driver,
-            condition__list=[
-                AlternateCondition(
-                    timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
-                    webdriver_action=lambda el: click_action(web_element=el),
-                ),
-            ],
+            step__list=_passos_pesquisa(renavam),
+            timeout=timeout,
+            deadline=deadline,
         )
-
-        xpath = "//input[@id='codContribuinteFormatada']"
-        nome_do_elemento = "Campo de Renavam"
-
-        run_in_webdriver(
-            web_driver=web_driver,
-            condition__list=[
-                AlternateCondition(
-                    timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
-                    webdriver_action=lambda web_element: type_action(
-                        web_element=web_element,
-                        input_value=renavam,
+        if tabela_anterior:
+            run_in_webdriver(
+                web_driver=web_driver,
+                condition__list=[
+                    AlternateCondition(
+                        timeout=timeout,
+                        condition=EC.staleness_of(tabela_anterior[0]),
                     ),
-                ),
-            ],
-        )
-
-        xpath = "//select[@name='tpDocOrigem']//option[text()='20 - Dívida Ativa']"
-        nome_do_elemento = "Opção do Tipo do Documento de Origem"
-
-        run_in_webdriver(
+                ],
+                deadline=deadline,
+            )
+        run_step_sequence(
             web_driver=web_driver,
-            condition__list=[
-                AlternateCondition(
-                    timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
-                    webdriver_action=lambda el: click_action(web_element=el),
-                ),
-            ],
+            step__list=[_passo_resultado()],
+            timeout=timeout,
+            deadline=deadline,
         )
-
-        xpath = "//select[@name='anoInicial']//option[text()='2010']"
-        nome_do_elemento = "Ano Inicial"
-
-        run_in_webdriver(
-            web_driver=web_driver,
-            condition__list=[
-                AlternateCondition(
-                    timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
-                    webdriver_action=lambda el: click_action(web_element=el),
-                ),
-            ],
+    except (TimeoutException, ExceptionStepFailed) as e:
+        logger.warning(
+            f"Formulário de débito fora do estado esperado, recarregando: {e}"
         )
+        return False
 
-        xpath = "//input[@id='search']"
-        nome_do_elemento = "Botão de Pesquisar"
-
-        run_in_webdriver(
-            web_driver=web_driver,
-            condition__list=[
-                AlternateCondition(
-                    timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
-                    webdriver_action=lambda el: click_action(web_element=el),
-                ),
-            ],
-        )
+    logger.debug("Pesquisa feita no formulário de débito já preenchido.")
+    return True
 
-        xpath = "//a[text()='Situação']"
-        nome_do_elemento = "Link de Situação da Débito"
 
-        run_in_webdriver(
+def gae_verificar_cda_liquidada_por_renavam(
+    web_driver: WebDriver,
+    renavam: str,
+    timeout: int,
+    debito_conta_corrente_url: str,
+    reaproveitar_formulario: bool = False,
+    deadline: Deadline | None = None,
+) -> str | None:
+    """
+    Com `reaproveitar_formulario`, as opções fixas (RENAVAM, "20 - Dívida
+    Ativa", 2010) ficam escolhidas entre um Renavam e outro: se continuarem
+    valendo, só o Renavam é redigitado, sem recarregar a página. Com
+    `deadline`, todos os passos dividem o orçamento do item.
+    """
+    if not (
+        reaproveitar_formulario
+        and _pesquisar_no_formulario_atual(web_driver, renavam, timeout, deadline)
+    ):
+        if deadline is not None:
+            deadline.check("Formulário de débito")
+        web_driver.get(debito_conta_corrente_url)
+
+        run_step_sequence(
             web_driver=web_driver,
-            condition__list=[
-                AlternateCondition(
-                    timeout=timeout,
-                    condition=EC.visibility_of_element_located((By.XPATH, xpath)),
-                    webdriver_action=lambda el: el,
-                ),
+            step__list=[
+                *_passos_opcoes_fixas(),
+                *_passos_pesquisa(renavam),
+                _passo_resultado(),
             ],
+            timeout=timeout,
+            deadline=deadline,
         )
 
-        xpath = "//table[@id='item']"
-        linhas = web_driver.find_elements(By.XPATH, f"{xpath}/tbody/tr")
-        qtd_linhas = len(linhas)
-
-        if qtd_linhas != 1:
-            logger.debug(
-                f"Renavam: {renavam} - A tabela não possui exatamente uma linha. Ignorando extração."
-            )
-            return None
-
-        xpath = "//table[@id='item']/tbody/tr[1]/td[12]"
-
-        situacao_debito_element = web_driver.find_element(By.XPATH, xpath)
-        situacao_debito = situacao_debito_element.text.strip()
-
-        return situacao_debito
-
-    except TimeoutException as e:
-        msg = f"O elemento '{nome_do_elemento}' não foi encontrado ou não ficou clicável. XPath: {xpath}"
-        raise TimeoutException(msg) from e
+    tabela = extract_table(web_driver, ID_TABELA_DEBITOS)
+    if tabela is None:
+        raise ExceptionGaeTabelaDebitosInesperada(
+            f"Resultado da pesquisa do Renavam {renavam} sem a tabela '{ID_TABELA_DEBITOS}'."
+        )
 
-    except Exception as e:
-        msg = f"ERRO DESCONHECIDO em '{nome_do_elemento}': {e}"
-        raise Exception(msg) from e
+    return gae_avaliar_situacao_debitos(tabela, renavam)
@@ -0,0 +1,114 @@
+import logging
+from urllib.parse import urljoin
+
+import requests
+
+from modules.common.analisar_html import (
+    DtoFormularioHtml,
+    encontrar_elementos,
+    extrair_formularios,
+    extrair_tabela,
+)
+from modules.gae.exception import (
+    ExceptionGaeHttpRespostaInesperada,
+    ExceptionGaeHttpSessaoNaoAutenticada,
+)
+from modules.gae.gae_avaliar_situacao_debitos import gae_avaliar_situacao_debitos
+
+logger = logging.getLogger(__name__)
+
+CAMPO_RENAVAM = "codContribuinteFormatada"
+
+OPCOES_FIXAS = {
+    "tpContribuinte": "RENAVAM",
+    "tpDocOrigem": "20 - Dívida Ativa",
+    "anoInicial": "2010",
+}
+
+
+STATUS_SESSAO_NAO_AUTENTICADA = (401, 403)
+
+
+def _validar_sessao(response: requests.Response) -> None:
+    if response.status_code in STATUS_SESSAO_NAO_AUTENTICADA:
+        raise ExceptionGaeHttpSessaoNaoAutenticada(
+            f"Sessão HTTP não autenticada: HTTP {response.status_code}."
+        )
+    response.raise_for_status()
+
+    if any(
+        elemento.get("id") == "username"
+        for elemento in encontrar_elementos(response.text, {"input"})
+    ):
+        raise ExceptionGaeHttpSessaoNaoAutenticada(
+            "Sessão HTTP não autenticada: página de login do SSO retornada."
+        )
+
+
+def gae_obter_formulario_debito_http(
+    session: requests.Session,
+    debito_conta_corrente_url: str,
+    timeout: int,
+) -> DtoFormularioHtml:
+    """
+    Baixa a tela de débito conta corrente e devolve o formulário de pesquisa
+    já com as opções fixas (RENAVAM, "20 - Dívida Ativa", 2010) preenchidas.
+    O resultado pode ser reaproveitado em todas as consultas da sessão.
+    """
+    response = session.get(debito_conta_corrente_url, timeout=timeout)
+    _validar_sessao(response)
+
+    formularios = [
+        formulario
+        for formulario in extrair_formularios(response.text)
+        if CAMPO_RENAVAM in formulario.campos
+    ]
+    if len(formularios) != 1:
+        raise ExceptionGaeHttpRespostaInesperada(
+            f"Esperado 1 formulário com '{CAMPO_RENAVAM}', encontrados {len(formularios)}."
+        )
+
+    formulario = formularios[0]
+    formulario.action = urljoin(response.url, formulario.action or response.url)
+
+    for campo, texto in OPCOES_FIXAS.items():
+        valor = formulario.opcoes.get(campo, {}).get(texto)
+        if valor is None:
+            raise ExceptionGaeHttpRespostaInesperada(
+                f"Opção '{texto}' não encontrada em '{campo}'."
+            )
+        formulario.campos[campo] = valor
+
+    if "search" in formulario.botoes:
+        nome, valor = formulario.botoes["search"]
+        formulario.campos[nome] = valor
+
+    return formulario
+
+
+def gae_verificar_cda_liquidada_por_renavam_http(
+    session: requests.Session,
+    formulario: DtoFormularioHtml,
+    renavam: str,
+    timeout: int,
+) -> str | None:
+    """
+    Envia o formulário de pesquisa direto ao GAE e avalia a coluna de situação
+    de `table#item` no HTML devolvido. Mesmo retorno de
+    `gae_verificar_cda_liquidada_por_renavam`.
+    """
+    campos = {**formulario.campos, CAMPO_RENAVAM: renavam}
+
+    if formulario.method == "post":
+        response = session.post(formulario.action, data=campos, timeout=timeout)
+    else:
+        response = session.get(formulario.action, params=campos, timeout=timeout)
+    _validar_sessao(response)
+
+    tabela = extrair_tabela(response.text, "item")
+    if tabela is None or "Situação" not in tabela.cabecalho:
+        raise ExceptionGaeHttpRespostaInesperada(
+            f"Resultado da pesquisa do Renavam {renavam} sem a tabela 'item'."
+        )
+
+    return gae_avaliar_situacao_debitos(tabela, renavam)
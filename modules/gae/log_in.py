@@ -1,21 +1,28 @@
 import logging
 
-from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
 
+from modules.webdriver.locator import timed_condition
 from modules.webdriver.run_in_webdriver import (
     AlternateCondition,
     run_in_webdriver,
 )
+from modules.webdriver.wait_condition import (
+    element_to_be_clickable,
+    visibility_of_element_located,
+)
 from modules.webdriver.webelement_action.click_action import click_action
 from modules.webdriver.webelement_action.type_action import type_action
 from modules.gae.exception import ExceptionLogInAvisoSenhaExpirada
 from modules.gae.xpath import (
-    xpath_gae_app_name_header,
-    xpath_sefaz_sso_login_button,
-    xpath_sefaz_sso_logout_button,
-    xpath_sefaz_sso_login__aviso_senha_expirada,
+    locator_gae_app_name_header,
+    locator_sefaz_sso_link_gae,
+    locator_sefaz_sso_login_button,
+    locator_sefaz_sso_logout_button,
+    locator_sefaz_sso_login__aviso_senha_expirada,
+    locator_sefaz_sso_password_input,
+    locator_sefaz_sso_username_input,
 )
 
 logger = logging.getLogger(__name__)
@@ -40,17 +47,14 @@ def log_in(
     web_driver.get(login_url)
 
     if skip_login_form is False:
-        xpath = """
-        //input[
-            @id='username'
-        ]
-        """
         run_in_webdriver(
             web_driver=web_driver,
             condition__list=[
                 AlternateCondition(
                     timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
+                    condition=element_to_be_clickable(
+                        locator_sefaz_sso_username_input, timeout
+                    ),
                     webdriver_action=lambda web_element: type_action(
                         web_element=web_element,
                         input_value=username,
@@ -59,17 +63,14 @@ def log_in(
             ],
         )
 
-        xpath = """
-        //input[
-            @id='password'
-        ]
-        """
         run_in_webdriver(
             web_driver=web_driver,
             condition__list=[
                 AlternateCondition(
                     timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
+                    condition=element_to_be_clickable(
+                        locator_sefaz_sso_password_input, timeout
+                    ),
                     webdriver_action=lambda web_element: type_action(
                         web_element=web_element,
                         input_value=password,
@@ -78,13 +79,14 @@ def log_in(
             ],
         )
 
-        xpath = xpath_sefaz_sso_login_button
         run_in_webdriver(
             web_driver=web_driver,
             condition__list=[
                 AlternateCondition(
                     timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
+                    condition=element_to_be_clickable(
+                        locator_sefaz_sso_login_button, timeout
+                    ),
                     webdriver_action=lambda web_element: click_action(
                         web_element=web_element
                     ),
@@ -94,39 +96,45 @@ def log_in(
 
     logger.debug("Waiting for login confirmation...")
 
+    # first_match polls each alternate in turn, so these keep the non-blocking
+    # polling conditions instead of the in-page waiter.
     run_in_webdriver(
         web_driver=web_driver,
         condition__list=[
             AlternateCondition(
                 timeout=timeout,
-                condition=EC.visibility_of_element_located(
-                    (By.XPATH, xpath_sefaz_sso_logout_button)
+                condition=timed_condition(
+                    locator_sefaz_sso_logout_button,
+                    EC.visibility_of_element_located(
+                        locator_sefaz_sso_logout_button.locator
+                    ),
                 ),
             ),
             AlternateCondition(
-                timeout=1,
-                condition=EC.visibility_of_element_located(
-                    (By.XPATH, xpath_sefaz_sso_login__aviso_senha_expirada)
+                timeout=timeout,
+                condition=timed_condition(
+                    locator_sefaz_sso_login__aviso_senha_expirada,
+                    EC.visibility_of_element_located(
+                        locator_sefaz_sso_login__aviso_senha_expirada.locator
+                    ),
                 ),
                 exception_to_raise=ExceptionLogInAvisoSenhaExpirada(),
             ),
         ],
+        first_match=True,
     )
 
     logger.info("SEFAZ SSO login successful.")
 
     if skip_login_form is False:
-        xpath = """
-        //a[
-            normalize-space(.) = 'Gestão da Arrecadação Estadual'
-        ]
-        """
         run_in_webdriver(
             web_driver=web_driver,
             condition__list=[
                 AlternateCondition(
                     timeout=timeout,
-                    condition=EC.element_to_be_clickable((By.XPATH, xpath)),
+                    condition=element_to_be_clickable(
+                        locator_sefaz_sso_link_gae, timeout
+                    ),
                     webdriver_action=lambda web_element: click_action(
                         web_element=web_element,
                         open_in_the_same_tab=True,
@@ -135,13 +143,14 @@ def log_in(
             ],
         )
 
-        xpath = xpath_gae_app_name_header
         run_in_webdriver(
             web_driver=web_driver,
             condition__list=[
                 AlternateCondition(
                     timeout=timeout,
-                    condition=EC.visibility_of_element_located((By.XPATH, xpath)),
+                    condition=visibility_of_element_located(
+                        locator_gae_app_name_header, timeout
+                    ),
                 ),
             ],
         )
@@ -1,3 +1,5 @@
+from modules.webdriver.locator import register_locator
+
 xpath_search_extrato_cda_error_page = """
 //table[
     .//td[
@@ -65,3 +67,105 @@ xpath__extrato_debito_nao_liquidado__sem_debito = """
     normalize-space(text())='Nenhum registro encontrado'
 ]
 """
+
+xpath_sefaz_sso_username_input = """
+//input[
+    @id='username'
+]
+"""
+
+xpath_sefaz_sso_password_input = """
+//input[
+    @id='password'
+]
+"""
+
+xpath_sefaz_sso_link_gae = """
+//a[
+    normalize-space(.) = 'Gestão da Arrecadação Estadual'
+]
+"""
+
+xpath_gae_debito__tipo_contribuinte_renavam = """
+//select[
+    @name='tpContribuinte'
+]//option[
+    text()='RENAVAM'
+]
+"""
+
+xpath_gae_debito__renavam_input = """
+//input[
+    @id='codContribuinteFormatada'
+]
+"""
+
+xpath_gae_debito__doc_origem_divida_ativa = """
+//select[
+    @name='tpDocOrigem'
+]//option[
+    text()='20 - Dívida Ativa'
+]
+"""
+
+xpath_gae_debito__ano_inicial_2010 = """
+//select[
+    @name='anoInicial'
+]//option[
+    text()='2010'
+]
+"""
+
+xpath_gae_debito__search_button = """
+//input[
+    @id='search'
+]
+"""
+
+xpath_gae_debito__link_situacao = """
+//a[
+    text()='Situação'
+]
+"""
+
+locator_gae_app_name_header = register_locator(
+    "gae_app_name_header", xpath_gae_app_name_header
+)
+locator_sefaz_sso_login_button = register_locator(
+    "sefaz_sso_login_button", xpath_sefaz_sso_login_button
+)
+locator_sefaz_sso_logout_button = register_locator(
+    "sefaz_sso_logout_button", xpath_sefaz_sso_logout_button
+)
+locator_sefaz_sso_login__aviso_senha_expirada = register_locator(
+    "sefaz_sso_login__aviso_senha_expirada",
+    xpath_sefaz_sso_login__aviso_senha_expirada,
+)
+locator_sefaz_sso_username_input = register_locator(
+    "sefaz_sso_username_input", xpath_sefaz_sso_username_input
+)
+locator_sefaz_sso_password_input = register_locator(
+    "sefaz_sso_password_input", xpath_sefaz_sso_password_input
+)
+locator_sefaz_sso_link_gae = register_locator(
+    "sefaz_sso_link_gae", xpath_sefaz_sso_link_gae
+)
+locator_gae_debito__tipo_contribuinte_renavam = register_locator(
+    "gae_debito__tipo_contribuinte_renavam",
+    xpath_gae_debito__tipo_contribuinte_renavam,
+)
+locator_gae_debito__renavam_input = register_locator(
+    "gae_debito__renavam_input", xpath_gae_debito__renavam_input
+)
+locator_gae_debito__doc_origem_divida_ativa = register_locator(
+    "gae_debito__doc_origem_divida_ativa", xpath_gae_debito__doc_origem_divida_ativa
+)
+locator_gae_debito__ano_inicial_2010 = register_locator(
+    "gae_debito__ano_inicial_2010", xpath_gae_debito__ano_inicial_2010
+)
+locator_gae_debito__search_button = register_locator(
+    "gae_debito__search_button", xpath_gae_debito__search_button
+)
+locator_gae_debito__link_situacao = register_locator(
+    "gae_debito__link_situacao", xpath_gae_debito__link_situacao
+)
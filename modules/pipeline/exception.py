@@ -0,0 +1,4 @@
+class ExceptionNenhumNavegadorDisponivel(Exception):
+    def __init__(self, nome: str):
+        super().__init__(f"Nenhum navegador do pool '{nome}' conseguiu iniciar.")
+        self.nome = nome
@@ -0,0 +1,88 @@
+import asyncio
+import contextvars
+import logging
+import queue
+import threading
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+INTERVALO_VERIFICACAO_CANCELAMENTO = 0.2
+
+_FIM = object()
+
+
+@dataclass
+class _FalhaNoProdutor:
+    erro: BaseException
+
+
+def executar_async_em_segundo_plano(
+    iteravel_async: AsyncIterator[T],
+    tamanho_fila: int,
+    nome: str,
+) -> Iterator[T]:
+    """
+    Equivalente de `executar_em_segundo_plano` para um iterador assíncrono:
+    uma thread própria roda o event loop e repassa cada item pela fila assim
+    que ele fica pronto. Com a fila cheia, a espera acontece fora do loop,
+    para que as requisições em andamento continuem progredindo.
+    """
+    if not isinstance(tamanho_fila, int) or tamanho_fila <= 0:
+        raise ValueError("tamanho_fila must be a positive integer")
+
+    fila: queue.Queue = queue.Queue(maxsize=tamanho_fila)
+    cancelado = threading.Event()
+
+    def enfileirar(item: object) -> bool:
+        while not cancelado.is_set():
+            try:
+                fila.put(item, timeout=INTERVALO_VERIFICACAO_CANCELAMENTO)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    async def produzir() -> None:
+        try:
+            async for item in iteravel_async:
+                try:
+                    fila.put_nowait(item)
+                except queue.Full:
+                    if not await asyncio.to_thread(enfileirar, item):
+                        return
+                if cancelado.is_set():
+                    return
+        except BaseException as e:
+            enfileirar(_FalhaNoProdutor(erro=e))
+        else:
+            enfileirar(_FIM)
+        finally:
+            fechar = getattr(iteravel_async, "aclose", None)
+            if fechar is not None:
+                await fechar()
+
+    contexto = contextvars.copy_context()
+    thread = threading.Thread(
+        target=contexto.run,
+        args=(asyncio.run, produzir()),
+        name=nome,
+        daemon=True,
+    )
+    thread.start()
+
+    try:
+        while True:
+            item = fila.get()
+            if item is _FIM:
+                return
+            if isinstance(item, _FalhaNoProdutor):
+                raise item.erro
+            yield item
+    finally:
+        cancelado.set()
+        thread.join()
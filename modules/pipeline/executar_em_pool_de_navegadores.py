@@ -0,0 +1,138 @@
+import contextvars
+import logging
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import TypeVar
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from modules.pipeline.exception import ExceptionNenhumNavegadorDisponivel
+from modules.webdriver.close_webdriver import close_webdriver
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+INTERVALO_VERIFICACAO_CANCELAMENTO = 0.2
+
+_FIM_DO_NAVEGADOR = object()
+
+
+@dataclass
+class _FalhaNaEntrada:
+    erro: BaseException
+
+
+def executar_em_pool_de_navegadores(
+    itens: Iterable[T],
+    quantidade_de_navegadores: int,
+    iniciar_navegador: Callable[[], WebDriver],
+    processar_item: Callable[[WebDriver, T, str], R | None],
+    nome: str,
+) -> Iterator[R]:
+    """
+    Distribui `itens` dinamicamente entre `quantidade_de_navegadores` sessões
+    independentes: cada navegador é iniciado (e autenticado) uma única vez por
+    `iniciar_navegador` e pega o próximo item assim que termina o anterior.
+
+    `processar_item(web_driver, item, nome_do_navegador)` deve tratar as falhas
+    do próprio item; os resultados diferentes de None são devolvidos em ordem
+    de conclusão. Um navegador que falha ao iniciar ou com erro inesperado é
+    encerrado sem afetar os demais.
+    """
+    if not isinstance(quantidade_de_navegadores, int) or quantidade_de_navegadores <= 0:
+        raise ValueError("quantidade_de_navegadores must be a positive integer")
+
+    iterador = iter(itens)
+    lock_iterador = threading.Lock()
+    fila: queue.Queue = queue.Queue(maxsize=2 * quantidade_de_navegadores)
+    cancelado = threading.Event()
+    entrada_esgotada = False
+
+    def proximo_item() -> tuple[bool, T | None]:
+        nonlocal entrada_esgotada
+        with lock_iterador:
+            if entrada_esgotada or cancelado.is_set():
+                return False, None
+            try:
+                return True, next(iterador)
+            except StopIteration:
+                entrada_esgotada = True
+                return False, None
+            except BaseException as e:
+                entrada_esgotada = True
+                enfileirar(_FalhaNaEntrada(erro=e))
+                return False, None
+
+    def enfileirar(item: object) -> None:
+        while not cancelado.is_set():
+            try:
+                fila.put(item, timeout=INTERVALO_VERIFICACAO_CANCELAMENTO)
+                return
+            except queue.Full:
+                continue
+
+    def trabalhar(nome_do_navegador: str) -> None:
+        web_driver = None
+        try:
+            logger.debug(f"Iniciando navegador {nome_do_navegador}.")
+            web_driver = iniciar_navegador()
+
+            while True:
+                tem_item, item = proximo_item()
+                if not tem_item:
+                    break
+                resultado = processar_item(web_driver, item, nome_do_navegador)
+                if resultado is not None:
+                    enfileirar(resultado)
+
+        except Exception as e:
+            logger.exception(
+                f"Navegador {nome_do_navegador} encerrado por falha: "
+                f"{e.__class__.__name__}: {e}"
+            )
+        finally:
+            close_webdriver(web_driver=web_driver)
+            fila.put(_FIM_DO_NAVEGADOR)
+
+    threads = []
+    for indice in range(1, quantidade_de_navegadores + 1):
+        nome_do_navegador = f"{nome}-{indice}"
+        contexto = contextvars.copy_context()
+        thread = threading.Thread(
+            target=contexto.run,
+            args=(trabalhar, nome_do_navegador),
+            name=nome_do_navegador,
+            daemon=True,
+        )
+        thread.start()
+        threads.append(thread)
+
+    navegadores_ativos = len(threads)
+    try:
+        while navegadores_ativos:
+            item = fila.get()
+            if item is _FIM_DO_NAVEGADOR:
+                navegadores_ativos -= 1
+                continue
+            if isinstance(item, _FalhaNaEntrada):
+                raise item.erro
+            yield item
+
+        if not entrada_esgotada:
+            raise ExceptionNenhumNavegadorDisponivel(nome)
+    finally:
+        cancelado.set()
+        while any(thread.is_alive() for thread in threads):
+            try:
+                fila.get(timeout=INTERVALO_VERIFICACAO_CANCELAMENTO)
+            except queue.Empty:
+                continue
+        for thread in threads:
+            thread.join()
+        fechar = getattr(iterador, "close", None)
+        if fechar is not None:
+            fechar()
@@ -0,0 +1,84 @@
+import contextvars
+import logging
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+INTERVALO_VERIFICACAO_CANCELAMENTO = 0.2
+
+_FIM = object()
+
+
+@dataclass
+class _FalhaNoProdutor:
+    erro: BaseException
+
+
+def executar_em_segundo_plano(
+    iteravel: Iterable[T],
+    tamanho_fila: int,
+    nome: str,
+) -> Iterator[T]:
+    """
+    Consome `iteravel` numa thread própria e repassa os itens por uma fila
+    limitada a `tamanho_fila`, para que a etapa seguinte comece a trabalhar
+    assim que o primeiro item estiver pronto. Exceções da etapa de origem são
+    relançadas no consumidor; se o consumidor parar antes do fim, a etapa de
+    origem é encerrada (e fechada) no próximo item.
+    """
+    if not isinstance(tamanho_fila, int) or tamanho_fila <= 0:
+        raise ValueError("tamanho_fila must be a positive integer")
+
+    fila: queue.Queue = queue.Queue(maxsize=tamanho_fila)
+    cancelado = threading.Event()
+
+    def enfileirar(item: object) -> bool:
+        while not cancelado.is_set():
+            try:
+                fila.put(item, timeout=INTERVALO_VERIFICACAO_CANCELAMENTO)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produzir() -> None:
+        iterador = iter(iteravel)
+        try:
+            for item in iterador:
+                if not enfileirar(item):
+                    return
+        except BaseException as e:
+            enfileirar(_FalhaNoProdutor(erro=e))
+        else:
+            enfileirar(_FIM)
+        finally:
+            fechar = getattr(iterador, "close", None)
+            if fechar is not None:
+                fechar()
+
+    contexto = contextvars.copy_context()
+    thread = threading.Thread(
+        target=contexto.run,
+        args=(produzir,),
+        name=nome,
+        daemon=True,
+    )
+    thread.start()
+
+    try:
+        while True:
+            item = fila.get()
+            if item is _FIM:
+                return
+            if isinstance(item, _FalhaNoProdutor):
+                raise item.erro
+            yield item
+    finally:
+        cancelado.set()
+        thread.join()
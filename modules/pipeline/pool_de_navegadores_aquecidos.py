@@ -0,0 +1,177 @@
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from modules.webdriver.close_webdriver import close_webdriver
+
+logger = logging.getLogger(__name__)
+
+# Falhas seguidas ao iniciar que suspendem a reposição em segundo plano;
+# `retirar` passa a iniciar na hora, e o erro chega a quem pediu o navegador.
+LIMITE_FALHAS_SEGUIDAS = 3
+
+
+class PoolDeNavegadoresAquecidos:
+    """
+    Mantém até `quantidade` navegadores já iniciados (e, conforme
+    `iniciar_navegador`, autenticados) em segundo plano, para que `retirar`
+    devolva um deles sem esperar o Firefox e o geckodriver subirem. Cada
+    retirada dispara a reposição, até `limite_de_navegadores` iniciados no
+    total (None = sem limite).
+
+    Navegadores parados há mais de `ociosidade_maxima_segundos` (0 = sem
+    limite) ou que não respondem são descartados na retirada. Quando não há
+    navegador pronto nem sendo iniciado, `retirar` inicia um na hora.
+    """
+
+    def __init__(
+        self,
+        iniciar_navegador: Callable[[], WebDriver],
+        quantidade: int,
+        nome: str,
+        limite_de_navegadores: int | None = None,
+        ociosidade_maxima_segundos: float = 0,
+    ):
+        if not isinstance(quantidade, int) or quantidade <= 0:
+            raise ValueError("quantidade must be a positive integer")
+        if limite_de_navegadores is not None and limite_de_navegadores <= 0:
+            raise ValueError("limite_de_navegadores must be a positive integer or None")
+        if ociosidade_maxima_segundos < 0:
+            raise ValueError("ociosidade_maxima_segundos must be zero or positive")
+
+        self.iniciar_navegador = iniciar_navegador
+        self.quantidade = quantidade
+        self.nome = nome
+        self.limite_de_navegadores = limite_de_navegadores
+        self.ociosidade_maxima_segundos = ociosidade_maxima_segundos
+
+        self._condicao = threading.Condition()
+        self._prontos: deque[tuple[WebDriver, float]] = deque()
+        self._iniciando = 0
+        self._iniciados = 0
+        self._falhas_seguidas = 0
+        self._encerrado = False
+
+        with self._condicao:
+            self._repor()
+
+    def _pode_iniciar(self) -> bool:
+        return (
+            not self._encerrado
+            and self._falhas_seguidas < LIMITE_FALHAS_SEGUIDAS
+            and (
+                self.limite_de_navegadores is None
+                or self._iniciados < self.limite_de_navegadores
+            )
+        )
+
+    def _repor(self) -> None:
+        # Chamado com `_condicao` adquirida.
+        while (
+            len(self._prontos) + self._iniciando < self.quantidade
+            and self._pode_iniciar()
+        ):
+            self._iniciando += 1
+            self._iniciados += 1
+            nome_da_thread = f"{self.nome}-aquecendo-{self._iniciados}"
+            contexto = contextvars.copy_context()
+            thread = threading.Thread(
+                target=contexto.run,
+                args=(self._aquecer, nome_da_thread),
+                name=nome_da_thread,
+                daemon=True,
+            )
+            thread.start()
+
+    def _aquecer(self, nome_da_thread: str) -> None:
+        web_driver = None
+        try:
+            logger.debug(f"Aquecendo navegador {nome_da_thread}.")
+            web_driver = self.iniciar_navegador()
+        except Exception as e:
+            logger.warning(
+                f"Falha ao aquecer navegador {nome_da_thread}: "
+                f"{e.__class__.__name__}: {e}"
+            )
+
+        with self._condicao:
+            self._iniciando -= 1
+            if web_driver is None:
+                self._falhas_seguidas += 1
+                if self._falhas_seguidas == LIMITE_FALHAS_SEGUIDAS:
+                    logger.warning(
+                        f"Pool '{self.nome}': {LIMITE_FALHAS_SEGUIDAS} falhas seguidas, "
+                        f"reposição em segundo plano suspensa."
+                    )
+            else:
+                self._falhas_seguidas = 0
+                if not self._encerrado:
+                    self._prontos.append((web_driver, time.monotonic()))
+                    web_driver = None
+            self._condicao.notify_all()
+
+        if web_driver is not None:
+            # Pool encerrado enquanto o navegador iniciava.
+            close_webdriver(web_driver=web_driver)
+
+    def _navegador_utilizavel(self, web_driver: WebDriver, pronto_em: float) -> bool:
+        ocioso_por = time.monotonic() - pronto_em
+        if (
+            self.ociosidade_maxima_segundos
+            and ocioso_por > self.ociosidade_maxima_segundos
+        ):
+            logger.debug(
+                f"Navegador aquecido ocioso há {ocioso_por:.0f} s, descartando."
+            )
+            return False
+        try:
+            web_driver.current_url
+        except WebDriverException as e:
+            logger.debug(
+                f"Navegador aquecido não responde, descartando: {e.__class__.__name__}"
+            )
+            return False
+        return True
+
+    def retirar(self) -> WebDriver:
+        """Devolve um navegador aquecido, esperando um que já esteja iniciando."""
+        while True:
+            with self._condicao:
+                if self._encerrado:
+                    raise RuntimeError(f"Pool '{self.nome}' already closed")
+                self._repor()
+                while not self._prontos and self._iniciando:
+                    self._condicao.wait()
+
+                if not self._prontos:
+                    break
+                web_driver, pronto_em = self._prontos.popleft()
+                self._repor()
+
+            if self._navegador_utilizavel(web_driver, pronto_em):
+                logger.debug(f"Navegador aquecido retirado do pool '{self.nome}'.")
+                return web_driver
+            close_webdriver(web_driver=web_driver)
+
+        logger.debug(f"Pool '{self.nome}' sem navegador aquecido, iniciando na hora.")
+        return self.iniciar_navegador()
+
+    def encerrar(self) -> None:
+        """Para a reposição e fecha os navegadores que não foram retirados."""
+        with self._condicao:
+            self._encerrado = True
+            prontos = [web_driver for web_driver, _ in self._prontos]
+            self._prontos.clear()
+            self._condicao.notify_all()
+
+        for web_driver in prontos:
+            close_webdriver(web_driver=web_driver)
+        logger.debug(
+            f"Pool '{self.nome}' encerrado; {len(prontos)} navegador(es) ocioso(s) fechado(s)."
+        )
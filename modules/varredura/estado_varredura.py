@@ -0,0 +1,119 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+VEREDITO_AUTORIZADO = "AUTORIZADO"
+VEREDITO_LIQUIDADO = "LIQUIDADO"
+VEREDITO_NAO_LIQUIDADO = "NAO_LIQUIDADO"
+
+
+class EstadoVarredura:
+    """
+    Estado persistido entre execuções: a última ocorrência vista de cada CDA
+    (`retornos[-1].ocorrencia`) e o último veredito das etapas no navegador.
+
+    Uma CDA só volta às etapas do Selenium quando a ocorrência muda (o que
+    descarta o veredito anterior) ou quando o veredito fica mais velho que
+    `veredito_ttl_segundos`.
+    """
+
+    def __init__(self, caminho: str, veredito_ttl_segundos: float):
+        if veredito_ttl_segundos < 0:
+            raise ValueError("veredito_ttl_segundos must be zero or positive")
+
+        Path(caminho).parent.mkdir(parents=True, exist_ok=True)
+
+        self.caminho = caminho
+        self.veredito_ttl_segundos = veredito_ttl_segundos
+
+        self._lock = threading.Lock()
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.execute(
+            """
+            CREATE TABLE IF NOT EXISTS estado_cda (
+                cda TEXT PRIMARY KEY,
+                ocorrencia_json TEXT,
+                ocorrencia_alterada_em REAL NOT NULL,
+                veredito TEXT,
+                veredito_em REAL
+            )
+            """
+        )
+        self._conexao.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conexao.close()
+
+    def registrar_ocorrencia(self, cda: str, ocorrencia: dict | None) -> bool:
+        """Retorna True quando a ocorrência da CDA é nova ou mudou."""
+        ocorrencia_json = json.dumps(ocorrencia, ensure_ascii=False, sort_keys=True)
+
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT ocorrencia_json FROM estado_cda WHERE cda = ?",
+                (cda,),
+            ).fetchone()
+
+            if linha is not None and linha[0] == ocorrencia_json:
+                return False
+
+            self._conexao.execute(
+                """
+                INSERT INTO estado_cda (
+                    cda, ocorrencia_json, ocorrencia_alterada_em, veredito, veredito_em
+                )
+                VALUES (?, ?, ?, NULL, NULL)
+                ON CONFLICT (cda) DO UPDATE SET
+                    ocorrencia_json = excluded.ocorrencia_json,
+                    ocorrencia_alterada_em = excluded.ocorrencia_alterada_em,
+                    veredito = NULL,
+                    veredito_em = NULL
+                """,
+                (cda, ocorrencia_json, time.time()),
+            )
+            self._conexao.commit()
+
+        logger.debug(f"Ocorrência da CDA {cda} alterada: {ocorrencia}")
+        return True
+
+    def precisa_reprocessar(self, cda: str) -> bool:
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT veredito, veredito_em FROM estado_cda WHERE cda = ?",
+                (cda,),
+            ).fetchone()
+
+        if linha is None:
+            return True
+
+        veredito, veredito_em = linha
+        if veredito is None:
+            return True
+
+        return time.time() - veredito_em >= self.veredito_ttl_segundos
+
+    def registrar_veredito(self, cda: str, veredito: str) -> None:
+        with self._lock:
+            cursor = self._conexao.execute(
+                """
+                UPDATE estado_cda SET veredito = ?, veredito_em = ?
+                WHERE cda = ?
+                """,
+                (veredito, time.time(), cda),
+            )
+            self._conexao.commit()
+
+        if cursor.rowcount == 0:
+            # Sem a linha criada por `registrar_ocorrencia`, o veredito se perde
+            # e a CDA volta ao navegador em toda execução.
+            logger.warning(
+                f"Veredito {veredito} da CDA {cda} não registrado: CDA sem ocorrência no estado."
+            )
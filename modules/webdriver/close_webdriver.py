@@ -3,6 +3,8 @@ from typing import Optional
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from modules.webdriver.webdriver_config.firefox_profile_store import release_profile
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,5 +18,13 @@ def close_webdriver(web_driver: Optional[WebDriver]) -> None:
             f"Expected driver to be an instance of selenium WebDriver, but got: {type(web_driver).__name__}"
         )
 
+    # O perfil só pode ser apagado depois que o Firefox sai e solta os arquivos.
+    profile_dir = getattr(web_driver, "_profile_dir", None) or (
+        web_driver.capabilities or {}
+    ).get("moz:profile")
+
     logger.debug(f"Closing WebDriver instance: {type(web_driver).__name__}")
-    web_driver.quit()
+    try:
+        web_driver.quit()
+    finally:
+        release_profile(profile_dir)
@@ -0,0 +1,48 @@
+import logging
+import time
+from dataclasses import dataclass, field
+
+from modules.webdriver.exception import ExceptionDeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Deadline:
+    """
+    Orçamento de tempo de um item (uma CDA, um Renavam) compartilhado por
+    todos os seus passos: cada espera usa o menor entre o seu timeout e o
+    tempo que ainda resta.
+    """
+
+    budget_seconds: float
+    started_at: float = field(default_factory=time.monotonic)
+
+    def remaining(self) -> float:
+        return max(0.0, self.started_at + self.budget_seconds - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self, etapa: str | None = None) -> None:
+        if self.expired():
+            raise ExceptionDeadlineExceeded(self.budget_seconds, etapa)
+
+    def cap(self, timeout: float, etapa: str | None = None) -> float:
+        """Timeout efetivo da próxima espera; levanta se o orçamento acabou."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise ExceptionDeadlineExceeded(self.budget_seconds, etapa)
+        if etapa:
+            logger.debug(
+                f"{etapa}: {remaining:.1f}s restantes de {self.budget_seconds:g}s"
+            )
+        return min(timeout, remaining)
+
+
+def cap_timeout(
+    timeout: int, deadline: Deadline | None, etapa: str | None = None
+) -> float:
+    if deadline is None:
+        return timeout
+    return deadline.cap(timeout, etapa)
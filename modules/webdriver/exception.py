@@ -0,0 +1,41 @@
+from selenium.common.exceptions import TimeoutException
+
+
+class ExceptionStepTimeout(TimeoutException):
+    def __init__(self, nome_do_elemento: str, xpath: str):
+        self.nome_do_elemento = nome_do_elemento
+        self.xpath = xpath
+        super().__init__(
+            f"O elemento '{nome_do_elemento}' não foi encontrado ou não ficou clicável. XPath: {xpath}"
+        )
+
+
+class ExceptionStepFailed(Exception):
+    def __init__(self, nome_do_elemento: str, detalhe: str):
+        self.nome_do_elemento = nome_do_elemento
+        super().__init__(f"ERRO DESCONHECIDO em '{nome_do_elemento}': {detalhe}")
+
+
+class ExceptionInputVerificationFailed(Exception):
+    def __init__(self, mensagem: str):
+        super().__init__(mensagem)
+
+
+class ExceptionProfileQuotaExceeded(Exception):
+    def __init__(self, required_bytes: int, quota_bytes: int):
+        self.required_bytes = required_bytes
+        self.quota_bytes = quota_bytes
+        super().__init__(
+            f"Cota de perfis do Firefox excedida: {required_bytes / 1024 / 1024:.1f} MB "
+            f"de {quota_bytes / 1024 / 1024:.1f} MB."
+        )
+
+
+class ExceptionDeadlineExceeded(Exception):
+    def __init__(self, budget_seconds: float, etapa: str | None = None):
+        self.budget_seconds = budget_seconds
+        self.etapa = etapa
+        mensagem = f"Orçamento de {budget_seconds:g}s do item esgotado"
+        if etapa:
+            mensagem += f" em '{etapa}'"
+        super().__init__(f"{mensagem}.")
@@ -0,0 +1,38 @@
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+
+def exportar_sessao_http(
+    web_driver: WebDriver, pool_maxsize: int = 4
+) -> requests.Session:
+    """
+    Cria uma `requests.Session` com os cookies e o User-Agent da sessão
+    autenticada do navegador, para consultar o portal sem passar pelo Selenium.
+    """
+    session = requests.Session()
+
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    user_agent = web_driver.execute_script("return navigator.userAgent;")
+    if user_agent:
+        session.headers["User-Agent"] = user_agent
+
+    cookies = web_driver.get_cookies()
+    for cookie in cookies:
+        session.cookies.set(
+            name=cookie["name"],
+            value=cookie["value"],
+            domain=cookie.get("domain", ""),
+            path=cookie.get("path", "/"),
+            secure=cookie.get("secure", False),
+        )
+
+    logger.debug(f"Exported {len(cookies)} cookies from the WebDriver session.")
+    return session
@@ -0,0 +1,58 @@
+import logging
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from modules.common.analisar_html import DtoTabelaHtml
+
+logger = logging.getLogger(__name__)
+
+# Só as linhas e células da própria tabela (`rows`/`cells`); tabelas aninhadas
+# entram como texto da célula externa, como em `extrair_tabela`.
+JS_EXTRACT_TABLE = """
+const table = document.getElementById(arguments[0]);
+if (!table || table.tagName !== "TABLE") return null;
+
+function cellText(cell) {
+    return (cell.innerText || cell.textContent || "").split(/\\s+/).join(" ").trim();
+}
+
+let header = null;
+const rows = [];
+for (const row of table.rows) {
+    const section = row.parentElement.tagName;
+    if (section === "TFOOT") continue;
+    const values = Array.from(row.cells, cellText);
+    if (section === "THEAD") {
+        if (header === null) header = values;
+    } else if (
+        header === null
+        && !rows.length
+        && row.cells.length
+        && Array.from(row.cells).every((cell) => cell.tagName === "TH")
+    ) {
+        // Sem <thead>, o cabeçalho fica no <tbody> implícito.
+        header = values;
+    } else {
+        rows.push(values);
+    }
+}
+return { header: header || [], rows };
+"""
+
+
+def extract_table(web_driver: WebDriver, table_id: str) -> DtoTabelaHtml | None:
+    """
+    Cabeçalho e texto de todas as células de `<table id=table_id>` em um único
+    `execute_script`, no mesmo formato de `extrair_tabela`. None se a tabela
+    não existir.
+    """
+    web_driver.switch_to.default_content()
+    result = web_driver.execute_script(JS_EXTRACT_TABLE, table_id)
+    if result is None:
+        return None
+
+    tabela = DtoTabelaHtml(cabecalho=result["header"], linhas=result["rows"])
+    logger.debug(
+        f"Table '{table_id}': {len(tabela.cabecalho)} columns, {len(tabela.linhas)} rows"
+    )
+    return tabela
@@ -0,0 +1,178 @@
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Locator:
+    name: str
+    xpath: str
+    by: str
+    value: str
+
+    @property
+    def locator(self) -> tuple[str, str]:
+        return self.by, self.value
+
+
+@dataclass
+class DtoLocatorTiming:
+    lookups: int = 0
+    lookup_seconds: float = 0.0
+    found: int = 0
+    wait_seconds: float = 0.0
+
+
+_QUOTED_OR_SPACE = re.compile(r"""'[^']*'|"[^"]*"|\s+""")
+_SPACE_AROUND_SYNTAX = re.compile(r"\s*([\[\]/=(),|])\s*")
+
+_STEP = re.compile(
+    r"""(//|/)([A-Za-z][\w.-]*|\*)(?:\[((?:[^\]'"]|'[^']*'|"[^"]*")*)\])?"""
+)
+_ATTRIBUTE_EQUALS = r"""@([A-Za-z_][\w.-]*)=(?:'([^']*)'|"([^"]*)")"""
+_PREDICATE = re.compile(rf"{_ATTRIBUTE_EQUALS}(?: and {_ATTRIBUTE_EQUALS})*")
+_ATTRIBUTE = re.compile(_ATTRIBUTE_EQUALS)
+
+
+def normalize_xpath(xpath: str) -> str:
+    # Colapsa a indentação das XPaths multilinha sem mexer em literais.
+    def collapse(match: re.Match) -> str:
+        token = match.group(0)
+        return token if token[0] in "'\"" else " "
+
+    collapsed = _QUOTED_OR_SPACE.sub(collapse, xpath).strip()
+
+    parts = re.split(r"""('[^']*'|"[^"]*")""", collapsed)
+    for index in range(0, len(parts), 2):
+        parts[index] = _SPACE_AROUND_SYNTAX.sub(r"\1", parts[index])
+    return "".join(parts)
+
+
+def _css_string(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def compile_xpath(xpath: str) -> tuple[str, str]:
+    """
+    XPaths só com passos `//tag` ou `/tag` e predicados `@attr='valor'`
+    (unidos por `and`) viram `By.CSS_SELECTOR`; as demais (texto, funções,
+    posição, eixos) continuam `By.XPATH`. A tag é mantida mesmo com `@id`
+    (`//button[@id='x']` -> `button[id="x"]`): as páginas dos portais repetem
+    ids, e só `*` vira `[id="x"]`.
+    """
+    normalized = normalize_xpath(xpath)
+    if not normalized.startswith("//"):
+        return By.XPATH, normalized
+
+    steps = []
+    position = 0
+    while position < len(normalized):
+        match = _STEP.match(normalized, position)
+        if match is None:
+            return By.XPATH, normalized
+        axis, tag, predicate = match.groups()
+        attributes = []
+        if predicate is not None:
+            if not _PREDICATE.fullmatch(predicate):
+                return By.XPATH, normalized
+            attributes = [
+                (name, single if single is not None else double)
+                for name, single, double in _ATTRIBUTE.findall(predicate)
+            ]
+        steps.append((axis, tag, attributes))
+        position = match.end()
+
+    selector = []
+    for index, (axis, tag, attributes) in enumerate(steps):
+        if index:
+            selector.append(" " if axis == "//" else " > ")
+        selector.append("" if tag == "*" and attributes else tag)
+        selector.extend(f"[{name}={_css_string(value)}]" for name, value in attributes)
+    return By.CSS_SELECTOR, "".join(selector)
+
+
+_registry: dict[str, Locator] = {}
+_timings: dict[str, DtoLocatorTiming] = {}
+_lock = threading.Lock()
+
+
+def register_locator(name: str, xpath: str) -> Locator:
+    with _lock:
+        registered = _registry.get(name)
+        normalized = normalize_xpath(xpath)
+        if registered is not None:
+            if registered.xpath != normalized:
+                raise ValueError(
+                    f"Locator {name!r} already registered with another XPath"
+                )
+            return registered
+
+        by, value = compile_xpath(normalized)
+        locator = Locator(name=name, xpath=normalized, by=by, value=value)
+        _registry[name] = locator
+        _timings[name] = DtoLocatorTiming()
+
+    if by != By.XPATH:
+        logger.debug(f"Locator {name!r}: {normalized} -> {by} {value}")
+    return locator
+
+
+def timed_condition(
+    locator: Locator, condition: Callable[[WebDriver], object]
+) -> Callable[[WebDriver], object]:
+    """Envolve a condição para contabilizar as buscas do `locator`."""
+    wait_start: float | None = None
+
+    def _timed(web_driver: WebDriver) -> object:
+        nonlocal wait_start
+        start = time.monotonic()
+        if wait_start is None:
+            wait_start = start
+        try:
+            result = condition(web_driver)
+        finally:
+            elapsed = time.monotonic() - start
+            with _lock:
+                timing = _timings[locator.name]
+                timing.lookups += 1
+                timing.lookup_seconds += elapsed
+
+        if result:
+            with _lock:
+                timing.found += 1
+                timing.wait_seconds += time.monotonic() - wait_start
+        return result
+
+    _timed.__qualname__ = getattr(condition, "__qualname__", type(condition).__name__)
+    _timed.locator = locator
+    return _timed
+
+
+def locator_timings() -> dict[str, DtoLocatorTiming]:
+    with _lock:
+        return {
+            name: DtoLocatorTiming(**vars(timing))
+            for name, timing in _timings.items()
+            if timing.lookups
+        }
+
+
+def log_locator_timings() -> None:
+    for name, timing in sorted(
+        locator_timings().items(), key=lambda item: -item[1].lookup_seconds
+    ):
+        locator = _registry[name]
+        logger.info(
+            f"Locator {name!r} ({locator.by}): {timing.lookups} lookups, "
+            f"{timing.lookup_seconds / timing.lookups * 1000:.1f} ms/lookup, "
+            f"found {timing.found}x, "
+            f"{timing.wait_seconds / timing.found if timing.found else 0:.2f} s/wait"
+        )
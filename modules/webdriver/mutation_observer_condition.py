@@ -0,0 +1,174 @@
+import logging
+import time
+from typing import Literal
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+logger = logging.getLogger(__name__)
+
+ElementState = Literal["present", "visible", "clickable"]
+
+# Reavaliação periódica dentro da página para mudanças que não geram mutação
+# no DOM (ex.: transições CSS); não custa round trip ao geckodriver.
+IN_PAGE_RECHECK_INTERVAL_MS = 250
+
+SCRIPT_TIMEOUT_MARGIN_SECONDS = 5
+
+JS_FIND_ELEMENT_FUNCTIONS = """
+function isVisible(el) {
+    if (!el.isConnected || el.getClientRects().length === 0) return false;
+    for (let node = el; node && node.nodeType === 1; node = node.parentElement) {
+        const style = window.getComputedStyle(node);
+        if (style.display === "none" || style.opacity === "0") return false;
+    }
+    return window.getComputedStyle(el).visibility !== "hidden";
+}
+
+function findElement(by, value, state) {
+    let el = null;
+    if (by === "xpath") {
+        el = document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    } else {
+        el = document.querySelector(value);
+    }
+    if (!el) return null;
+    if (state === "present") return el;
+    if (!isVisible(el)) return null;
+    if (state === "clickable" && el.disabled) return null;
+    return el;
+}
+
+function waitForElement(by, value, state, timeoutMs, recheckMs) {
+    return new Promise((resolve) => {
+        const found = findElement(by, value, state);
+        if (found) {
+            resolve(found);
+            return;
+        }
+
+        let finished = false;
+        let observer = null;
+        let timer = null;
+        let interval = null;
+
+        function finish(result) {
+            if (finished) return;
+            finished = true;
+            if (observer) observer.disconnect();
+            clearTimeout(timer);
+            clearInterval(interval);
+            resolve(result);
+        }
+
+        function check() {
+            const el = findElement(by, value, state);
+            if (el) finish(el);
+        }
+
+        observer = new MutationObserver(check);
+        observer.observe(document.documentElement || document, {
+            childList: true,
+            subtree: true,
+            attributes: true,
+        });
+        interval = setInterval(check, recheckMs);
+        timer = setTimeout(() => finish(null), timeoutMs);
+    });
+}
+"""
+
+JS_WAIT_FOR_ELEMENT = (
+    JS_FIND_ELEMENT_FUNCTIONS
+    + """
+const [by, value, state, timeoutMs, recheckMs] = arguments;
+const done = arguments[arguments.length - 1];
+waitForElement(by, value, state, timeoutMs, recheckMs).then(done);
+"""
+)
+
+
+def to_script_locator(locator: tuple[str, str]) -> tuple[str, str] | None:
+    by, value = locator
+    if by == By.XPATH:
+        return "xpath", value
+    if by == By.CSS_SELECTOR:
+        return "css", value
+    if by == By.ID:
+        return "css", f'[id="{_escape_css_string(value)}"]'
+    if by == By.NAME:
+        return "css", f'[name="{_escape_css_string(value)}"]'
+    if by == By.TAG_NAME:
+        return "css", value
+    if by == By.CLASS_NAME:
+        return "css", f".{value}"
+    return None
+
+
+def _escape_css_string(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def ensure_script_timeout(
+    web_driver: WebDriver, required_script_timeout: float
+) -> None:
+    # Só aumenta o timeout de script da sessão, uma vez por valor necessário;
+    # esperas mais curtas continuam valendo com um timeout maior.
+    if getattr(web_driver, "_script_timeout", 0) < required_script_timeout:
+        web_driver.set_script_timeout(required_script_timeout)
+        web_driver._script_timeout = required_script_timeout
+
+
+class element_located_by_mutation_observer:
+    """
+    Condição para `WebDriverWait` que espera dentro da página: um único
+    `execute_async_script` observa o DOM com MutationObserver e devolve o
+    elemento assim que ele aparece no estado pedido, em vez de um
+    `find_element` (mais checagens) a cada poll.
+    """
+
+    def __init__(
+        self,
+        locator: tuple[str, str],
+        timeout: int,
+        state: ElementState = "clickable",
+    ):
+        script_locator = to_script_locator(locator)
+        if script_locator is None:
+            raise ValueError(f"Unsupported locator strategy: {locator[0]!r}")
+
+        self.locator = locator
+        self.script_locator = script_locator
+        self.timeout = timeout
+        self.state = state
+        self._deadline: float | None = None
+
+    def __call__(self, web_driver: WebDriver) -> WebElement | bool:
+        ensure_script_timeout(web_driver, self.timeout + SCRIPT_TIMEOUT_MARGIN_SECONDS)
+
+        # WebDriverWait só chama de novo se a espera na página for interrompida;
+        # a nova espera usa apenas o tempo que resta.
+        if self._deadline is None:
+            self._deadline = time.monotonic() + self.timeout
+        remaining_ms = max(0, int((self._deadline - time.monotonic()) * 1000))
+
+        by, value = self.script_locator
+        try:
+            element = web_driver.execute_async_script(
+                JS_WAIT_FOR_ELEMENT,
+                by,
+                value,
+                self.state,
+                remaining_ms,
+                IN_PAGE_RECHECK_INTERVAL_MS,
+            )
+        except (JavascriptException, TimeoutException) as e:
+            # Ex.: navegação durante a espera descarta o documento e o script.
+            logger.debug(f"In-page wait interrupted: {e.__class__.__name__}: {e.msg}")
+            return False
+
+        return element or False
@@ -1,14 +1,22 @@
 import logging
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Optional
 
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from modules.webdriver.deadline import Deadline, cap_timeout
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,8 +74,84 @@ class AlternateCondition:
     webdriver_action: Callable[[WebElement], None] | None = None
 
 
+POLL_FREQUENCY = 0.5
+
+IGNORED_EXCEPTIONS_WHILE_POLLING = (
+    NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
+)
+
+
+def _switch_to_frames_without_waiting(
+    web_driver: WebDriver, frame_list: list[tuple[str, str]]
+) -> bool:
+    for frame_locator in frame_list:
+        if not EC.frame_to_be_available_and_switch_to_it(frame_locator)(web_driver):
+            return False
+    return True
+
+
+def _run_first_match(
+    web_driver: WebDriver,
+    condition__list: list[AlternateCondition],
+    deadline: Deadline | None,
+) -> DtoRunInWebDriverOutput:
+    start = time.monotonic()
+    deadline__list = [
+        start + cap_timeout(spec.timeout, deadline) for spec in condition__list
+    ]
+
+    while True:
+        poll_start = time.monotonic()
+        active = [
+            spec
+            for spec, spec_deadline in zip(condition__list, deadline__list)
+            if poll_start < spec_deadline
+        ]
+        if not active:
+            break
+
+        for spec in active:
+            web_driver.switch_to.default_content()
+
+            frame_list = spec.frame_to_switch
+            try:
+                if frame_list and not _switch_to_frames_without_waiting(
+                    web_driver, frame_list
+                ):
+                    continue
+                element = spec.condition(web_driver)
+            except IGNORED_EXCEPTIONS_WHILE_POLLING:
+                continue
+
+            if not element:
+                continue
+
+            if spec.exception_to_raise is not None:
+                raise spec.exception_to_raise
+
+            if spec.webdriver_action:
+                spec.webdriver_action(element)
+
+            return DtoRunInWebDriverOutput(
+                web_element=element, frame_to_switch=frame_list
+            )
+
+        remaining_until_last_deadline = max(deadline__list) - time.monotonic()
+        if remaining_until_last_deadline > 0:
+            time.sleep(min(POLL_FREQUENCY, remaining_until_last_deadline))
+
+    raise TimeoutException(
+        f"No elements found: none of the {len(condition__list)} condition__list matched."
+    )
+
+
 def run_in_webdriver(
-    web_driver: WebDriver, condition__list: list[AlternateCondition]
+    web_driver: WebDriver,
+    condition__list: list[AlternateCondition],
+    first_match: bool = False,
+    deadline: Deadline | None = None,
 ) -> DtoRunInWebDriverOutput:
     if not isinstance(condition__list, list) or not condition__list:
         raise ValueError(
@@ -98,8 +182,18 @@ def run_in_webdriver(
                     f"condition__list[{index}].frame_to_switch must be a list of (By, locator) tuples if provided"
                 )
 
+    # Polls every alternate in the same loop, each one until its own timeout,
+    # instead of waiting for each alternate's full timeout in sequence.
+    if first_match:
+        try:
+            return _run_first_match(web_driver, condition__list, deadline)
+        except TimeoutException:
+            if deadline is not None:
+                deadline.check()
+            raise
+
     for index, spec in enumerate(condition__list, start=1):
-        timeout = spec.timeout
+        timeout = cap_timeout(spec.timeout, deadline)
         web_driver.switch_to.default_content()
 
         frame_list = spec.frame_to_switch
@@ -137,6 +231,10 @@ def run_in_webdriver(
         except TimeoutException:
             continue
 
+    # Esperas encurtadas pelo orçamento não significam que o elemento não existe.
+    if deadline is not None:
+        deadline.check()
+
     raise TimeoutException(
         f"No elements found: none of the {len(condition__list)} condition__list matched."
     )
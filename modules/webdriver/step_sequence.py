@@ -0,0 +1,457 @@
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from modules.webdriver.deadline import Deadline, cap_timeout
+from modules.webdriver.exception import (
+    ExceptionDeadlineExceeded,
+    ExceptionStepFailed,
+    ExceptionStepTimeout,
+)
+from modules.webdriver.locator import Locator
+from modules.webdriver.mutation_observer_condition import (
+    IN_PAGE_RECHECK_INTERVAL_MS,
+    JS_FIND_ELEMENT_FUNCTIONS,
+    SCRIPT_TIMEOUT_MARGIN_SECONDS,
+    ensure_script_timeout,
+    to_script_locator,
+)
+from modules.webdriver.run_in_webdriver import (
+    POLL_FREQUENCY,
+    AlternateCondition,
+    run_in_webdriver,
+)
+from modules.webdriver.wait_condition import (
+    element_to_be_clickable,
+    visibility_of_element_located,
+)
+from modules.webdriver.webelement_action.click_action import click_action
+from modules.webdriver.webelement_action.input_mode import JS_INPUT_FUNCTIONS
+from modules.webdriver.webelement_action.select_option_action import (
+    select_option_action,
+)
+from modules.webdriver.webelement_action.type_action import type_action
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ClickStep:
+    locator: Locator
+    nome_do_elemento: str
+    open_in_the_same_tab: bool = False
+
+
+@dataclass
+class TypeStep:
+    locator: Locator
+    nome_do_elemento: str
+    input_value: str
+
+
+@dataclass
+class SelectOptionStep:
+    """`locator` aponta para o `<option>` a selecionar."""
+
+    locator: Locator
+    nome_do_elemento: str
+
+
+@dataclass
+class WaitForStep:
+    """
+    Espera o elemento ficar visível. Com `optional=True` a ausência não é erro;
+    se `key` for informado, o resultado guarda se o elemento apareceu.
+    """
+
+    locator: Locator
+    nome_do_elemento: str
+    key: str | None = None
+    optional: bool = False
+
+
+@dataclass
+class ExtractStep:
+    """Guarda em `key` o texto visível do elemento (ou o `attribute`)."""
+
+    locator: Locator
+    nome_do_elemento: str
+    key: str
+    attribute: str | None = None
+
+
+Step = ClickStep | TypeStep | SelectOptionStep | WaitForStep | ExtractStep
+
+
+class StepSequenceMode(Enum):
+    PER_STEP = "per_step"
+    IN_PAGE = "in_page"
+
+
+_step_sequence_mode = StepSequenceMode.PER_STEP
+
+
+def configure_step_sequence_mode(step_sequence_mode: StepSequenceMode) -> None:
+    global _step_sequence_mode
+    _step_sequence_mode = step_sequence_mode
+    logger.debug(f"Step sequence mode: {step_sequence_mode.value}")
+
+
+PROGRESS_KEY = "__step_sequence_progress__"
+
+JS_RUN_STEPS = (
+    JS_FIND_ELEMENT_FUNCTIONS
+    + JS_INPUT_FUNCTIONS
+    + """
+const [
+    steps, runId, startIndex, initialResults, timeoutMs, budgetMs, recheckMs
+] = arguments;
+const done = arguments[arguments.length - 1];
+const budgetEnd = budgetMs === null ? null : Date.now() + budgetMs;
+const PROGRESS_KEY = "__step_sequence_progress__";
+const results = Object.assign({}, initialResults);
+
+function saveProgress(completed) {
+    try {
+        window.sessionStorage.setItem(
+            PROGRESS_KEY, JSON.stringify({ runId, completed, results })
+        );
+    } catch (e) {}
+}
+
+function clearProgress() {
+    try {
+        window.sessionStorage.removeItem(PROGRESS_KEY);
+    } catch (e) {}
+}
+
+(async () => {
+    for (let index = startIndex; index < steps.length; index++) {
+        const step = steps[index];
+
+        // Com orçamento do item, a espera do passo é encurtada ao que resta;
+        // uma espera encurtada que expira não diz nada sobre o elemento.
+        let stepTimeoutMs = timeoutMs;
+        let capped = false;
+        if (budgetEnd !== null) {
+            const left = budgetEnd - Date.now();
+            if (left <= 0) {
+                done({ ok: false, index, reason: "deadline" });
+                return;
+            }
+            if (left < stepTimeoutMs) {
+                stepTimeoutMs = left;
+                capped = true;
+            }
+        }
+
+        const el = await waitForElement(
+            step.by, step.value, step.state, stepTimeoutMs, recheckMs
+        );
+
+        if (!el) {
+            if (capped) {
+                done({ ok: false, index, reason: "deadline" });
+                return;
+            }
+            if (!step.optional) {
+                done({ ok: false, index, reason: "timeout" });
+                return;
+            }
+            if (step.key) results[step.key] = false;
+            saveProgress(index);
+            continue;
+        }
+
+        try {
+            switch (step.action) {
+                case "click":
+                    if (step.removeTarget) el.removeAttribute("target");
+                    // Gravado antes do clique: se ele navegar, o script é
+                    // descartado e o Python retoma a partir do passo seguinte.
+                    saveProgress(index);
+                    el.click();
+                    break;
+                case "type":
+                    setValue(el, step.inputValue);
+                    break;
+                case "select_option":
+                    selectOption(el);
+                    break;
+                case "wait_for":
+                    if (step.key) results[step.key] = true;
+                    break;
+                case "extract":
+                    results[step.key] = step.attribute
+                        ? el.getAttribute(step.attribute)
+                        : (el.innerText || "").trim();
+                    break;
+            }
+        } catch (e) {
+            done({ ok: false, index, reason: "error", message: String(e) });
+            return;
+        }
+        saveProgress(index);
+    }
+
+    clearProgress();
+    done({ ok: true, results });
+})();
+"""
+)
+
+JS_READ_PROGRESS = f"""
+try {{
+    return JSON.parse(window.sessionStorage.getItem("{PROGRESS_KEY}"));
+}} catch (e) {{
+    return null;
+}}
+"""
+
+
+def _script_locator(step: Step) -> dict:
+    # Todo `Locator` compila para XPath, id ou CSS, que o script sabe buscar.
+    by, value = to_script_locator(step.locator.locator)
+    return {"by": by, "value": value}
+
+
+def _to_script_step(step: Step) -> dict:
+    if isinstance(step, ClickStep):
+        return {
+            "action": "click",
+            **_script_locator(step),
+            "state": "clickable",
+            "removeTarget": step.open_in_the_same_tab,
+        }
+    if isinstance(step, TypeStep):
+        return {
+            "action": "type",
+            **_script_locator(step),
+            "state": "clickable",
+            "inputValue": step.input_value,
+        }
+    if isinstance(step, SelectOptionStep):
+        return {
+            "action": "select_option",
+            **_script_locator(step),
+            "state": "clickable",
+        }
+    if isinstance(step, WaitForStep):
+        return {
+            "action": "wait_for",
+            **_script_locator(step),
+            "state": "visible",
+            "key": step.key,
+            "optional": step.optional,
+        }
+    if isinstance(step, ExtractStep):
+        return {
+            "action": "extract",
+            **_script_locator(step),
+            "state": "visible",
+            "key": step.key,
+            "attribute": step.attribute,
+        }
+    raise TypeError(f"Unsupported step: {step!r}")
+
+
+def _read_progress(web_driver: WebDriver, run_id: str) -> dict | None:
+    try:
+        progress = web_driver.execute_script(JS_READ_PROGRESS)
+    except JavascriptException:
+        return None
+    if not isinstance(progress, dict) or progress.get("runId") != run_id:
+        return None
+    return progress
+
+
+def _run_in_page(
+    web_driver: WebDriver,
+    step__list: list[Step],
+    timeout: int,
+    deadline: Deadline | None,
+) -> dict:
+    script_step__list = [_to_script_step(step) for step in step__list]
+    run_id = uuid.uuid4().hex
+    sequence_deadline = time.monotonic() + timeout * len(step__list)
+    start_index = 0
+    results = {}
+
+    web_driver.switch_to.default_content()
+    ensure_script_timeout(
+        web_driver, timeout * len(step__list) + SCRIPT_TIMEOUT_MARGIN_SECONDS
+    )
+
+    while start_index < len(step__list):
+        budget_ms = None
+        if deadline is not None:
+            # Levanta se o orçamento já acabou; a espera de cada passo é
+            # encurtada dentro da página.
+            deadline.cap(timeout, step__list[start_index].nome_do_elemento)
+            budget_ms = int(deadline.remaining() * 1000)
+
+        remaining_ms = int((sequence_deadline - time.monotonic()) * 1000)
+        if remaining_ms <= 0:
+            step = step__list[start_index]
+            raise ExceptionStepTimeout(step.nome_do_elemento, step.locator.xpath)
+
+        try:
+            outcome = web_driver.execute_async_script(
+                JS_RUN_STEPS,
+                script_step__list,
+                run_id,
+                start_index,
+                results,
+                min(timeout * 1000, remaining_ms),
+                budget_ms,
+                IN_PAGE_RECHECK_INTERVAL_MS,
+            )
+        except (JavascriptException, TimeoutException) as e:
+            # Um clique que navega descarta o documento junto com o script; o
+            # progresso fica no sessionStorage da origem e a sequência continua
+            # do passo seguinte na página nova.
+            logger.debug(f"Step sequence interrupted: {e.__class__.__name__}: {e.msg}")
+            progress = _read_progress(web_driver, run_id)
+            if progress is not None:
+                start_index = progress["completed"] + 1
+                results = progress["results"]
+            else:
+                time.sleep(POLL_FREQUENCY)
+            continue
+
+        if outcome["ok"]:
+            results = outcome["results"]
+            break
+
+        step = step__list[outcome["index"]]
+        if outcome["reason"] == "deadline":
+            raise ExceptionDeadlineExceeded(
+                deadline.budget_seconds, step.nome_do_elemento
+            )
+        if outcome["reason"] == "timeout":
+            raise ExceptionStepTimeout(step.nome_do_elemento, step.locator.xpath)
+        raise ExceptionStepFailed(step.nome_do_elemento, outcome["message"])
+
+    # Também chega aqui quando o último passo foi um clique que navegou: o
+    # progresso já registra a sequência inteira e não há o que retomar.
+    logger.info(
+        f"Ran {len(step__list)} steps in page: "
+        f"{', '.join(step.nome_do_elemento for step in step__list)}"
+    )
+    return results
+
+
+def _run_step(
+    web_driver: WebDriver,
+    step: Step,
+    timeout: int,
+    results: dict,
+    deadline: Deadline | None,
+) -> None:
+    locator = step.locator
+    condition_timeout = cap_timeout(timeout, deadline, step.nome_do_elemento)
+
+    if isinstance(step, ClickStep):
+        condition = element_to_be_clickable(locator, condition_timeout)
+        webdriver_action = partial(
+            click_action, open_in_the_same_tab=step.open_in_the_same_tab
+        )
+    elif isinstance(step, TypeStep):
+        condition = element_to_be_clickable(locator, condition_timeout)
+        webdriver_action = partial(type_action, input_value=step.input_value)
+    elif isinstance(step, SelectOptionStep):
+        condition = element_to_be_clickable(locator, condition_timeout)
+        webdriver_action = select_option_action
+    elif isinstance(step, (WaitForStep, ExtractStep)):
+        condition = visibility_of_element_located(locator, condition_timeout)
+        webdriver_action = None
+    else:
+        raise TypeError(f"Unsupported step: {step!r}")
+
+    try:
+        output = run_in_webdriver(
+            web_driver=web_driver,
+            condition__list=[
+                AlternateCondition(
+                    timeout=timeout,
+                    condition=condition,
+                    webdriver_action=webdriver_action,
+                ),
+            ],
+            deadline=deadline,
+        )
+    except TimeoutException:
+        if isinstance(step, WaitForStep) and step.optional:
+            if step.key:
+                results[step.key] = False
+            return
+        raise
+
+    if isinstance(step, WaitForStep) and step.key:
+        results[step.key] = True
+    elif isinstance(step, ExtractStep):
+        web_element = output.web_element
+        if step.attribute:
+            results[step.key] = web_element.get_attribute(step.attribute)
+        else:
+            results[step.key] = web_element.text.strip()
+
+
+def _run_per_step(
+    web_driver: WebDriver,
+    step__list: list[Step],
+    timeout: int,
+    deadline: Deadline | None,
+) -> dict:
+    results = {}
+    for step in step__list:
+        try:
+            _run_step(web_driver, step, timeout, results, deadline)
+        except ExceptionDeadlineExceeded:
+            raise
+        except TimeoutException as e:
+            raise ExceptionStepTimeout(step.nome_do_elemento, step.locator.xpath) from e
+        except Exception as e:
+            raise ExceptionStepFailed(step.nome_do_elemento, str(e)) from e
+    return results
+
+
+def run_step_sequence(
+    web_driver: WebDriver,
+    step__list: list[Step],
+    timeout: int,
+    mode: StepSequenceMode | None = None,
+    deadline: Deadline | None = None,
+) -> dict:
+    """
+    Executa os passos em ordem, cada um esperando até `timeout` segundos pelo
+    seu elemento, e devolve os valores de `ExtractStep`/`WaitForStep.key`.
+
+    Em `StepSequenceMode.IN_PAGE` a sequência inteira roda num único
+    `execute_async_script`; em `PER_STEP` cada passo é um `run_in_webdriver`.
+    Falhas levantam `ExceptionStepTimeout`/`ExceptionStepFailed` com o
+    `nome_do_elemento` do passo. Com `deadline`, nenhuma espera passa do
+    orçamento do item (`ExceptionDeadlineExceeded`).
+    """
+    if not isinstance(step__list, list) or not step__list:
+        raise ValueError("step__list must be a non-empty list of steps")
+
+    if not isinstance(timeout, int) or timeout <= 0:
+        raise ValueError("timeout must be a positive integer")
+
+    for step in step__list:
+        if isinstance(step, TypeStep) and (
+            not isinstance(step.input_value, str) or not step.input_value.strip()
+        ):
+            raise ValueError("type_action requires a non-empty string value.")
+
+    mode = mode or _step_sequence_mode
+    if mode is StepSequenceMode.IN_PAGE:
+        return _run_in_page(web_driver, step__list, timeout, deadline)
+    return _run_per_step(web_driver, step__list, timeout, deadline)
@@ -0,0 +1,74 @@
+import logging
+from collections.abc import Callable
+from enum import Enum
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+
+from modules.webdriver.locator import Locator, timed_condition
+from modules.webdriver.mutation_observer_condition import (
+    element_located_by_mutation_observer,
+    to_script_locator,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class WaitStrategy(Enum):
+    POLLING = "polling"
+    MUTATION_OBSERVER = "mutation_observer"
+
+
+_wait_strategy = WaitStrategy.POLLING
+
+
+def configure_wait_strategy(wait_strategy: WaitStrategy) -> None:
+    global _wait_strategy
+    _wait_strategy = wait_strategy
+    logger.debug(f"Wait strategy: {wait_strategy.value}")
+
+
+def _condition(
+    locator: Locator | tuple[str, str],
+    timeout: int,
+    state: str,
+    polling_condition: Callable[[tuple[str, str]], Callable[[WebDriver], WebElement]],
+) -> Callable[[WebDriver], WebElement]:
+    registered = locator if isinstance(locator, Locator) else None
+    if registered is not None:
+        locator = registered.locator
+
+    if (
+        _wait_strategy is WaitStrategy.MUTATION_OBSERVER
+        and to_script_locator(locator) is not None
+    ):
+        condition = element_located_by_mutation_observer(
+            locator=locator,
+            timeout=timeout,
+            state=state,
+        )
+    else:
+        condition = polling_condition(locator)
+
+    if registered is not None:
+        return timed_condition(registered, condition)
+    return condition
+
+
+def element_to_be_clickable(
+    locator: Locator | tuple[str, str], timeout: int
+) -> Callable[[WebDriver], WebElement]:
+    return _condition(locator, timeout, "clickable", EC.element_to_be_clickable)
+
+
+def visibility_of_element_located(
+    locator: Locator | tuple[str, str], timeout: int
+) -> Callable[[WebDriver], WebElement]:
+    return _condition(locator, timeout, "visible", EC.visibility_of_element_located)
+
+
+def presence_of_element_located(
+    locator: Locator | tuple[str, str], timeout: int
+) -> Callable[[WebDriver], WebElement]:
+    return _condition(locator, timeout, "present", EC.presence_of_element_located)
@@ -0,0 +1,285 @@
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from modules.common.helper_function__temp_browser_profile_dir__path import (
+    helper_function__temp_browser_profile_dir__path,
+)
+from modules.webdriver.exception import ExceptionProfileQuotaExceeded
+
+logger = logging.getLogger(__name__)
+
+# Prefixo próprio desta aplicação: a varredura de órfãos nunca toca em perfis
+# de outras ferramentas no mesmo diretório temporário.
+PROFILE_DIR_PREFIX = "rpa-anuencia-firefox-profile-"
+LEGACY_PROFILE_DIR_PREFIX = "firefox-profile-"
+OWNER_MARKER_FILE = ".owner.json"
+
+# Um perfil com o prefixo e ainda sem marcador pode estar sendo criado agora;
+# só vira órfão depois deste tempo sem modificação.
+UNMARKED_PROFILE_MIN_AGE_SECONDS = 3600
+
+
+@dataclass
+class DtoProfileStoreStats:
+    profiles: int = 0
+    total_bytes: int = 0
+    created: int = 0
+    released: int = 0
+    recovered: int = 0
+    recovered_bytes: int = 0
+
+
+_base_dir: str | None = None
+_quota_bytes = 0
+_profiles: dict[str, int] = {}
+_stats = DtoProfileStoreStats()
+_lock = threading.Lock()
+
+
+def configure_profile_store(base_dir: str | None = None, quota_bytes: int = 0) -> None:
+    """
+    `base_dir` recebe os perfis novos (None = diretório temporário do
+    sistema); `quota_bytes` limita o espaço dos perfis abertos por este
+    processo (0 = sem limite).
+    """
+    global _base_dir, _quota_bytes
+
+    if quota_bytes < 0:
+        raise ValueError("quota_bytes must be zero or positive")
+
+    _base_dir = base_dir or None
+    _quota_bytes = quota_bytes
+
+
+def profile_base_dir() -> str:
+    return _base_dir or tempfile.gettempdir()
+
+
+def _directory_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def _pid_alive_windows(pid: int) -> bool:
+    # No Windows, `os.kill(pid, 0)` envia CTRL_C_EVENT ao processo em vez de
+    # só verificar se ele existe.
+    import ctypes
+    from ctypes import wintypes
+
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    STILL_ACTIVE = 259
+    ERROR_ACCESS_DENIED = 5
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    kernel32.GetExitCodeProcess.argtypes = (
+        wintypes.HANDLE,
+        ctypes.POINTER(wintypes.DWORD),
+    )
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        # Sem permissão para abrir, o processo existe; qualquer outro erro
+        # (ERROR_INVALID_PARAMETER) significa PID inexistente.
+        return ctypes.get_last_error() == ERROR_ACCESS_DENIED
+    try:
+        exit_code = wintypes.DWORD()
+        if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+            return True
+        return exit_code.value == STILL_ACTIVE
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def _pid_alive(pid: int) -> bool:
+    if sys.platform == "win32":
+        return _pid_alive_windows(pid)
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _refresh_sizes() -> None:
+    # Os tamanhos mudam enquanto o Firefox roda. A varredura do disco fica fora
+    # do `_lock`, para não travar `release_profile` dos outros navegadores.
+    with _lock:
+        paths = list(_profiles)
+    sizes = {path: _directory_size(path) for path in paths}
+    with _lock:
+        for path, size in sizes.items():
+            if path in _profiles:
+                _profiles[path] = size
+
+
+def _check_quota(extra_bytes: int) -> None:
+    # Chamado com `_lock` adquirido, depois de `_refresh_sizes`.
+    used = sum(_profiles.values())
+    if used + extra_bytes > _quota_bytes:
+        raise ExceptionProfileQuotaExceeded(used + extra_bytes, _quota_bytes)
+
+
+def register_profile(profile_dir: str) -> str:
+    """
+    Passa `profile_dir` a ser gerenciado: recebe o marcador com o PID dono,
+    conta na cota e é apagado por `release_profile`.
+    """
+    profile_dir = os.path.abspath(profile_dir)
+    size = _directory_size(profile_dir)
+    if _quota_bytes:
+        _refresh_sizes()
+
+    with _lock:
+        try:
+            if _quota_bytes:
+                _check_quota(size)
+        except ExceptionProfileQuotaExceeded:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            raise
+
+        Path(profile_dir, OWNER_MARKER_FILE).write_text(
+            json.dumps({"pid": os.getpid(), "created_at": time.time()}),
+            encoding="utf-8",
+        )
+        _profiles[profile_dir] = size
+        _stats.created += 1
+
+    return profile_dir
+
+
+def new_profile_dir() -> str:
+    base_dir = profile_base_dir()
+    os.makedirs(base_dir, exist_ok=True)
+    return register_profile(
+        helper_function__temp_browser_profile_dir__path(
+            base_dir=base_dir,
+            prefix=PROFILE_DIR_PREFIX,
+        )
+    )
+
+
+def release_profile(profile_dir: str | None) -> bool:
+    """Apaga o perfil se ele foi registrado neste processo."""
+    if not profile_dir:
+        return False
+    profile_dir = os.path.abspath(profile_dir)
+
+    with _lock:
+        if profile_dir not in _profiles:
+            return False
+        del _profiles[profile_dir]
+        _stats.released += 1
+
+    shutil.rmtree(profile_dir, ignore_errors=True)
+    logger.debug(f"Firefox profile removed: {profile_dir}")
+    return True
+
+
+def _is_orphan(profile_dir: str) -> bool:
+    marker = Path(profile_dir, OWNER_MARKER_FILE)
+    try:
+        owner = json.loads(marker.read_text(encoding="utf-8"))
+        pid = int(owner["pid"])
+    except FileNotFoundError:
+        # Sem marcador, só apaga o que tem o prefixo desta aplicação.
+        if not os.path.basename(profile_dir).startswith(PROFILE_DIR_PREFIX):
+            return False
+        age = time.time() - os.path.getmtime(profile_dir)
+        return age > UNMARKED_PROFILE_MIN_AGE_SECONDS
+    except (OSError, ValueError, KeyError, TypeError):
+        # Marcador ilegível: o dono morreu enquanto escrevia.
+        return True
+
+    return pid != os.getpid() and not _pid_alive(pid)
+
+
+def recover_orphan_profiles(base_dir: str | None = None) -> int:
+    """
+    Apaga os perfis deixados em `base_dir` por execuções que não terminaram
+    (PID dono encerrado). Perfis `firefox-profile-*` de versões anteriores só
+    são apagados se tiverem o marcador desta aplicação. Devolve quantos foram
+    removidos.
+    """
+    base_dir = base_dir or profile_base_dir()
+    try:
+        entries = list(os.scandir(base_dir))
+    except FileNotFoundError:
+        return 0
+
+    removed = 0
+    removed_bytes = 0
+    for entry in entries:
+        if not entry.name.startswith(
+            (PROFILE_DIR_PREFIX, LEGACY_PROFILE_DIR_PREFIX)
+        ) or not entry.is_dir(follow_symlinks=False):
+            continue
+        with _lock:
+            if os.path.abspath(entry.path) in _profiles:
+                continue
+        try:
+            if not _is_orphan(entry.path):
+                continue
+            size = _directory_size(entry.path)
+            shutil.rmtree(entry.path)
+        except OSError as e:
+            logger.warning(f"Could not remove orphan profile {entry.path}: {e}")
+            continue
+        removed += 1
+        removed_bytes += size
+
+    with _lock:
+        _stats.recovered += removed
+        _stats.recovered_bytes += removed_bytes
+
+    if removed:
+        logger.info(
+            f"Removed {removed} orphan Firefox profile(s) from {base_dir} "
+            f"({removed_bytes / 1024 / 1024:.1f} MB)."
+        )
+    return removed
+
+
+def profile_store_stats() -> DtoProfileStoreStats:
+    _refresh_sizes()
+    with _lock:
+        return DtoProfileStoreStats(
+            profiles=len(_profiles),
+            total_bytes=sum(_profiles.values()),
+            created=_stats.created,
+            released=_stats.released,
+            recovered=_stats.recovered,
+            recovered_bytes=_stats.recovered_bytes,
+        )
+
+
+def log_profile_store_stats() -> None:
+    stats = profile_store_stats()
+    logger.info(
+        f"Firefox profiles: {stats.profiles} open "
+        f"({stats.total_bytes / 1024 / 1024:.1f} MB), "
+        f"{stats.created} created, {stats.released} removed, "
+        f"{stats.recovered} orphan(s) recovered "
+        f"({stats.recovered_bytes / 1024 / 1024:.1f} MB)"
+    )
@@ -0,0 +1,227 @@
+import configparser
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+
+from modules.common.helper_function__temp_browser_profile_dir__path import (
+    helper_function__temp_browser_profile_dir__path,
+)
+from modules.webdriver.webdriver_config.firefox_profile_store import (
+    PROFILE_DIR_PREFIX,
+    profile_base_dir,
+    register_profile,
+)
+from modules.webdriver.webdriver_config.set_default_firefox_options import (
+    DEFAULT_FIREFOX_PREFERENCES,
+    set_default_firefox_options,
+)
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_MARKER_FILE = ".template-preferences.sha256"
+
+# Arquivos de uma sessão que não podem ir para o template nem para os clones.
+SESSION_ONLY_FILES = ("lock", ".parentlock", "parent.lock")
+SESSION_ONLY_DIRS = ("sessionstore-backups", "crashes", "minidumps")
+
+_build_lock = threading.Lock()
+
+
+@functools.cache
+def firefox_build_id() -> str:
+    """
+    Versão e BuildID do Firefox que o Selenium vai usar, lidos do
+    `application.ini` ao lado do executável (ou de `firefox --version`).
+    Devolve "" quando não é possível descobrir.
+    """
+    try:
+        binary = DriverFinder(FirefoxService(), FirefoxOptions()).get_browser_path()
+    except Exception as e:
+        logger.warning(f"Could not locate the Firefox binary: {e}")
+        return ""
+
+    application_ini = Path(os.path.realpath(binary)).parent / "application.ini"
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        parser.read(application_ini, encoding="utf-8")
+        return f"{parser['App']['Version']} ({parser['App']['BuildID']})"
+    except (configparser.Error, KeyError, UnicodeDecodeError):
+        pass
+
+    try:
+        result = subprocess.run(
+            [binary, "--version"],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"Could not read the Firefox version from {binary}: {e}")
+        return ""
+
+
+def _template_digest(preferences: dict[str, bool | int | str], build_id: str) -> str:
+    # O Firefox migra o perfil ao mudar de versão; um template criado por outra
+    # versão (upgrade ou downgrade) precisa ser refeito.
+    serialized = json.dumps(
+        {"preferences": preferences, "firefox": build_id},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def write_user_js(profile_dir: str, preferences: dict[str, bool | int | str]) -> None:
+    lines = [
+        f"user_pref({json.dumps(name)}, {json.dumps(value, ensure_ascii=False)});"
+        for name, value in preferences.items()
+    ]
+    Path(profile_dir, "user.js").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _remove_session_files(profile_dir: str) -> None:
+    for name in SESSION_ONLY_FILES:
+        path = Path(profile_dir, name)
+        if path.is_symlink() or path.exists():
+            path.unlink()
+    for name in SESSION_ONLY_DIRS:
+        shutil.rmtree(Path(profile_dir, name), ignore_errors=True)
+
+
+def _template_is_current(template_dir: str, digest: str) -> bool:
+    marker = Path(template_dir, TEMPLATE_MARKER_FILE)
+    return marker.is_file() and marker.read_text(encoding="utf-8").strip() == digest
+
+
+@contextlib.contextmanager
+def _template_file_lock(template_dir: str) -> Iterator[None]:
+    # `_build_lock` só vale dentro do processo; o arquivo de lock impede que
+    # duas execuções ao mesmo tempo refaçam o mesmo template.
+    lock_path = f"{template_dir.rstrip(os.sep)}.lock"
+    os.makedirs(os.path.dirname(os.path.abspath(lock_path)), exist_ok=True)
+
+    with open(lock_path, "a+b") as lock_file:
+        if sys.platform == "win32":
+            import msvcrt
+
+            lock_file.seek(0)
+            while True:
+                try:
+                    # LK_LOCK desiste depois de ~10 s; tenta de novo até conseguir.
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def ensure_firefox_profile_template(
+    template_dir: str,
+    headless: bool,
+    preferences: dict[str, bool | int | str] = DEFAULT_FIREFOX_PREFERENCES,
+) -> str:
+    """
+    Garante em `template_dir` um perfil já inicializado pelo Firefox, com as
+    preferências gravadas no `user.js`. Só é refeito quando as preferências
+    ou a versão do Firefox mudam (hash guardado em `TEMPLATE_MARKER_FILE`).
+    """
+    digest = _template_digest(preferences, firefox_build_id())
+    if _template_is_current(template_dir, digest):
+        return template_dir
+
+    with _build_lock, _template_file_lock(template_dir):
+        # Outra thread ou execução pode ter refeito o template enquanto esperávamos.
+        if _template_is_current(template_dir, digest):
+            return template_dir
+
+        logger.info(f"Building Firefox profile template: {template_dir}")
+
+        # Monta ao lado e troca no fim, para nunca clonar um template pela metade.
+        build_dir = f"{template_dir.rstrip(os.sep)}.build-{uuid.uuid4().hex}"
+        os.makedirs(build_dir)
+        try:
+            write_user_js(build_dir, preferences)
+
+            firefox_options = set_default_firefox_options(
+                headless=headless,
+                firefox_options=FirefoxOptions(),
+                browser_profile_output_dir=build_dir,
+                preferences_in_profile=True,
+            )
+            web_driver = webdriver.Firefox(options=firefox_options)
+            try:
+                web_driver.get("about:blank")
+            finally:
+                web_driver.quit()
+
+            # O geckodriver acrescenta as preferências dele ao user.js do perfil.
+            write_user_js(build_dir, preferences)
+            _remove_session_files(build_dir)
+            Path(build_dir, TEMPLATE_MARKER_FILE).write_text(digest, encoding="utf-8")
+
+            shutil.rmtree(template_dir, ignore_errors=True)
+            os.replace(build_dir, template_dir)
+        except BaseException:
+            shutil.rmtree(build_dir, ignore_errors=True)
+            raise
+
+    return template_dir
+
+
+def clone_firefox_profile(template_dir: str, base_dir: str | None = None) -> str:
+    """
+    Cópia do template para uma sessão, em `base_dir` (ex.: um tmpfs) ou no
+    diretório do gerenciador de perfis, que passa a controlar a cópia. No
+    Linux usa `cp --reflink=auto`, que compartilha os blocos em sistemas de
+    arquivos com reflink (btrfs, xfs) e copia normalmente nos demais.
+    """
+    base_dir = base_dir or profile_base_dir()
+    os.makedirs(base_dir, exist_ok=True)
+
+    profile_dir = helper_function__temp_browser_profile_dir__path(
+        create_temp_dir=False,
+        base_dir=base_dir,
+        prefix=PROFILE_DIR_PREFIX,
+    )
+
+    if sys.platform.startswith("linux") and shutil.which("cp"):
+        subprocess.run(
+            ["cp", "-a", "--reflink=auto", template_dir, profile_dir],
+            check=True,
+            capture_output=True,
+        )
+    else:
+        shutil.copytree(template_dir, profile_dir, symlinks=True)
+
+    Path(profile_dir, TEMPLATE_MARKER_FILE).unlink(missing_ok=True)
+    logger.debug(f"Firefox profile cloned from template: {profile_dir}")
+    return register_profile(profile_dir)
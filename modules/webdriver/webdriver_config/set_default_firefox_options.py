@@ -1,16 +1,194 @@
+import json
 import logging
 import os
-import tempfile
+from collections.abc import Iterable
+from enum import Enum
+from urllib.parse import quote, urlsplit
+from urllib.request import getproxies
 
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 
+from modules.webdriver.webdriver_config.firefox_profile_store import new_profile_dir
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_FIREFOX_PREFERENCES: dict[str, bool | int | str] = {
+    "security.default_personal_cert": "Do not prompt",
+    "security.ask_for_password": 0,
+    "security.enterprise_roots.enabled": False,
+    "security.osclientcerts.autoload": False,
+    "privacy.clearOnShutdown.cookies": True,
+    "privacy.clearOnShutdown.cache": True,
+    "privacy.clearOnShutdown.offlineApps": True,
+    "privacy.clearOnShutdown.history": True,
+    "privacy.clearOnShutdown.formdata": True,
+    "privacy.clearOnShutdown.sessions": True,
+    "privacy.clearOnShutdown.siteSettings": True,
+    "privacy.sanitize.sanitizeOnShutdown": True,
+    "browser.cache.disk.enable": False,
+    "browser.cache.memory.enable": False,
+    "browser.cache.offline.enable": False,
+    "network.http.use-cache": False,
+    "app.update.enabled": False,
+    "app.update.auto": False,
+    "app.update.service.enabled": False,
+    "browser.shell.checkDefaultBrowser": False,
+    "extensions.update.enabled": False,
+    "extensions.update.autoUpdateDefault": False,
+    "extensions.blocklist.enabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "browser.tabs.warnOnClose": False,
+    "browser.tabs.warnOnCloseOtherTabs": False,
+    "app.update.staging.enabled": False,
+    "app.update.silent": False,
+    "browser.search.update": False,
+    "toolkit.telemetry.enabled": False,
+    "toolkit.telemetry.unified": False,
+    "toolkit.telemetry.server": "",
+    "toolkit.telemetry.archive.enabled": False,
+    "geo.enabled": True,
+    "permissions.default.geo": 2,
+    "geo.prompt.testing": True,
+    "geo.prompt.testing.allow": False,
+}
+
+# Sobreposições do preset PERFORMANCE. O cache em memória só vive durante a
+# sessão e o perfil é apagado ao final, então a privacidade não muda; o cache
+# em disco continua desligado. Folhas de estilo não são bloqueadas: as esperas
+# de visibilidade dependem do CSS das páginas.
+PERFORMANCE_FIREFOX_PREFERENCES: dict[str, bool | int | str] = {
+    "browser.cache.memory.enable": True,
+    "network.http.use-cache": True,
+    "permissions.default.image": 2,
+    "gfx.downloadable_fonts.enabled": False,
+    "browser.display.use_document_fonts": 0,
+    "media.autoplay.default": 5,
+    "media.preload.default": 0,
+    "media.preload.auto": 0,
+    "browser.sessionhistory.max_total_viewers": 0,
+    "browser.sessionstore.max_tabs_undo": 0,
+    "dom.ipc.processCount": 1,
+    "fission.autostart": False,
+}
+
+# Porta de descarte: o proxy recusa a conexão na hora, sem esperar timeout.
+BLOCKED_HOST_PROXY = "PROXY 127.0.0.1:9"
+
+_PAC_PROXY_TYPES = {
+    "http": "PROXY",
+    "https": "HTTPS",
+    "socks": "SOCKS",
+    "socks4": "SOCKS4",
+    "socks5": "SOCKS5",
+    "socks5h": "SOCKS5",
+}
+
+
+class FirefoxOptionsPreset(Enum):
+    DEFAULT = "default"
+    PERFORMANCE = "performance"
+
+
+# Sem `none`: com ele, `get()` volta antes de a página começar a carregar e
+# os cliques seguintes acham os elementos da página anterior.
+class PageLoadStrategy(Enum):
+    NORMAL = "normal"
+    EAGER = "eager"
+
+
+def _pac_proxy(proxy_url: str) -> str | None:
+    if "://" not in proxy_url:
+        proxy_url = f"http://{proxy_url}"
+    url = urlsplit(proxy_url)
+    proxy_type = _PAC_PROXY_TYPES.get(url.scheme.lower())
+    if proxy_type is None or not url.hostname:
+        logger.warning(
+            f"Unsupported proxy for the PAC file, ignoring: {url.scheme}://{url.hostname}"
+        )
+        return None
+    port = url.port or (
+        443 if url.scheme == "https" else 1080 if proxy_type.startswith("SOCKS") else 80
+    )
+    # Sem o DIRECT no fim, uma falha do proxy derruba toda a navegação.
+    return f"{proxy_type} {url.hostname}:{port}; DIRECT"
+
+
+def _system_proxies() -> tuple[dict[str, str], list[str]]:
+    # Mesma origem que o `requests` usa: variáveis HTTP(S)_PROXY/NO_PROXY e,
+    # no Windows e no macOS, as configurações de proxy do sistema.
+    proxies = getproxies()
+    pac_proxies = {}
+    for scheme in ("http", "https"):
+        if proxies.get(scheme):
+            pac_proxy = _pac_proxy(proxies[scheme])
+            if pac_proxy:
+                pac_proxies[scheme] = pac_proxy
+
+    bypass = []
+    for entry in proxies.get("no", "").replace(";", ",").split(","):
+        entry = entry.strip().lower()
+        host = entry if entry == "*" else entry.lstrip("*.").split(":")[0]
+        if host:
+            bypass.append(host)
+
+    return pac_proxies, bypass
+
+
+def _blocked_hosts_pac_url(blocked_hosts: list[str]) -> str:
+    # PAC em data URL: o host e seus subdomínios vão para o proxy de descarte;
+    # os demais seguem o proxy configurado no ambiente, como sem o PAC.
+    proxies, bypass = _system_proxies()
+    logger.debug(f"PAC fallback proxies: {proxies or 'DIRECT'}, bypass: {bypass}")
+
+    pac = (
+        "function FindProxyForURL(url, host) {\n"
+        f"    var blocked = {json.dumps(blocked_hosts)};\n"
+        f"    var bypass = {json.dumps(bypass)};\n"
+        f"    var proxies = {json.dumps(proxies, sort_keys=True)};\n"
+        "    host = host.toLowerCase();\n"
+        "    for (var i = 0; i < blocked.length; i++) {\n"
+        "        if (host === blocked[i] || dnsDomainIs(host, '.' + blocked[i])) {\n"
+        f"            return {json.dumps(BLOCKED_HOST_PROXY)};\n"
+        "        }\n"
+        "    }\n"
+        "    for (var j = 0; j < bypass.length; j++) {\n"
+        "        if (bypass[j] === '*' || host === bypass[j] || dnsDomainIs(host, '.' + bypass[j])) {\n"
+        "            return 'DIRECT';\n"
+        "        }\n"
+        "    }\n"
+        "    var scheme = url.substring(0, url.indexOf(':')).toLowerCase();\n"
+        "    return proxies[scheme] || 'DIRECT';\n"
+        "}\n"
+    )
+    return "data:application/x-ns-proxy-autoconfig," + quote(pac)
+
+
+def firefox_preferences(
+    preset: FirefoxOptionsPreset = FirefoxOptionsPreset.DEFAULT,
+    blocked_hosts: Iterable[str] = (),
+) -> dict[str, bool | int | str]:
+    preferences = dict(DEFAULT_FIREFOX_PREFERENCES)
+    if preset is FirefoxOptionsPreset.PERFORMANCE:
+        preferences.update(PERFORMANCE_FIREFOX_PREFERENCES)
+
+    hosts = sorted({host.strip().lower().lstrip(".") for host in blocked_hosts} - {""})
+    if hosts:
+        preferences["network.proxy.type"] = 2
+        preferences["network.proxy.autoconfig_url"] = _blocked_hosts_pac_url(hosts)
+
+    return preferences
+
 
 def set_default_firefox_options(
     headless: bool,
     firefox_options: FirefoxOptions,
     browser_profile_output_dir: str | None = None,
+    preferences_in_profile: bool = False,
+    preset: FirefoxOptionsPreset = FirefoxOptionsPreset.DEFAULT,
+    blocked_hosts: Iterable[str] = (),
+    page_load_strategy: PageLoadStrategy | None = None,
+    window_size: tuple[int, int] = (1920, 1080),
 ) -> FirefoxOptions:
     if browser_profile_output_dir is not None:
         if not os.path.isdir(browser_profile_output_dir):
@@ -19,7 +197,7 @@ def set_default_firefox_options(
             )
         profile_dir = browser_profile_output_dir
     else:
-        profile_dir = tempfile.mkdtemp(prefix="firefox-profile-")
+        profile_dir = new_profile_dir()
 
     if headless:
         firefox_options.add_argument("-headless")
@@ -27,49 +205,16 @@ def set_default_firefox_options(
     firefox_options.add_argument("-profile")
     firefox_options.add_argument(profile_dir)
 
-    firefox_options.add_argument("--width=1920")
-    firefox_options.add_argument("--height=1080")
-
-    firefox_options.set_preference("security.default_personal_cert", "Do not prompt")
-    firefox_options.set_preference("security.ask_for_password", 0)
-    firefox_options.set_preference("security.enterprise_roots.enabled", False)
-    firefox_options.set_preference("security.osclientcerts.autoload", False)
-    firefox_options.set_preference("privacy.clearOnShutdown.cookies", True)
-    firefox_options.set_preference("privacy.clearOnShutdown.cache", True)
-    firefox_options.set_preference("privacy.clearOnShutdown.offlineApps", True)
-    firefox_options.set_preference("privacy.clearOnShutdown.history", True)
-    firefox_options.set_preference("privacy.clearOnShutdown.formdata", True)
-    firefox_options.set_preference("privacy.clearOnShutdown.sessions", True)
-    firefox_options.set_preference("privacy.clearOnShutdown.siteSettings", True)
-    firefox_options.set_preference("privacy.sanitize.sanitizeOnShutdown", True)
-    firefox_options.set_preference("browser.cache.disk.enable", False)
-    firefox_options.set_preference("browser.cache.memory.enable", False)
-    firefox_options.set_preference("browser.cache.offline.enable", False)
-    firefox_options.set_preference("network.http.use-cache", False)
-
-    firefox_options.set_preference("app.update.enabled", False)
-    firefox_options.set_preference("app.update.auto", False)
-    firefox_options.set_preference("app.update.service.enabled", False)
-    firefox_options.set_preference("browser.shell.checkDefaultBrowser", False)
-    firefox_options.set_preference("extensions.update.enabled", False)
-    firefox_options.set_preference("extensions.update.autoUpdateDefault", False)
-    firefox_options.set_preference("extensions.blocklist.enabled", False)
-    firefox_options.set_preference("datareporting.healthreport.uploadEnabled", False)
-    firefox_options.set_preference("datareporting.policy.dataSubmissionEnabled", False)
-    firefox_options.set_preference("browser.tabs.warnOnClose", False)
-    firefox_options.set_preference("browser.tabs.warnOnCloseOtherTabs", False)
-
-    firefox_options.set_preference("app.update.staging.enabled", False)
-    firefox_options.set_preference("app.update.silent", False)
-    firefox_options.set_preference("browser.search.update", False)
-    firefox_options.set_preference("toolkit.telemetry.enabled", False)
-    firefox_options.set_preference("toolkit.telemetry.unified", False)
-    firefox_options.set_preference("toolkit.telemetry.server", "")
-    firefox_options.set_preference("toolkit.telemetry.archive.enabled", False)
-
-    firefox_options.set_preference("geo.enabled", True)
-    firefox_options.set_preference("permissions.default.geo", 2)
-    firefox_options.set_preference("geo.prompt.testing", True)
-    firefox_options.set_preference("geo.prompt.testing.allow", False)
+    width, height = window_size
+    firefox_options.add_argument(f"--width={width}")
+    firefox_options.add_argument(f"--height={height}")
+
+    if page_load_strategy is not None:
+        firefox_options.page_load_strategy = page_load_strategy.value
+
+    # Perfis clonados do template já trazem as preferências no user.js.
+    if not preferences_in_profile:
+        for name, value in firefox_preferences(preset, blocked_hosts).items():
+            firefox_options.set_preference(name, value)
 
     return firefox_options
@@ -10,16 +10,17 @@ logger = logging.getLogger(__name__)
 
 def click_action(web_element: WebElement, open_in_the_same_tab: bool = False) -> None:
     driver: WebDriver = web_element.parent
+    element_repr = DtoWebElementWrapperWithBetterRepr(web_element)
 
     if open_in_the_same_tab:
-        logger.info(f"webelement:\n{DtoWebElementWrapperWithBetterRepr(web_element)}")
-        logger.info(
-            f"Removing the target attribute from webelement:\n{DtoWebElementWrapperWithBetterRepr(web_element)}"
-        )
+        logger.info("webelement:\n%s", element_repr)
+        logger.info("Removing the target attribute from webelement:\n%s", element_repr)
 
         driver.execute_script("arguments[0].removeAttribute('target');", web_element)
 
-        logger.info(f"webelement:\n{DtoWebElementWrapperWithBetterRepr(web_element)}")
+        # Novo wrapper: o outerHTML em cache ainda tem o atributo target.
+        element_repr = DtoWebElementWrapperWithBetterRepr(web_element)
+        logger.info("webelement:\n%s", element_repr)
 
-    logger.info(f"Clicking:\n{DtoWebElementWrapperWithBetterRepr(web_element)}")
+    logger.info("Clicking:\n%s", element_repr)
     web_element.click()
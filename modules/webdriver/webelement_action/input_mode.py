@@ -0,0 +1,64 @@
+import logging
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+
+class InputMode(Enum):
+    KEYBOARD = "keyboard"
+    SCRIPT = "script"
+
+
+_input_mode = InputMode.KEYBOARD
+_verify_input = False
+
+
+def configure_input_mode(input_mode: InputMode, verify_input: bool = False) -> None:
+    """
+    `SCRIPT` preenche campos e seleciona opções com um único `execute_script`
+    em vez de `clear()` + `send_keys()`/clique; `verify_input` confere o valor
+    lido de volta na mesma chamada.
+    """
+    global _input_mode, _verify_input
+    _input_mode = input_mode
+    _verify_input = verify_input
+    logger.debug(f"Input mode: {input_mode.value} (verify: {verify_input})")
+
+
+def get_input_mode() -> InputMode:
+    return _input_mode
+
+
+def get_verify_input() -> bool:
+    return _verify_input
+
+
+# Usa o setter nativo de `value` para que frameworks que interceptam a
+# propriedade vejam a mudança, e dispara os eventos que os portais escutam.
+JS_INPUT_FUNCTIONS = """
+function setValue(el, value) {
+    const prototype = el instanceof HTMLTextAreaElement
+        ? HTMLTextAreaElement.prototype
+        : HTMLInputElement.prototype;
+    const setter = Object.getOwnPropertyDescriptor(prototype, "value").set;
+    el.focus();
+    setter.call(el, value);
+    el.dispatchEvent(new Event("input", { bubbles: true }));
+    el.dispatchEvent(new Event("change", { bubbles: true }));
+    return el.value;
+}
+
+function selectOption(option) {
+    const select = option.closest("select");
+    option.selected = true;
+    if (select) {
+        select.dispatchEvent(new Event("input", { bubbles: true }));
+        select.dispatchEvent(new Event("change", { bubbles: true }));
+    }
+    return option.selected;
+}
+"""
+
+JS_SET_VALUE = JS_INPUT_FUNCTIONS + "\nreturn setValue(arguments[0], arguments[1]);"
+
+JS_SELECT_OPTION = JS_INPUT_FUNCTIONS + "\nreturn selectOption(arguments[0]);"
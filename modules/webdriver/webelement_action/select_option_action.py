@@ -0,0 +1,32 @@
+import logging
+from selenium.webdriver.remote.webelement import WebElement
+from modules.common.DtoWebElementWrapperWithBetterRepr import (
+    DtoWebElementWrapperWithBetterRepr,
+)
+from modules.webdriver.exception import ExceptionInputVerificationFailed
+from modules.webdriver.webelement_action.click_action import click_action
+from modules.webdriver.webelement_action.input_mode import (
+    JS_SELECT_OPTION,
+    InputMode,
+    get_input_mode,
+    get_verify_input,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def select_option_action(web_element: WebElement) -> None:
+    """`web_element` é o `<option>` a selecionar."""
+    if get_input_mode() is not InputMode.SCRIPT:
+        click_action(web_element=web_element)
+        if get_verify_input() and not web_element.is_selected():
+            raise ExceptionInputVerificationFailed(
+                "The option was clicked but is not selected."
+            )
+        return
+
+    selected = web_element.parent.execute_script(JS_SELECT_OPTION, web_element)
+    if get_verify_input() and not selected:
+        raise ExceptionInputVerificationFailed("The option could not be selected.")
+
+    logger.info("Selected:\n%s", DtoWebElementWrapperWithBetterRepr(web_element))
@@ -3,15 +3,45 @@ from selenium.webdriver.remote.webelement import WebElement
 from modules.common.DtoWebElementWrapperWithBetterRepr import (
     DtoWebElementWrapperWithBetterRepr,
 )
+from modules.webdriver.exception import ExceptionInputVerificationFailed
+from modules.webdriver.webelement_action.input_mode import (
+    JS_SET_VALUE,
+    InputMode,
+    get_input_mode,
+    get_verify_input,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _verification_failed(
+    input_value: str, typed_value: str
+) -> ExceptionInputVerificationFailed:
+    return ExceptionInputVerificationFailed(
+        f"Field value {typed_value!r} does not match the typed value {input_value!r}."
+    )
+
+
 def type_action(web_element: WebElement, input_value: str) -> None:
     if not isinstance(input_value, str) or not input_value.strip():
         raise ValueError("type_action requires a non-empty string value.")
-    web_element.clear()
-    web_element.send_keys(input_value)
+
+    if get_input_mode() is InputMode.SCRIPT:
+        typed_value = web_element.parent.execute_script(
+            JS_SET_VALUE, web_element, input_value
+        )
+        if get_verify_input() and typed_value != input_value:
+            raise _verification_failed(input_value, typed_value)
+    else:
+        web_element.clear()
+        web_element.send_keys(input_value)
+        if get_verify_input():
+            typed_value = web_element.get_property("value")
+            if typed_value != input_value:
+                raise _verification_failed(input_value, typed_value)
+
     logger.info(
-        f"Typed '{input_value}' into:\n{DtoWebElementWrapperWithBetterRepr(web_element)}"
+        "Typed '%s' into:\n%s",
+        input_value,
+        DtoWebElementWrapperWithBetterRepr(web_element),
     )
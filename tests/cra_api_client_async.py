@@ -0,0 +1,179 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules.cra.cra_api_client_async import CraApiClientAsync  # noqa: E402
+from modules.cra.exception import (  # noqa: E402
+    ExceptionCraApiEndpointNaoEncontrado,
+    ExceptionCraApiFalhaAutenticacao,
+)
+
+# --- Servidor local que faz o papel da API do CRA ---
+# Cada título responde depois de `ATRASOS[numeroTitulo]` segundos; "401/00"
+# devolve 401 e qualquer caminho diferente de ENDPOINT devolve 404. Conexões
+# keep-alive paradas por mais de TIMEOUT_OCIOSO segundos são fechadas pelo
+# servidor, como fazem os balanceadores na frente da API real.
+ENDPOINT = "/titulo"
+TIMEOUT_OCIOSO = 0.3
+
+ATRASOS = {
+    "100/25": 0.6,
+    "200/25": 0.1,
+    "300/25": 0.3,
+}
+
+
+class ServidorCraLocal(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ManipuladorCraLocal)
+        self.conexoes_abertas = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class ManipuladorCraLocal(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = TIMEOUT_OCIOSO
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.conexoes_abertas += 1
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        numero_titulo = parse_qs(url.query).get("numeroTitulo", [""])[0]
+
+        if url.path != ENDPOINT:
+            self._responder(404, {"mensagem": "Not Found"})
+        elif numero_titulo == "401/00":
+            self._responder(401, {"mensagem": "Unauthorized"})
+        else:
+            time.sleep(ATRASOS.get(numero_titulo, 0))
+            self._responder(200, {"numeroTitulo": numero_titulo, "retornos": []})
+
+    def _responder(self, status_code: int, corpo: dict):
+        dados = json.dumps(corpo).encode("utf-8")
+        try:
+            self.send_response(status_code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(dados)))
+            self.end_headers()
+            self.wfile.write(dados)
+        except ConnectionError:
+            # O cliente cancela as consultas pendentes quando um 401 interrompe a varredura.
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+def criar_cliente(
+    servidor: ServidorCraLocal, endpoint: str = ENDPOINT
+) -> CraApiClientAsync:
+    return CraApiClientAsync(
+        base_url=servidor.base_url,
+        titulo_endpoint=endpoint,
+        username="usuario",
+        password="senha",
+        max_in_flight=10,
+        timeout=5,
+    )
+
+
+async def verificar_ordem_de_conclusao(servidor: ServidorCraLocal) -> None:
+    async with criar_cliente(servidor) as cliente:
+        cdas = [
+            consulta.cda
+            async for consulta in cliente.consultar_titulos(
+                ["100/25", "200/25", "300/25"]
+            )
+        ]
+
+    assert cdas == ["200/25", "300/25", "100/25"], cdas
+    print(f"Ordem de conclusão: {cdas}")
+
+
+async def verificar_interrupcao_401(servidor: ServidorCraLocal) -> None:
+    async with criar_cliente(servidor) as cliente:
+        try:
+            async for _ in cliente.consultar_titulos(["200/25", "401/00", "100/25"]):
+                pass
+        except ExceptionCraApiFalhaAutenticacao:
+            print("401 interrompeu a varredura.")
+            return
+
+    raise AssertionError("401 deveria interromper a varredura")
+
+
+async def verificar_interrupcao_404(servidor: ServidorCraLocal) -> None:
+    async with criar_cliente(servidor, endpoint="/inexistente") as cliente:
+        try:
+            async for _ in cliente.consultar_titulos(["200/25"]):
+                pass
+        except ExceptionCraApiEndpointNaoEncontrado:
+            print("404 interrompeu a varredura.")
+            return
+
+    raise AssertionError("404 deveria interromper a varredura")
+
+
+async def verificar_reconexao_apos_keep_alive_fechado(
+    servidor: ServidorCraLocal,
+) -> None:
+    async with criar_cliente(servidor) as cliente:
+        with servidor.lock:
+            conexoes_antes = servidor.conexoes_abertas
+
+        await cliente.consultar_titulo("200/25")
+        await cliente.consultar_titulo("200/25")
+        with servidor.lock:
+            conexoes = servidor.conexoes_abertas - conexoes_antes
+        assert conexoes == 1, f"keep-alive não reaproveitado: {conexoes} conexões"
+
+        # O servidor fecha a conexão ociosa; a próxima consulta precisa reconectar.
+        await asyncio.sleep(TIMEOUT_OCIOSO * 3)
+        response_json = await cliente.consultar_titulo("300/25")
+
+        with servidor.lock:
+            conexoes = servidor.conexoes_abertas - conexoes_antes
+
+    assert response_json["numeroTitulo"] == "300/25", response_json
+    assert conexoes == 2, f"esperadas 2 conexões, abertas {conexoes}"
+    print("Reconectou após o servidor fechar a conexão keep-alive ociosa.")
+
+
+async def executar_verificacoes(servidor: ServidorCraLocal) -> None:
+    await verificar_ordem_de_conclusao(servidor)
+    await verificar_interrupcao_401(servidor)
+    await verificar_interrupcao_404(servidor)
+    await verificar_reconexao_apos_keep_alive_fechado(servidor)
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("CLIENTE ASSÍNCRONO DA API DO CRA - SERVIDOR LOCAL")
+    print("=" * 80)
+
+    servidor = ServidorCraLocal()
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    try:
+        asyncio.run(executar_verificacoes(servidor))
+    finally:
+        servidor.shutdown()
+
+    print("\n" + "=" * 80)
+    print("SCRIPT FINALIZADO")
+    print("=" * 80)
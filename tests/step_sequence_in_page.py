@@ -0,0 +1,120 @@
+import sys
+from pathlib import Path
+
+from selenium.common.exceptions import JavascriptException
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules.webdriver.deadline import Deadline  # noqa: E402
+from modules.webdriver.locator import register_locator  # noqa: E402
+from modules.webdriver.step_sequence import (  # noqa: E402
+    ClickStep,
+    StepSequenceMode,
+    TypeStep,
+    run_step_sequence,
+)
+
+# --- Navegador falso para `StepSequenceMode.IN_PAGE` ---
+# Cada `execute_async_script` recebe o índice de onde a sequência continua. Os
+# cliques em `CLIQUES_QUE_NAVEGAM` gravam o progresso e descartam o documento,
+# como a página real faz: o script termina com `JavascriptException` e o
+# progresso fica no sessionStorage.
+locator_campo = register_locator("teste_campo", "//input[@id='campo']")
+locator_pesquisar = register_locator("teste_pesquisar", "//button[@id='pesquisar']")
+locator_menu = register_locator("teste_menu", "//a[@id='menu']")
+
+
+class _SwitchTo:
+    def default_content(self):
+        pass
+
+
+class NavegadorFalso:
+    def __init__(self, cliques_que_navegam: set[int]):
+        self.cliques_que_navegam = cliques_que_navegam
+        self.switch_to = _SwitchTo()
+        self.inicios: list[int] = []
+        self._progresso: dict | None = None
+
+    def set_script_timeout(self, timeout: float) -> None:
+        pass
+
+    def execute_async_script(self, script, passos, run_id, inicio, resultados, *args):
+        self.inicios.append(inicio)
+        for indice in range(inicio, len(passos)):
+            if (
+                passos[indice]["action"] == "click"
+                and indice in self.cliques_que_navegam
+            ):
+                self.cliques_que_navegam.discard(indice)
+                self._progresso = {
+                    "runId": run_id,
+                    "completed": indice,
+                    "results": resultados,
+                }
+                raise JavascriptException("Document was unloaded")
+        return {"ok": True, "results": resultados}
+
+    def execute_script(self, script, *args):
+        return self._progresso
+
+
+def passos_pesquisa() -> list:
+    return [
+        TypeStep(
+            locator=locator_campo,
+            nome_do_elemento="Campo",
+            input_value="090835/25",
+        ),
+        ClickStep(
+            locator=locator_pesquisar,
+            nome_do_elemento="Botão de Pesquisar",
+        ),
+    ]
+
+
+def verificar_ultimo_clique_navega(deadline: Deadline | None) -> None:
+    navegador = NavegadorFalso(cliques_que_navegam={1})
+    resultados = run_step_sequence(
+        web_driver=navegador,
+        step__list=passos_pesquisa(),
+        timeout=5,
+        mode=StepSequenceMode.IN_PAGE,
+        deadline=deadline,
+    )
+
+    assert resultados == {}, resultados
+    assert navegador.inicios == [0], navegador.inicios
+    print(f"Último clique navega (deadline={deadline is not None}): concluído.")
+
+
+def verificar_clique_do_meio_navega() -> None:
+    navegador = NavegadorFalso(cliques_que_navegam={0})
+    passos = [
+        ClickStep(locator=locator_menu, nome_do_elemento="Menu"),
+        *passos_pesquisa(),
+    ]
+    run_step_sequence(
+        web_driver=navegador,
+        step__list=passos,
+        timeout=5,
+        mode=StepSequenceMode.IN_PAGE,
+        deadline=Deadline(30),
+    )
+
+    assert navegador.inicios == [0, 1], navegador.inicios
+    print("Clique do meio navega: sequência retomada no passo seguinte.")
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("SEQUÊNCIA DE PASSOS NA PÁGINA - NAVEGADOR FALSO")
+    print("=" * 80)
+
+    verificar_ultimo_clique_navega(deadline=None)
+    verificar_ultimo_clique_navega(deadline=Deadline(30))
+    verificar_clique_do_meio_navega()
+
+    print("\n" + "=" * 80)
+    print("SCRIPT FINALIZADO")
+    print("=" * 80)